@@ -0,0 +1,75 @@
+"""Measure how long dressup.aio blocks the event loop.
+
+A ticker task records the largest gap between its wake-ups while large
+inputs are converted, for both ``convert`` called directly on the loop
+and ``aio.aconvert``. Run from the repository root:
+
+    python benchmarks/aio_latency.py --size 20MB
+"""
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+import dressup
+from dressup import aio
+from engine import parse_size, SAMPLE
+
+
+async def max_loop_lag(work: Callable[[], Awaitable[object]]) -> float:
+    """Return the longest time the loop was blocked while awaiting work.
+
+    Args:
+        work (Callable[[], Awaitable[object]]): The work to await.
+
+    Returns:
+        float: The largest gap between ticks, in seconds.
+    """
+    lag = 0.0
+    running = True
+
+    async def ticker() -> None:
+        nonlocal lag
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            lag = max(lag, now - last - 0.001)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    await work()
+    running = False
+    await task
+    return lag
+
+
+async def main(size: str, unicode_type: str) -> None:
+    """Print the worst loop lag for blocking and offloaded conversion.
+
+    Args:
+        size (str): The human readable input size.
+        unicode_type (str): The Unicode type to convert to.
+    """
+    length = parse_size(size)
+    characters = (SAMPLE * (length // len(SAMPLE) + 1))[:length]
+    await aio.warm_up([unicode_type])
+
+    async def blocking() -> str:
+        return dressup.convert(characters, unicode_type)
+
+    async def offloaded() -> str:
+        return await aio.aconvert(characters, unicode_type)
+
+    print(f"{size} input")
+    print(f"convert on the loop: {await max_loop_lag(blocking) * 1000:8.1f} ms")
+    print(f"aio.aconvert:        {await max_loop_lag(offloaded) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", default="20MB")
+    parser.add_argument("--type", dest="unicode_type", default="math_bold")
+    args = parser.parse_args()
+    asyncio.run(main(args.size, args.unicode_type))
@@ -0,0 +1,69 @@
+"""Compare convert_many with calling convert in a loop.
+
+Run from the repository root:
+
+    python benchmarks/batch.py --count 1000000 --distinct 50000
+"""
+import argparse
+import random
+import string
+import time
+from typing import List
+
+import dressup
+
+
+def make_names(count: int, distinct: int, seed: int = 0) -> List[str]:
+    """Generate short display names with repeats.
+
+    Args:
+        count (int): The number of names.
+        distinct (int): The number of distinct names.
+        seed (int): The random seed.
+
+    Returns:
+        List[str]: The names.
+    """
+    generator = random.Random(seed)  # noqa: S311
+    pool = [
+        "".join(
+            generator.choices(string.ascii_letters + " ", k=generator.randint(4, 24))
+        )
+        for _ in range(distinct)
+    ]
+    return generator.choices(pool, k=count)
+
+
+def main(count: int, distinct: int, unicode_type: str) -> None:
+    """Print the time taken by both approaches.
+
+    Args:
+        count (int): The number of names.
+        distinct (int): The number of distinct names.
+        unicode_type (str): The Unicode type to convert to.
+    """
+    names = make_names(count, distinct)
+    dressup.convert("warm up", unicode_type)
+
+    start = time.perf_counter()
+    looped = [dressup.convert(name, unicode_type) for name in names]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = dressup.convert_many(names, unicode_type)
+    batch_time = time.perf_counter() - start
+
+    assert looped == batched  # noqa: S101
+    print(f"{count} strings, {distinct} distinct")
+    print(f"convert loop:  {loop_time:.3f} s ({loop_time / count * 1e9:.0f} ns/str)")
+    print(f"convert_many:  {batch_time:.3f} s ({batch_time / count * 1e9:.0f} ns/str)")
+    print(f"speedup:       {loop_time / batch_time:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=50_000)
+    parser.add_argument("--type", dest="unicode_type", default="math bold")
+    args = parser.parse_args()
+    main(args.count, args.distinct, args.unicode_type)
@@ -0,0 +1,64 @@
+"""Compare precomputed and on-demand case fallback.
+
+For styles that only map one case, each run converts text with a
+freshly built table, so that fallbacks resolved on demand are paid for
+every time, and looks up every character in a Translator. Run from the
+repository root:
+
+    python benchmarks/case_fallback.py --size 100KB
+"""
+import argparse
+import timeit
+from typing import Dict, List
+
+from dressup import converter
+from engine import parse_size
+from suite import make_corpus
+
+
+def main(size: str, types: List[str], repeat: int) -> None:
+    """Print the time taken with both kinds of fallback.
+
+    Args:
+        size (str): The human readable input size.
+        types (List[str]): The Unicode types to convert to.
+        repeat (int): The number of timed runs.
+    """
+    variants = converter.case_variants()
+    characters = make_corpus("mixed", parse_size(size))
+    for unicode_type in types:
+        mapping = converter.registry.mapping(unicode_type)
+        case_fallbacks = converter.compile_case_fallbacks(mapping, variants)
+        folded_items: Dict[str, str] = {
+            **mapping,
+            **{chr(codepoint): value for codepoint, value in case_fallbacks.items()},
+        }
+        lazy_translator = converter.Translator(mapping)
+        folded_translator = converter.Translator(folded_items, case_folded=True)
+        timings = {
+            "cold table, on demand": lambda: characters.translate(
+                converter.CaseFallbackTable(mapping)
+            ),
+            "cold table, precomputed": lambda: characters.translate(
+                converter.CaseFallbackTable(mapping, case_fallbacks)
+            ),
+            "translator, on demand": lambda: "".join(
+                lazy_translator[character] for character in characters
+            ),
+            "translator, precomputed": lambda: "".join(
+                folded_translator[character] for character in characters
+            ),
+        }
+        print(f"{unicode_type}, {size}")
+        for name, function in timings.items():
+            best = min(timeit.repeat(function, number=1, repeat=repeat))
+            print(f"  {name:<24} {best * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", default="100KB")
+    parser.add_argument("--types", nargs="+", default=["negative_circle", "small_caps"])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.size, args.types, args.repeat)
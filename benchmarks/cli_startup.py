@@ -0,0 +1,107 @@
+"""Measure the start-up time of each command-line path.
+
+Each path is run with ``python -X importtime`` to add up the time spent
+importing modules, and timed as a whole. The script exits with a status
+code of one if a fast path imports typer or rich or takes longer than
+``--budget`` milliseconds, so that it can guard against regressions. Run
+from the repository root:
+
+    python benchmarks/cli_startup.py --repeat 10 --budget 50
+"""
+import argparse
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+FAST_PATHS = {
+    "single type": ["-t", "monospace", "Hello"],
+    "version": ["--version"],
+}
+SLOW_PATHS = {
+    "table": ["Hello"],
+    "file": ["-t", "monospace", "-i"],
+}
+
+
+def wall_time(args: List[str]) -> float:
+    """Time one run of the command-line interface.
+
+    Args:
+        args (List[str]): The command-line arguments.
+
+    Returns:
+        float: The wall time in seconds.
+    """
+    start = time.perf_counter()
+    subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "dressup", *args],
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def import_profile(args: List[str]) -> Tuple[float, List[str]]:
+    """Run the command-line interface once with import timing.
+
+    Args:
+        args (List[str]): The command-line arguments.
+
+    Returns:
+        Tuple[float, List[str]]: The time spent importing modules in
+        seconds, and the names of the imported modules.
+    """
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-m", "dressup", *args],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    import_time = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_time, _, module = line[len("import time:") :].split("|")
+        import_time += int(self_time)
+        modules.append(module.strip())
+    return import_time / 1e6, modules
+
+
+def main(repeat: int, budget: float) -> None:
+    """Print the start-up time of each path and check the fast paths.
+
+    Args:
+        repeat (int): How many times to run each path.
+        budget (float): The start-up budget of fast paths, in
+            milliseconds.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as input_file:
+        input_file.write("Hello\n")
+        input_file.flush()
+        paths: Dict[str, List[str]] = {**FAST_PATHS, **SLOW_PATHS}
+        paths["file"] = [*paths["file"], input_file.name]
+        failures = []
+        print(f"{'path':>12} {'wall ms':>9} {'import ms':>10} {'rich':>5}")
+        for name, args in paths.items():
+            elapsed = min(wall_time(args) for _ in range(repeat)) * 1000
+            profiles = [import_profile(args) for _ in range(repeat)]
+            import_time = min(profile[0] for profile in profiles) * 1000
+            modules = profiles[0][1]
+            uses_rich = "rich" in modules or "typer" in modules
+            print(f"{name:>12} {elapsed:>9.1f} {import_time:>10.1f} {uses_rich!s:>5}")
+            if name in FAST_PATHS and (uses_rich or elapsed > budget):
+                failures.append(name)
+    if failures:
+        print(f"Over budget or importing rich: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--budget", type=float, default=50)
+    args = parser.parse_args()
+    main(args.repeat, args.budget)
@@ -0,0 +1,62 @@
+"""Compare suffix rule styles with single code point styles.
+
+Each style converts the same text with warm tables, in one
+``str.translate`` pass. A Python loop appending the combining mark to
+each character is timed for reference. Run from the repository root:
+
+    python benchmarks/combining_marks.py --size 1MB
+"""
+import argparse
+import functools
+import timeit
+from typing import Callable, Dict, List
+
+from dressup import converter
+from engine import parse_size
+from suite import make_corpus
+
+
+def main(size: str, types: List[str], repeat: int) -> None:
+    """Print the time taken and throughput of each style.
+
+    Args:
+        size (str): The human readable input size.
+        types (List[str]): The Unicode types to convert to.
+        repeat (int): The number of timed runs.
+    """
+    characters = make_corpus("mixed", parse_size(size))
+
+    def strike_through_in_python() -> str:
+        """Append the strikethrough mark in a Python loop.
+
+        Returns:
+            str: The struck through characters.
+        """
+        return "".join(
+            character + "̶" if converter.takes_suffix(character) else character
+            for character in characters
+        )
+
+    functions: Dict[str, Callable[[], str]] = {
+        unicode_type: functools.partial(converter.convert, characters, unicode_type)
+        for unicode_type in types
+    }
+    functions["strikethrough, Python loop"] = strike_through_in_python
+    print(f"{'style':<28} {'ms':>8} {'Mchar/s':>8}")
+    for name, function in functions.items():
+        function()
+        best = min(timeit.repeat(function, number=1, repeat=repeat))
+        print(f"{name:<28} {best * 1000:8.2f} {len(characters) / best / 1e6:8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", default="1MB")
+    parser.add_argument(
+        "--types",
+        nargs="+",
+        default=["math_bold", "small_caps", "strikethrough", "underlined", "slashed"],
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.size, args.types, args.repeat)
@@ -0,0 +1,134 @@
+"""Measure the time taken to complete --type.
+
+Each measurement runs in a fresh process, after dressup.console is
+imported, so that the first completion includes loading the tables.
+The whole shell round trip, which also starts Python, is timed
+separately, both through typer and through the fast path in
+dressup.cli. Run from the repository root:
+
+    python benchmarks/completion.py --repeat 20
+"""
+import argparse
+import os
+import subprocess  # noqa: S404
+import sys
+import time
+from typing import List
+
+SNIPPET = """
+import time
+from unittest import mock
+
+from dressup import console, converter
+
+def show_all_completion(ctx, incomplete):
+    incomplete = converter.normalize_text(incomplete)
+    unicode_types = [
+        unicode_type
+        for unicode_type in converter.registry.names()
+        if unicode_type.startswith(incomplete)
+    ]
+    converted = converter.show_all("Dress Up!", types=unicode_types)
+    return list(zip(unicode_types, converted.values()))
+
+complete = {function}
+ctx = mock.Mock(args={args}, params={{}})
+start = time.perf_counter()
+list(complete(ctx, {prefix!r}))
+cold = time.perf_counter() - start
+start = time.perf_counter()
+list(complete(ctx, {prefix!r}))
+warm = time.perf_counter() - start
+print(cold, warm)
+"""
+
+
+def measure(function: str, prefix: str, args: List[str], repeat: int) -> List[float]:
+    """Return the fastest cold and warm completion times.
+
+    Args:
+        function (str): The completion function to call.
+        prefix (str): The incomplete --type value.
+        args (List[str]): The characters on the command line.
+        repeat (int): How many processes to run.
+
+    Returns:
+        List[float]: The fastest cold and warm times in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run(  # noqa: S603
+            [
+                sys.executable,
+                "-c",
+                SNIPPET.format(function=function, prefix=prefix, args=args),
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout
+        timings.append([float(value) for value in output.split()])
+    return [min(timing[index] for timing in timings) for index in range(2)]
+
+
+def shell_round_trip(entry_point: str, repeat: int) -> float:
+    """Return the fastest zsh completion request.
+
+    Args:
+        entry_point (str): The code that runs the command-line
+            interface, as the installed ``dressup`` script does.
+        repeat (int): How many times to complete.
+
+    Returns:
+        float: The fastest time in seconds.
+    """
+    environment = {
+        **os.environ,
+        "_DRESSUP_COMPLETE": "complete_zsh",
+        "_TYPER_COMPLETE_ARGS": "dressup -t math-b",
+    }
+    code = f"import sys; sys.argv[0] = 'dressup'; {entry_point}"
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            env=environment,
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(repeat: int) -> None:
+    """Print completion times for several prefixes.
+
+    Args:
+        repeat (int): How many processes to run per measurement.
+    """
+    print(
+        f"{'prefix':>10} {'sample':>8} {'function':>20} {'cold ms':>8} {'warm ms':>8}"
+    )
+    for prefix in ("", "math-b", "inv"):
+        for args in ([], ["Hello"]):
+            sample = "Hello" if args else "default"
+            for function in ("show_all_completion", "console.complete_type"):
+                cold, warm = measure(function, prefix, args, repeat)
+                print(
+                    f"{prefix!r:>10} {sample:>8} {function.split('.')[-1]:>20}"
+                    f" {cold * 1000:>8.2f} {warm * 1000:>8.2f}"
+                )
+    for name, entry_point in (
+        ("typer", "from dressup.console import app; app(prog_name='dressup')"),
+        ("dressup.cli", "from dressup.cli import run; run()"),
+    ):
+        elapsed = shell_round_trip(entry_point, repeat)
+        print(f"zsh round trip through {name}: {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(args.repeat)
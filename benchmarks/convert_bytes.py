@@ -0,0 +1,56 @@
+"""Compare ``convert_bytes`` with decoding, converting and encoding.
+
+Each corpus is encoded to UTF-8 once, then converted back to UTF-8
+bytes by the round trip through ``convert``, and by ``convert_bytes``.
+``convert_bytes`` still decodes the buffer, so the difference comes from
+encoding through its cached table, not from avoiding copies. Run from the
+repository root:
+
+    python benchmarks/convert_bytes.py --size 1MB
+"""
+import argparse
+import timeit
+from typing import Callable, Dict, List
+
+from dressup import converter
+from engine import parse_size
+from suite import make_corpus
+
+
+def main(size: str, types: List[str], repeat: int) -> None:
+    """Print the time taken by each way of converting bytes.
+
+    Args:
+        size (str): The human readable input size.
+        types (List[str]): The Unicode types to convert to.
+        repeat (int): The number of timed runs.
+    """
+    print(f"{'case':<32} {'round trip':>10} {'bytes':>8}")
+    for kind in ("ascii", "mixed"):
+        buffer = memoryview(make_corpus(kind, parse_size(size)).encode("utf-8"))
+        for unicode_type in types:
+            functions: Dict[str, Callable[[], object]] = {
+                "round trip": lambda: converter.convert(
+                    str(buffer, "utf-8"), unicode_type
+                ).encode("utf-8"),
+                "bytes": lambda: converter.convert_bytes(buffer, unicode_type),
+            }
+            timings = []
+            for function in functions.values():
+                function()
+                timings.append(min(timeit.repeat(function, number=1, repeat=repeat)))
+            print(
+                f"{kind + ', ' + unicode_type:<32}"
+                f" {timings[0] * 1000:10.2f} {timings[1] * 1000:8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", default="1MB")
+    parser.add_argument(
+        "--types", nargs="+", default=["math_bold", "small_caps", "strikethrough"]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.size, args.types, args.repeat)
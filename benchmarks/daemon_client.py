@@ -0,0 +1,95 @@
+"""Compare ``dressup-client`` with a running daemon against ``dressup``.
+
+A daemon is started on a temporary socket, and both entry points are
+run as fresh processes, as a shell script would run them, for a single
+conversion and for standard input. Run from the repository root:
+
+    python benchmarks/daemon_client.py --repeat 20 --size 1MB
+"""
+import argparse
+import os
+import statistics
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from engine import parse_size, SAMPLE
+
+CLIENT = [sys.executable, "-c", "from dressup.client import main; main()"]
+CLI = [sys.executable, "-m", "dressup"]
+
+
+def median_time(
+    command: List[str], stdin: bytes, environment: Dict[str, str], repeat: int
+) -> float:
+    """Time a command run as a fresh process.
+
+    Args:
+        command (List[str]): The command and its arguments.
+        stdin (bytes): The standard input of the command.
+        environment (Dict[str, str]): The environment of the command.
+        repeat (int): How many times to run the command.
+
+    Returns:
+        float: The median wall time in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(  # noqa: S603
+            command,
+            input=stdin,
+            stdout=subprocess.DEVNULL,
+            env=environment,
+            check=True,
+        )
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main(repeat: int, size: str) -> None:
+    """Start a daemon and print the time taken by both entry points.
+
+    Args:
+        repeat (int): How many times to run each command.
+        size (str): The human readable size of the standard input.
+    """
+    stdin = (SAMPLE * (parse_size(size) // len(SAMPLE) + 1)).encode()
+    cases = {
+        "single type": (["-t", "monospace", "Hello"], b""),
+        f"stdin {size}": (["-t", "monospace", "-i", "-"], stdin),
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        environment = {
+            **os.environ,
+            "PYTHONPATH": "src",
+            "DRESSUP_SOCKET": os.path.join(directory, "dressup.sock"),
+        }
+        daemon = subprocess.Popen(  # noqa: S603
+            [*CLI, "daemon"], stdout=subprocess.PIPE, env=environment
+        )
+        try:
+            assert daemon.stdout is not None  # noqa: S101
+            daemon.stdout.readline()
+            print(f"{'case':>14} {'dressup ms':>11} {'client ms':>10}")
+            for name, (args, case_stdin) in cases.items():
+                cli_time = median_time([*CLI, *args], case_stdin, environment, repeat)
+                client_time = median_time(
+                    [*CLIENT, *args], case_stdin, environment, repeat
+                )
+                print(
+                    f"{name:>14} {cli_time * 1000:>11.1f} {client_time * 1000:>10.1f}"
+                )
+        finally:
+            daemon.terminate()
+            daemon.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--size", default="1MB")
+    args = parser.parse_args()
+    main(args.repeat, args.size)
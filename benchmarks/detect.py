@@ -0,0 +1,70 @@
+"""Compare detect with trying every Unicode type's table.
+
+Run from the repository root:
+
+    python benchmarks/detect.py --count 100000
+"""
+import argparse
+import time
+from typing import Dict, List, Set
+
+import dressup
+from batch import make_names
+from dressup import converter
+
+
+def try_every_type(characters: str, produced: Dict[str, Set[str]]) -> List[str]:
+    """Detect types by checking every type's characters one by one.
+
+    Args:
+        characters (str): The characters to inspect.
+        produced (Dict[str, Set[str]]): The characters produced by each
+            Unicode type.
+
+    Returns:
+        List[str]: The Unicode types producing at least one character.
+    """
+    return [
+        unicode_type
+        for unicode_type, values in produced.items()
+        if any(character in values for character in characters)
+    ]
+
+
+def main(count: int) -> None:
+    """Print the time taken by both approaches.
+
+    Args:
+        count (int): The number of strings.
+    """
+    names = converter.registry.names()
+    strings = [
+        dressup.convert(name, names[position % len(names)])
+        for position, name in enumerate(make_names(count, count))
+    ]
+    produced = {
+        unicode_type: set(converter.registry.mapping(unicode_type).values())
+        for unicode_type in names
+    }
+    dressup.detect("warm up")
+
+    start = time.perf_counter()
+    for string in strings:
+        try_every_type(string, produced)
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dressup.detect_many(strings)
+    index_time = time.perf_counter() - start
+
+    print(f"{count} strings")
+    print(f"every type:   {scan_time:.3f} s ({scan_time / count * 1e6:.1f} us/str)")
+    print(f"detect_many:  {index_time:.3f} s ({index_time / count * 1e6:.1f} us/str)")
+    print(f"speedup:      {scan_time / index_time:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.count)
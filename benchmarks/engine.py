@@ -0,0 +1,98 @@
+"""Compare the str.translate engine with per-character conversion.
+
+Run from the repository root:
+
+    python benchmarks/engine.py --sizes 1KB 1MB 100MB
+"""
+import argparse
+import functools
+import time
+from typing import Callable, Dict, List
+
+from dressup import converter
+
+UNITS = {"KB": 1_000, "MB": 1_000_000, "GB": 1_000_000_000}
+SAMPLE = "The quick brown fox jumps over the lazy dog. 0123456789 ÀÉÎ 💦\n"
+
+
+def parse_size(size: str) -> int:
+    """Parse a human readable size such as "1MB".
+
+    Args:
+        size (str): The size to parse.
+
+    Returns:
+        int: The size in characters.
+    """
+    return int(size[:-2]) * UNITS[size[-2:].upper()]
+
+
+def per_character(characters: str, mapping: Dict[str, str]) -> str:
+    """Convert characters the way ``convert`` did before tables.
+
+    Args:
+        characters (str): The characters to convert.
+        mapping (Dict[str, str]): The characters and their converted
+            counterparts.
+
+    Returns:
+        str: The converted characters.
+    """
+    return "".join(
+        mapping.get(
+            character,
+            mapping.get(character.upper(), mapping.get(character.lower(), character)),
+        )
+        for character in characters
+    )
+
+
+def best_of(function: Callable[[], str], repeat: int) -> float:
+    """Return the fastest of several timings.
+
+    Args:
+        function (Callable[[], str]): The function to time.
+        repeat (int): How many times to run ``function``.
+
+    Returns:
+        float: The fastest run time in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(sizes: List[str], unicode_type: str, repeat: int) -> None:
+    """Print the throughput of both engines for each size.
+
+    Args:
+        sizes (List[str]): Human readable input sizes.
+        unicode_type (str): The Unicode type to convert to.
+        repeat (int): How many times to run each measurement.
+    """
+    mapping = converter.registry.get()[unicode_type]
+    table = converter.registry.tables()[unicode_type]
+    print(
+        f"{'size':>8} {'per-char ns/char':>18} {'translate ns/char':>18} {'speedup':>8}"
+    )
+    for size in sizes:
+        length = parse_size(size)
+        characters = (SAMPLE * (length // len(SAMPLE) + 1))[:length]
+        old = best_of(functools.partial(per_character, characters, mapping), repeat)
+        new = best_of(functools.partial(characters.translate, table), repeat)
+        print(
+            f"{size:>8} {old / length * 1e9:>18.2f} {new / length * 1e9:>18.2f}"
+            f" {old / new:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", nargs="+", default=["1KB", "1MB", "100MB"])
+    parser.add_argument("--type", dest="unicode_type", default="math_bold")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.sizes, args.unicode_type, args.repeat)
@@ -0,0 +1,69 @@
+"""Measure CLI file conversion throughput for several --jobs values.
+
+Run from the repository root:
+
+    python benchmarks/parallel.py --size 500MB --jobs 1 2 4 8
+"""
+import argparse
+import os
+import pathlib
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from typing import List
+
+from engine import parse_size, SAMPLE
+
+
+def main(size: str, jobs: List[int], unicode_type: str) -> None:
+    """Print the throughput of the CLI for each number of jobs.
+
+    Args:
+        size (str): The human readable input size.
+        jobs (List[int]): The values of --jobs to measure.
+        unicode_type (str): The Unicode type to convert to.
+    """
+    length = parse_size(size)
+    print(f"{os.cpu_count()} CPUs, {size} input")
+    print(f"{'jobs':>6} {'seconds':>9} {'MB/s':>9} {'scaling':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        input_path = pathlib.Path(directory) / "input.txt"
+        output_path = pathlib.Path(directory) / "output.txt"
+        with input_path.open("w", encoding="utf-8") as file:
+            for _ in range(length // len(SAMPLE)):
+                file.write(SAMPLE)
+        baseline = None
+        for job_count in jobs:
+            start = time.perf_counter()
+            subprocess.run(  # noqa: S603
+                [
+                    sys.executable,
+                    "-m",
+                    "dressup",
+                    "--type",
+                    unicode_type,
+                    "--input",
+                    str(input_path),
+                    "--output",
+                    str(output_path),
+                    "--jobs",
+                    str(job_count),
+                ],
+                check=True,
+            )
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(
+                f"{job_count:>6} {elapsed:>9.2f} {length / elapsed / 1e6:>9.1f}"
+                f" {baseline / elapsed:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", default="500MB")
+    parser.add_argument("--jobs", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--type", dest="unicode_type", default="monospace")
+    args = parser.parse_args()
+    main(args.size, args.jobs, args.unicode_type)
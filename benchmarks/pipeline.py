@@ -0,0 +1,71 @@
+"""Compare a fused pipeline with chained ``convert`` calls.
+
+Each pipeline converts the same text by calling ``convert`` once per
+Unicode type, and in one pass with a list of types, whose fused table
+is compiled once and cached. Run from the repository root:
+
+    python benchmarks/pipeline.py --size 1MB
+"""
+import argparse
+import timeit
+from typing import List
+
+from dressup import converter
+from engine import parse_size
+from suite import make_corpus
+
+PIPELINES = [
+    ["inverted", "reversed"],
+    ["small_caps", "superscript"],
+    ["rock_dots", "strikethrough", "underlined"],
+]
+
+
+def chained(characters: str, unicode_types: List[str]) -> str:
+    """Convert characters with one ``convert`` call per Unicode type.
+
+    Args:
+        characters (str): The characters to convert.
+        unicode_types (List[str]): The Unicode types, in order.
+
+    Returns:
+        str: The converted characters.
+    """
+    for unicode_type in unicode_types:
+        characters = converter.convert(characters, unicode_type)
+    return characters
+
+
+def main(size: str, repeat: int) -> None:
+    """Print the time taken by both ways of converting each pipeline.
+
+    Args:
+        size (str): The human readable input size.
+        repeat (int): The number of timed runs.
+    """
+    characters = make_corpus("mixed", parse_size(size))
+    print(f"{'pipeline':<40} {'chained ms':>11} {'fused ms':>9}")
+    for unicode_types in PIPELINES:
+        converter.convert(characters, unicode_types)
+        chained_time = min(
+            timeit.repeat(
+                lambda: chained(characters, unicode_types), number=1, repeat=repeat
+            )
+        )
+        fused_time = min(
+            timeit.repeat(
+                lambda: converter.convert(characters, unicode_types),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        name = " + ".join(unicode_types)
+        print(f"{name:<40} {chained_time * 1000:11.2f} {fused_time * 1000:9.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", default="1MB")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.size, args.repeat)
@@ -0,0 +1,80 @@
+"""Measure the result cache on a skewed workload.
+
+Messages are drawn from a pool with a Zipf-like distribution, as a chat
+bot or web service would see them, and converted with and without the
+result cache. Run from the repository root:
+
+    python benchmarks/result_cache.py --requests 100000 --pool 5000
+"""
+import argparse
+import random
+import time
+from typing import List
+
+import dressup
+from dressup import cache
+
+
+def make_workload(requests: int, pool: int, skew: float) -> List[str]:
+    """Draw messages from a pool, favouring the first ones.
+
+    Args:
+        requests (int): The number of messages to draw.
+        pool (int): The number of distinct messages.
+        skew (float): The exponent of the Zipf-like distribution.
+
+    Returns:
+        List[str]: The messages.
+    """
+    generator = random.Random(0)
+    messages = [f"message {index} for the channel" for index in range(pool)]
+    weights = [1 / (rank + 1) ** skew for rank in range(pool)]
+    return generator.choices(messages, weights, k=requests)
+
+
+def run(workload: List[str], unicode_type: str) -> float:
+    """Convert every message of a workload.
+
+    Args:
+        workload (List[str]): The messages.
+        unicode_type (str): The Unicode type to convert to.
+
+    Returns:
+        float: The time taken, in seconds.
+    """
+    start = time.perf_counter()
+    for message in workload:
+        dressup.convert(message, unicode_type)
+    return time.perf_counter() - start
+
+
+def main(requests: int, pool: int, skew: float, unicode_type: str) -> None:
+    """Print the time taken with and without the cache and its hit rate.
+
+    Args:
+        requests (int): The number of messages to convert.
+        pool (int): The number of distinct messages.
+        skew (float): The exponent of the Zipf-like distribution.
+        unicode_type (str): The Unicode type to convert to.
+    """
+    workload = make_workload(requests, pool, skew)
+    dressup.convert("warm up", unicode_type)
+    uncached = run(workload, unicode_type)
+    cache.enable()
+    cached = run(workload, unicode_type)
+    stats = cache.stats()
+    cache.disable()
+    print(f"{requests} requests over {pool} messages, skew {skew}")
+    print(f"  without cache {uncached * 1000:8.2f} ms")
+    print(f"  with cache    {cached * 1000:8.2f} ms")
+    print(f"  hit rate      {stats['hits'] / requests:8.1%}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--pool", type=int, default=5_000)
+    parser.add_argument("--skew", type=float, default=1.1)
+    parser.add_argument("--type", dest="unicode_type", default="math_bold")
+    args = parser.parse_args()
+    main(args.requests, args.pool, args.skew, args.unicode_type)
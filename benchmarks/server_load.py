@@ -0,0 +1,127 @@
+"""Load test ``dressup-serve`` on this machine.
+
+The server is started in a subprocess on a free port, and concurrent
+clients send requests over keep-alive connections. Requests per second
+and the median and 99th percentile latencies are printed. Run from the
+repository root:
+
+    python benchmarks/server_load.py --connections 32 --requests 2000
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+import time
+from typing import List, Tuple
+
+
+async def client(
+    host: str, port: int, request: bytes, requests: int, latencies: List[float]
+) -> None:
+    """Send requests one after the other over one connection.
+
+    Args:
+        host (str): The address of the server.
+        port (int): The port of the server.
+        request (bytes): The request to send.
+        requests (int): The number of requests to send.
+        latencies (List[float]): Receives the latency of every request,
+            in seconds.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    for _ in range(requests):
+        start = time.perf_counter()
+        writer.write(request)
+        head = await reader.readuntil(b"\r\n\r\n")
+        length = int(head.lower().split(b"content-length: ")[1].split(b"\r\n")[0])
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+def make_request(path: str, body: object) -> bytes:
+    """Format a POST request with a JSON body.
+
+    Args:
+        path (str): The path to request.
+        body (object): The value to send as JSON.
+
+    Returns:
+        bytes: The request.
+    """
+    encoded_body = json.dumps(body).encode()
+    head = f"POST {path} HTTP/1.1\r\nContent-Length: {len(encoded_body)}\r\n\r\n"
+    return head.encode() + encoded_body
+
+
+async def load(
+    host: str, port: int, request: bytes, connections: int, requests: int
+) -> Tuple[float, List[float]]:
+    """Run the clients concurrently.
+
+    Args:
+        host (str): The address of the server.
+        port (int): The port of the server.
+        request (bytes): The request to send.
+        connections (int): The number of concurrent connections.
+        requests (int): The number of requests per connection.
+
+    Returns:
+        Tuple[float, List[float]]: The total time taken and the sorted
+        latencies, in seconds.
+    """
+    latencies: List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(client(host, port, request, requests, latencies) for _ in range(connections))
+    )
+    return time.perf_counter() - start, sorted(latencies)
+
+
+def main(connections: int, requests: int, batch: int) -> None:
+    """Start a server, load it and print the results.
+
+    Args:
+        connections (int): The number of concurrent connections.
+        requests (int): The number of requests per connection.
+        batch (int): The number of items per ``/batch`` request, or 0 to
+            send ``/convert`` requests.
+    """
+    item = {"text": "Hello, world! 💦", "type": "math bold"}
+    if batch:
+        request = make_request("/batch", [item] * batch)
+    else:
+        request = make_request("/convert", item)
+    process = subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "dressup", "serve", "--port", "0"],
+        stdout=subprocess.PIPE,
+        text=True,
+        env={**os.environ, "PYTHONPATH": "src"},
+    )
+    try:
+        assert process.stdout is not None  # noqa: S101
+        address = process.stdout.readline().strip().rpartition("//")[2]
+        host, _, port = address.rpartition(":")
+        elapsed, latencies = asyncio.run(
+            load(host, int(port), request, connections, requests)
+        )
+    finally:
+        process.terminate()
+        process.wait()
+    total = connections * requests
+    print(f"{total} requests over {connections} connections, batch {batch}")
+    print(f"  {total / elapsed:10.0f} requests/s")
+    print(f"  {total * max(batch, 1) / elapsed:10.0f} conversions/s")
+    print(f"  p50 {latencies[len(latencies) // 2] * 1000:8.2f} ms")
+    print(f"  p99 {latencies[int(len(latencies) * 0.99)] * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=0)
+    args = parser.parse_args()
+    main(args.connections, args.requests, args.batch)
@@ -0,0 +1,79 @@
+"""Measure peak memory of streaming and whole-string conversion.
+
+Each measurement runs in a fresh interpreter so that peak RSS is not
+shared between runs. Run from the repository root:
+
+    python benchmarks/stream_memory.py --sizes 10MB 100MB 500MB
+"""
+import argparse
+import pathlib
+import subprocess  # noqa: S404
+import sys
+import tempfile
+from typing import List
+
+from engine import parse_size, SAMPLE
+
+CHILD = """
+import resource, sys
+import dressup
+
+mode, path, unicode_type = sys.argv[1:]
+with open(path, encoding="utf-8") as source, open(
+    "/dev/null", "w", encoding="utf-8"
+) as sink:
+    if mode == "stream":
+        for chunk in dressup.convert_stream(source, unicode_type):
+            sink.write(chunk)
+    else:
+        sink.write(dressup.convert(source.read(), unicode_type))
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def peak_rss(mode: str, path: pathlib.Path, unicode_type: str) -> int:
+    """Return the peak RSS of converting a file in a child interpreter.
+
+    Args:
+        mode (str): Either "stream" or "whole".
+        path (pathlib.Path): The file to convert.
+        unicode_type (str): The Unicode type to convert to.
+
+    Returns:
+        int: The peak resident set size in kilobytes.
+    """
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", CHILD, mode, str(path), unicode_type],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return int(output.stdout)
+
+
+def main(sizes: List[str], unicode_type: str) -> None:
+    """Print peak RSS for each input size.
+
+    Args:
+        sizes (List[str]): Human readable input sizes.
+        unicode_type (str): The Unicode type to convert to.
+    """
+    print(f"{'size':>8} {'stream peak MB':>16} {'whole peak MB':>16}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "input.txt"
+        for size in sizes:
+            length = parse_size(size)
+            with path.open("w", encoding="utf-8") as file:
+                for _ in range(length // len(SAMPLE)):
+                    file.write(SAMPLE)
+            stream = peak_rss("stream", path, unicode_type) / 1024
+            whole = peak_rss("whole", path, unicode_type) / 1024
+            print(f"{size:>8} {stream:>16.1f} {whole:>16.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", nargs="+", default=["10MB", "100MB", "500MB"])
+    parser.add_argument("--type", dest="unicode_type", default="math_bold")
+    args = parser.parse_args()
+    main(args.sizes, args.unicode_type)
@@ -0,0 +1,430 @@
+"""Benchmark the library, command-line interface and table builders.
+
+Every case is run repeatedly to report its p50 and p99 latency and its
+throughput, then once more under tracemalloc to report its peak memory.
+Command-line cases run in a child process, so their memory is not
+traced. Results can be saved as a JSON baseline and compared against
+one. A case is flagged as a regression when its p50 latency or peak
+memory grows by more than ``--threshold``. Run from the repository root:
+
+    python benchmarks/suite.py --baseline benchmarks/baseline.json
+    python benchmarks/suite.py --save benchmarks/baseline.json
+"""
+import argparse
+import functools
+import importlib.util
+import json
+import math
+import os
+import pathlib
+import platform
+import random
+import statistics
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+import dressup
+from dressup import build
+from engine import parse_size
+
+ROOT = pathlib.Path(__file__).parent.parent
+CORPORA = {
+    "ascii": "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    ".,;:!?'\"()-     \n",
+    "mixed": "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    "     \nàéîõüçñßÀÉ💦🎉ⓐⓑ𝐀𝐁",
+    "non_latin": "Русский текст Ελληνικά 中文字符 日本語のテキスト 한국어 العربية\n",
+}
+# Variant name: (strict_case, reverse).
+VARIANTS = {
+    "default": (False, False),
+    "strict_case": (True, False),
+    "reverse": (False, True),
+}
+CLI_ENTRY_POINT = (
+    "import sys; sys.argv[0] = 'dressup'; from dressup.cli import run; run()"
+)
+MIN_SAMPLES = 5
+
+
+class Case(NamedTuple):
+    """A benchmarked operation.
+
+    Attributes:
+        name (str): The name of the case.
+        function (Callable[[], object]): The operation.
+        size (Optional[int]): The number of characters processed, if
+            throughput applies.
+        traced (bool): Whether the operation runs in this process, so
+            that its memory can be traced.
+    """
+
+    name: str
+    function: Callable[[], object]
+    size: Optional[int]
+    traced: bool
+
+
+@functools.lru_cache(maxsize=None)
+def make_corpus(kind: str, length: int, seed: int = 0) -> str:
+    """Generate reproducible text from one of the corpora.
+
+    Args:
+        kind (str): The name of the corpus.
+        length (int): The number of characters.
+        seed (int): The random seed.
+
+    Returns:
+        str: The text.
+    """
+    generator = random.Random(seed)  # noqa: S311
+    return "".join(generator.choices(CORPORA[kind], k=length))
+
+
+def run_cli(args: List[str], environment: Dict[str, str]) -> None:
+    """Run the command-line interface as the installed script does.
+
+    Args:
+        args (List[str]): The command-line arguments.
+        environment (Dict[str, str]): Extra environment variables.
+    """
+    subprocess.run(  # noqa: S603
+        [sys.executable, "-c", CLI_ENTRY_POINT, *args],
+        env={**os.environ, **environment},
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    pass
+
+
+def write_translator_input(path: pathlib.Path, styles: int = 25) -> None:
+    """Write a synthetic input file for translator.py.
+
+    Args:
+        path (pathlib.Path): The file to write.
+        styles (int): The number of styles in the file.
+    """
+    base_characters = "".join(chr(codepoint) for codepoint in range(33, 127))
+    lines = [base_characters]
+    for style in range(styles):
+        offset = 0x1D400 + style * len(base_characters)
+        converted_characters = "".join(
+            chr(offset + index) if index % 3 else character
+            for index, character in enumerate(base_characters)
+        )
+        lines.append(f"style_{style} {converted_characters}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    pass
+
+
+def library_cases(sizes: List[str]) -> List[Case]:
+    """Create the convert and show_all cases.
+
+    Args:
+        sizes (List[str]): The human readable input sizes of convert.
+            show_all runs on the sizes up to 100KB.
+
+    Returns:
+        List[Case]: The cases.
+    """
+    cases = []
+    for kind in CORPORA:
+        for variant, (strict_case, reverse) in VARIANTS.items():
+            for size in sizes:
+                length = parse_size(size)
+                characters = make_corpus(kind, length)
+                cases.append(
+                    Case(
+                        f"convert {kind} {size} {variant}",
+                        functools.partial(
+                            dressup.convert,
+                            characters,
+                            "math bold",
+                            strict_case=strict_case,
+                            reverse=reverse,
+                        ),
+                        length,
+                        True,
+                    )
+                )
+                if length > parse_size("100KB"):
+                    continue
+                cases.append(
+                    Case(
+                        f"show_all {kind} {size} {variant}",
+                        functools.partial(
+                            dressup.show_all,
+                            characters,
+                            strict_case=strict_case,
+                            reverse=reverse,
+                        ),
+                        length,
+                        True,
+                    )
+                )
+    return cases
+
+
+def cli_cases() -> List[Case]:
+    """Create the command-line start-up and completion cases.
+
+    Returns:
+        List[Case]: The cases.
+    """
+    completion = {
+        "_DRESSUP_COMPLETE": "complete_zsh",
+        "_TYPER_COMPLETE_ARGS": "dressup -t math-b",
+    }
+    return [
+        Case(
+            "cli single type",
+            functools.partial(run_cli, ["-t", "monospace", "Hello"], {}),
+            None,
+            False,
+        ),
+        Case("cli version", functools.partial(run_cli, ["--version"], {}), None, False),
+        Case("cli table", functools.partial(run_cli, ["Hello"], {}), None, False),
+        Case("cli completion", functools.partial(run_cli, [], completion), None, False),
+    ]
+
+
+def builder_cases(directory: pathlib.Path) -> List[Case]:
+    """Create the translator.py and dressup.build cases.
+
+    Args:
+        directory (pathlib.Path): A directory for the generated files.
+
+    Returns:
+        List[Case]: The cases.
+    """
+    spec = importlib.util.spec_from_file_location("translator", ROOT / "translator.py")
+    translator = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+    spec.loader.exec_module(translator)  # type: ignore[union-attr]
+    input_path = directory / "translator.txt"
+    write_translator_input(input_path)
+
+    def build_translator() -> None:
+        mappings = translator.read_file(input_path)  # type: ignore[attr-defined]
+        translator.write_config(  # type: ignore[attr-defined]
+            mappings, directory / "translator.toml"
+        )
+
+    return [
+        Case("build translator.py", build_translator, None, True),
+        Case(
+            "build tables",
+            functools.partial(
+                build.build,
+                build.TOML_PATH,
+                directory / "translator_tables.py",
+                force=True,
+            ),
+            None,
+            True,
+        ),
+        Case(
+            "rebuild unchanged tables",
+            functools.partial(
+                build.build, build.TOML_PATH, directory / "translator_tables.py"
+            ),
+            None,
+            True,
+        ),
+    ]
+
+
+def percentile(timings: List[float], fraction: float) -> float:
+    """Return a nearest-rank percentile of sorted timings.
+
+    Args:
+        timings (List[float]): The sorted timings.
+        fraction (float): The percentile, from 0 to 1.
+
+    Returns:
+        float: The timing at the percentile.
+    """
+    rank = max(math.ceil(fraction * len(timings)), 1)
+    return timings[rank - 1]
+
+
+def measure(case: Case, repeat: int, budget: float) -> Dict[str, Optional[float]]:
+    """Time a case and measure its peak memory.
+
+    Args:
+        case (Case): The case to measure.
+        repeat (int): The maximum number of timed runs.
+        budget (float): The time after which no more runs are started,
+            once ``MIN_SAMPLES`` runs are done, in seconds.
+
+    Returns:
+        Dict[str, Optional[float]]: The p50 and p99 latency in
+        milliseconds, the throughput in millions of characters per
+        second, and the peak traced memory in KiB.
+    """
+    case.function()
+    timings: List[float] = []
+    deadline = time.perf_counter() + budget
+    while len(timings) < repeat and (
+        len(timings) < MIN_SAMPLES or time.perf_counter() < deadline
+    ):
+        start = time.perf_counter()
+        case.function()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    p50 = statistics.median(timings)
+    peak_kib = None
+    if case.traced:
+        tracemalloc.start()
+        case.function()
+        peak_kib = tracemalloc.get_traced_memory()[1] / 1024
+        tracemalloc.stop()
+    return {
+        "p50_ms": p50 * 1000,
+        "p99_ms": percentile(timings, 0.99) * 1000,
+        "throughput_mchars_s": case.size / p50 / 1e6 if case.size else None,
+        "peak_kib": peak_kib,
+    }
+
+
+def change(value: Optional[float], baseline_value: Optional[float]) -> Optional[float]:
+    """Return the relative change of a metric.
+
+    Args:
+        value (Optional[float]): The measured value.
+        baseline_value (Optional[float]): The baseline value.
+
+    Returns:
+        Optional[float]: The change as a fraction of the baseline, or
+        None if either value is missing.
+    """
+    if value is None or not baseline_value:
+        return None
+    return value / baseline_value - 1
+
+
+def report(
+    results: Dict[str, Dict[str, Optional[float]]],
+    baseline: Dict[str, Dict[str, Optional[float]]],
+    threshold: float,
+) -> List[str]:
+    """Print the results next to the baseline.
+
+    Args:
+        results (Dict[str, Dict[str, Optional[float]]]): The measured
+            metrics of each case.
+        baseline (Dict[str, Dict[str, Optional[float]]]): The baseline
+            metrics of each case. May be empty.
+        threshold (float): The relative growth of p50 latency or peak
+            memory reported as a regression.
+
+    Returns:
+        List[str]: The names of the regressed cases.
+    """
+
+    def cell(value: Optional[float], relative_change: Optional[float]) -> str:
+        text = "-" if value is None else f"{value:.2f}"
+        if relative_change is not None:
+            text += f" ({relative_change:+.0%})"
+        return text
+
+    regressions = []
+    print(
+        f"{'case':<36} {'p50 ms':>18} {'p99 ms':>18} {'Mchar/s':>18}"
+        f" {'peak KiB':>18}"
+    )
+    for name, metrics in results.items():
+        baseline_metrics = baseline.get(name, {})
+        changes = {
+            metric: change(value, baseline_metrics.get(metric))
+            for metric, value in metrics.items()
+        }
+        regressed = any(
+            (changes[metric] or 0) > threshold for metric in ("p50_ms", "peak_kib")
+        )
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:<36}"
+            + "".join(
+                f" {cell(value, changes[metric]):>18}"
+                for metric, value in metrics.items()
+            )
+            + ("  REGRESSION" if regressed else "")
+        )
+    return regressions
+
+
+def main(
+    sizes: List[str],
+    repeat: int,
+    budget: float,
+    baseline_path: Optional[str],
+    save_path: Optional[str],
+    threshold: float,
+    selection: Optional[str],
+) -> None:
+    """Run the suite, compare it with a baseline and save the results.
+
+    Args:
+        sizes (List[str]): The human readable input sizes.
+        repeat (int): The maximum number of timed runs per case.
+        budget (float): The time budget per case, in seconds.
+        baseline_path (Optional[str]): The baseline to compare with.
+        save_path (Optional[str]): Where to save the results.
+        threshold (float): The relative growth reported as a regression.
+        selection (Optional[str]): Only run cases whose name contains
+            this text.
+    """
+    baseline = {}
+    if baseline_path is not None:
+        baseline = json.loads(pathlib.Path(baseline_path).read_text())["results"]
+    with tempfile.TemporaryDirectory() as directory:
+        cases = [
+            *library_cases(sizes),
+            *cli_cases(),
+            *builder_cases(pathlib.Path(directory)),
+        ]
+        results = {
+            case.name: measure(case, repeat, budget)
+            for case in cases
+            if selection is None or selection in case.name
+        }
+    regressions = report(results, baseline, threshold)
+    if save_path is not None:
+        document = {
+            "machine": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+            },
+            "results": results,
+        }
+        pathlib.Path(save_path).write_text(json.dumps(document, indent=2) + "\n")
+    if regressions:
+        print(f"{len(regressions)} regressions over {threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", nargs="+", default=["1KB", "100KB", "1MB"])
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.add_argument("--budget", type=float, default=0.5)
+    parser.add_argument("--baseline")
+    parser.add_argument("--save")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--select")
+    args = parser.parse_args()
+    main(
+        args.sizes,
+        args.repeat,
+        args.budget,
+        args.baseline,
+        args.save,
+        args.threshold,
+        args.select,
+    )
@@ -0,0 +1,88 @@
+"""Compare dictionary and array-backed strict case translation tables.
+
+Both layouts are compiled for every Unicode type without a suffix rule,
+since those use a ``SuffixTable`` whatever the layout. Their memory is
+measured with tracemalloc on a second build, and each corpus is
+translated with both. Run from the repository root:
+
+    python benchmarks/table_layout.py --size 1MB
+"""
+import argparse
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from dressup import converter
+from engine import parse_size
+from suite import CORPORA, make_corpus
+
+
+def compile_all(
+    compile_function: Callable[[Dict[str, str]], converter.TranslationTable]
+) -> Tuple[List[converter.TranslationTable], int]:
+    """Compile a table for every Unicode type and measure their memory.
+
+    Args:
+        compile_function (Callable[[Dict[str, str]], converter.TranslationTable]):
+            Compiles one mapping.
+
+    Returns:
+        Tuple[List[converter.TranslationTable], int]: The tables and the
+        bytes allocated to build them.
+    """
+    mappings = [
+        converter.registry.mapping(unicode_type)
+        for unicode_type in converter.registry.names()
+        if converter.SUFFIX_KEY not in converter.registry.mapping(unicode_type)
+    ]
+    # Build once untraced, so that one-off growth of the interned string
+    # table is not counted against the arrays.
+    [compile_function(mapping) for mapping in mappings]
+    tracemalloc.start()
+    tables = [compile_function(mapping) for mapping in mappings]
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return tables, allocated
+
+
+def main(size: str, repeat: int) -> None:
+    """Print the memory and speed of both layouts.
+
+    Args:
+        size (str): The human readable input size.
+        repeat (int): The number of timed runs.
+    """
+    dict_tables, dict_bytes = compile_all(converter.compile_table)
+    array_tables, array_bytes = compile_all(converter.compile_array_table)
+    print(f"{len(dict_tables)} tables")
+    print(f"dict:  {dict_bytes / 1024:8.1f} KiB allocated")
+    print(f"array: {array_bytes / 1024:8.1f} KiB allocated")
+    print(
+        f"sizeof of all tables: dict {sum(map(sys.getsizeof, dict_tables))} B,"
+        f" array {sum(map(sys.getsizeof, array_tables))} B"
+    )
+    length = parse_size(size)
+    for kind in CORPORA:
+        characters = make_corpus(kind, length)
+        timings = {}
+        for layout, tables in (("dict", dict_tables), ("array", array_tables)):
+            timings[layout] = min(
+                timeit.repeat(
+                    lambda: [characters.translate(table) for table in tables],
+                    number=1,
+                    repeat=repeat,
+                )
+            ) / len(tables)
+        print(
+            f"{kind:<10} {size}: dict {timings['dict'] * 1000:7.2f} ms,"
+            f" array {timings['array'] * 1000:7.2f} ms per table"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", default="1MB")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.size, args.repeat)
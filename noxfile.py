@@ -11,7 +11,7 @@ from nox.sessions import Session
 package = "dressup"
 python_versions = ["3.8", "3.9", "3.10"]
 nox.options.sessions = "lint", "safety", "mypy", "pytype", "tests", "xdoctest"
-locations = "src", "tests", "noxfile.py", "docs/conf.py", "translator.py"
+locations = "src", "tests", "benchmarks", "noxfile.py", "docs/conf.py", "translator.py"
 
 
 class Poetry:
@@ -187,6 +187,14 @@ def xdoctest(session: Session) -> None:
     session.run("python", "-m", "xdoctest", package, *args)
 
 
+@nox.session(python=python_versions[-1])
+def benchmarks(session: Session) -> None:
+    """Run the benchmark suite and compare it with the saved baseline."""
+    args = session.posargs or ["--baseline", "benchmarks/baseline.json"]
+    install_package(session)
+    session.run("python", "benchmarks/suite.py", *args)
+
+
 @nox.session(python=python_versions[-1])
 def coverage(session: Session) -> None:
     """Upload coverage data."""
@@ -1,15 +1,115 @@
-"""Dress up."""
-from .converter import convert, show_all
+"""Dress up.
 
-try:
-    from importlib.metadata import version, PackageNotFoundError  # type: ignore
-except ImportError:  # pragma: no cover
-    from importlib_metadata import version, PackageNotFoundError  # type: ignore
+Submodules are imported the first time one of their functions is
+accessed, so that importing the package, as the command-line interface
+does, stays fast.
+"""
+import importlib
+import os
+import sys
+from typing import List, TYPE_CHECKING
 
+if TYPE_CHECKING:  # pragma: no cover
+    from .converter import (
+        convert,
+        convert_bytes,
+        convert_many,
+        pipeline,
+        show_all,
+        show_all_many,
+        undress,
+    )
+    from .detection import detect, detect_many
+    from .streaming import convert_stream, show_all_stream
 
-try:
-    __version__ = version(__name__)
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "unknown"
+    __version__: str
 
-__all__ = ["convert", "show_all"]
+_exports = {
+    "convert": "converter",
+    "convert_bytes": "converter",
+    "convert_many": "converter",
+    "convert_stream": "streaming",
+    "detect": "detection",
+    "detect_many": "detection",
+    "pipeline": "converter",
+    "show_all": "converter",
+    "show_all_many": "converter",
+    "show_all_stream": "streaming",
+    "undress": "converter",
+}
+
+__all__ = [
+    "convert",
+    "convert_bytes",
+    "convert_many",
+    "convert_stream",
+    "detect",
+    "detect_many",
+    "pipeline",
+    "show_all",
+    "show_all_many",
+    "show_all_stream",
+    "undress",
+]
+
+
+def _read_version() -> str:
+    """Read the installed package version.
+
+    The ``.dist-info`` directory of the package is looked for on
+    ``sys.path`` first, because importing ``importlib.metadata`` takes
+    longer than the rest of ``dressup --version``.
+
+    Returns:
+        str: The version, or "unknown" if the package is not installed.
+    """
+    prefix = f"{__name__}-"
+    for directory in sys.path:
+        try:
+            names = os.listdir(directory or ".")
+        except OSError:
+            continue
+        for name in names:
+            if name.startswith(prefix) and name.endswith(".dist-info"):
+                return name[len(prefix) : -len(".dist-info")]
+    try:
+        from importlib.metadata import version, PackageNotFoundError  # type: ignore
+    except ImportError:  # pragma: no cover
+        from importlib_metadata import version, PackageNotFoundError  # type: ignore
+
+    try:
+        return str(version(__name__))
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def __getattr__(name: str) -> object:
+    """Import a public function, or the version, on first access.
+
+    Args:
+        name (str): The name of the attribute.
+
+    Returns:
+        object: The function, or the version string.
+
+    Raises:
+        AttributeError: If the package has no attribute ``name``.
+    """
+    if name == "__version__":
+        value: object = _read_version()
+    elif name in _exports:
+        module = importlib.import_module(f".{_exports[name]}", __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List the attributes of the package, including lazy ones.
+
+    Returns:
+        List[str]: The attribute names.
+    """
+    return sorted({*globals(), *__all__, "__version__"})
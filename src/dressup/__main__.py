@@ -1,5 +1,5 @@
 """Main module."""
-from . import console
+from .cli import run
 
 
-console.app()
+run()
@@ -0,0 +1,335 @@
+"""Convert Unicode characters without blocking an asyncio event loop.
+
+Translation tables that are not loaded yet are loaded on an executor,
+and inputs longer than ``OFFLOAD_THRESHOLD`` characters are converted on
+an executor in slices of ``SLICE_SIZE`` characters, so that no call
+holds the event loop for longer than it takes to convert one slice.
+"""
+import asyncio
+from concurrent.futures import Executor
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from . import converter
+
+OFFLOAD_THRESHOLD = 64 * 1024
+SLICE_SIZE = 64 * 1024
+
+
+def _translate(
+    characters: str, table: converter.TranslationTable, reverse: bool
+) -> str:
+    """Translate characters slice by slice.
+
+    Args:
+        characters (str): The characters to convert.
+        table (converter.TranslationTable): The translation table.
+        reverse (bool): Whether to reverse the characters.
+
+    Returns:
+        str: The converted characters.
+    """
+    if reverse:
+        characters = characters[::-1]
+    return "".join(
+        characters[start : start + SLICE_SIZE].translate(table)
+        for start in range(0, len(characters), SLICE_SIZE)
+    )
+
+
+def _load_tables(
+    types: Optional[List[str]], strict_case: bool
+) -> Tuple[List[str], List[converter.TranslationTable]]:
+    """Load the translation tables of several Unicode types.
+
+    Args:
+        types (List[str], optional): The Unicode type names. If None,
+            every Unicode type is loaded.
+        strict_case (bool): Whether to forbid case fallback.
+
+    Returns:
+        Tuple[List[str], List[converter.TranslationTable]]: The normalized Unicode
+        type names and their translation tables.
+    """
+    unicode_types = converter._normalize_types(types)
+    tables = [
+        converter._get_table(unicode_type, strict_case=strict_case)
+        for unicode_type in unicode_types
+    ]
+    return unicode_types, tables
+
+
+async def _get_tables(
+    types: Optional[Iterable[str]], strict_case: bool, executor: Optional[Executor]
+) -> Tuple[List[str], List[converter.TranslationTable]]:
+    """Return translation tables, loading them on an executor if needed.
+
+    Args:
+        types (Iterable[str], optional): The Unicode type names. If None,
+            every Unicode type is returned.
+        strict_case (bool): Whether to forbid case fallback.
+        executor (Executor, optional): The executor to load on. By
+            default the event loop's default executor.
+
+    Returns:
+        Tuple[List[str], List[converter.TranslationTable]]: The normalized Unicode
+        type names and their translation tables.
+    """
+    if types is not None:
+        types = list(types)
+    registry = converter.registry
+    if registry.is_open():
+        unicode_types = converter._normalize_types(types)
+        if all(
+            registry.is_compiled(unicode_type, strict_case=strict_case)
+            for unicode_type in unicode_types
+        ):
+            return _load_tables(types, strict_case)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, _load_tables, types, strict_case)
+
+
+async def _get_style_table(
+    unicode_type: Union[str, Iterable[str]],
+    strict_case: bool,
+    executor: Optional[Executor],
+) -> converter.TranslationTable:
+    """Return the table of a style, loading it on an executor if needed.
+
+    Args:
+        unicode_type (Union[str, Iterable[str]]): The Unicode type name,
+            or the names to apply one after another.
+        strict_case (bool): Whether to forbid case fallback.
+        executor (Executor, optional): The executor to load on. By
+            default the event loop's default executor.
+
+    Returns:
+        converter.TranslationTable: The translation table of
+        ``unicode_type``.
+    """
+    style = converter._normalize_style(unicode_type)
+    registry = converter.registry
+    if registry.is_open() and all(
+        registry.is_compiled(stage, strict_case=strict_case)
+        for stage in converter._stages(style)
+    ):
+        return converter._get_table(style, strict_case=strict_case)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor, converter._get_table, style, strict_case
+    )
+
+
+async def _convert(
+    characters: str,
+    table: converter.TranslationTable,
+    reverse: bool,
+    threshold: Optional[int],
+    executor: Optional[Executor],
+) -> str:
+    """Convert characters, on an executor if they are long.
+
+    Args:
+        characters (str): The characters to convert.
+        table (converter.TranslationTable): The translation table.
+        reverse (bool): Whether to reverse the characters.
+        threshold (int, optional): The length above which conversion is
+            offloaded. By default ``OFFLOAD_THRESHOLD``.
+        executor (Executor, optional): The executor to convert on. By
+            default the event loop's default executor.
+
+    Returns:
+        str: The converted characters.
+    """
+    if threshold is None:
+        threshold = OFFLOAD_THRESHOLD
+    if len(characters) <= threshold:
+        return _translate(characters, table, reverse)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, _translate, characters, table, reverse)
+
+
+async def warm_up(
+    types: Optional[Iterable[str]] = None, executor: Optional[Executor] = None
+) -> None:
+    """Load translation tables ahead of time.
+
+    Await this when a service starts so that the first requests do not
+    wait for tables to load.
+
+    Args:
+        types (Iterable[str], optional): The Unicode types to load. By
+            default every type is loaded.
+        executor (Executor, optional): The executor to load on. By
+            default the event loop's default executor.
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if a value inputted in ``types``
+            is invalid.
+    """  # noqa: DAR402
+    if types is not None:
+        types = list(types)
+    for strict_case in (False, True):
+        await _get_tables(types, strict_case, executor)
+    pass
+
+
+async def aconvert(
+    characters: str,
+    unicode_type: Union[str, Iterable[str]],
+    strict_case: bool = False,
+    reverse: bool = False,
+    threshold: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> str:
+    """Convert characters to a Unicode character type.
+
+    The asynchronous counterpart of ``dressup.convert``.
+
+    Args:
+        characters (str): The characters to convert.
+        unicode_type (Union[str, Iterable[str]]): The type of Unicode
+            character types to convert to, or several types to apply one
+            after another. Accepts the same values as ``convert``.
+        strict_case (bool): Whether to forbid a character from being
+            converted to its lower or upper case counterpart if an exact
+            mapping is not found. By default False.
+        reverse (bool): Whether to reverse the returned characters. By
+            default False.
+        threshold (int, optional): The length above which conversion is
+            offloaded to ``executor``. By default ``OFFLOAD_THRESHOLD``.
+        executor (Executor, optional): The executor to offload to. By
+            default the event loop's default executor.
+
+    Returns:
+        str: The converted Unicode characters.
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if value inputted in
+            ``unicode_type`` is invalid.
+
+    Example:
+        Convert the string "Hello" to negative circle characters.
+
+        >>> import asyncio
+        >>> from dressup import aio
+        >>> asyncio.run(aio.aconvert("Hello", "negative circle"))
+        '🅗🅔🅛🅛🅞'
+    """  # noqa: DAR402
+    table = await _get_style_table(unicode_type, strict_case, executor)
+    return await _convert(characters, table, reverse, threshold, executor)
+
+
+async def ashow_all(
+    characters: str,
+    strict_case: bool = False,
+    reverse: bool = False,
+    types: Optional[Iterable[str]] = None,
+    threshold: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Dict[str, str]:
+    """Return all possible unicode conversions.
+
+    The asynchronous counterpart of ``dressup.show_all``.
+
+    Args:
+        characters (str): The characters to convert.
+        strict_case (bool): Whether to forbid a character from being
+            converted to its lower or upper case counterpart if an exact
+            mapping is not found. By default False.
+        reverse (bool): Whether to reverse the returned characters. By
+            default False.
+        types (Iterable[str], optional): The Unicode types to convert
+            to. By default every type is returned.
+        threshold (int, optional): The length above which conversion is
+            offloaded to ``executor``. By default ``OFFLOAD_THRESHOLD``.
+        executor (Executor, optional): The executor to offload to. By
+            default the event loop's default executor.
+
+    Returns:
+        Dict[str, str]: A dictionary where the keys are the names of
+        character types and the values are the converted characters.
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if a value inputted in ``types``
+            is invalid.
+    """  # noqa: DAR402
+    unicode_types, tables = await _get_tables(types, strict_case, executor)
+    converted_characters = {}
+    for unicode_type, table in zip(unicode_types, tables):
+        converted_characters[converter._format_names(unicode_type)] = await _convert(
+            characters, table, reverse, threshold, executor
+        )
+    return converted_characters
+
+
+async def aconvert_stream(
+    source: Union[AsyncIterable[str], Iterable[str]],
+    unicode_type: Union[str, Iterable[str]],
+    strict_case: bool = False,
+    reverse: bool = False,
+    threshold: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[str]:
+    """Convert a stream of characters to a Unicode character type.
+
+    The asynchronous counterpart of ``dressup.convert_stream``.
+
+    Args:
+        source (Union[AsyncIterable[str], Iterable[str]]): The chunks of
+            characters to convert.
+        unicode_type (Union[str, Iterable[str]]): The type of Unicode
+            character types to convert to, or several types to apply one
+            after another. Accepts the same values as ``convert``.
+        strict_case (bool): Whether to forbid a character from being
+            converted to its lower or upper case counterpart if an exact
+            mapping is not found. By default False.
+        reverse (bool): Whether to reverse the returned characters. The
+            whole source is held in memory when True. By default False.
+        threshold (int, optional): The chunk length above which
+            conversion is offloaded to ``executor``. By default
+            ``OFFLOAD_THRESHOLD``.
+        executor (Executor, optional): The executor to offload to. By
+            default the event loop's default executor.
+
+    Yields:
+        str: The converted chunks.
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if value inputted in
+            ``unicode_type`` is invalid.
+    """  # noqa: DAR402
+    table = await _get_style_table(unicode_type, strict_case, executor)
+    chunks = _aiter_chunks(source)
+    if reverse:
+        buffered_chunks = [chunk async for chunk in chunks]
+        chunks = _aiter_chunks(reversed(buffered_chunks))
+    async for chunk in chunks:
+        yield await _convert(chunk, table, reverse, threshold, executor)
+
+
+async def _aiter_chunks(
+    source: Union[AsyncIterable[str], Iterable[str]]
+) -> AsyncIterator[str]:
+    """Iterate over a synchronous or asynchronous source.
+
+    Args:
+        source (Union[AsyncIterable[str], Iterable[str]]): The chunks.
+
+    Yields:
+        str: The chunks of ``source``.
+    """
+    if isinstance(source, AsyncIterable):
+        async for chunk in source:
+            yield chunk
+    else:
+        for chunk in source:
+            yield chunk
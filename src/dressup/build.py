@@ -0,0 +1,606 @@
+"""Compile source files into translator.toml and precompiled tables.
+
+The runtime imports the generated ``translator_tables`` module instead
+of parsing ``translator.toml``. Regenerate it after editing the TOML
+file by running:
+
+    python -m dressup.build
+
+``dressup-build-tables`` compiles any number of source files instead,
+and writes both files in one pass. A source is either a TOML file of
+tables, like ``translator.toml``, or a text file whose first line holds
+the base characters and whose other lines each hold a style name and
+the converted characters, separated by whitespace. In a text source,
+combining marks belong to the character before them, so a character
+can convert to several code points. A TOML table may also hold a
+``suffix`` rule, appended to every character it does not map.
+
+Every style's checksum is stored in the generated module, and styles
+whose mapping did not change since the last build reuse their compiled
+case fallbacks and previews.
+"""
+import ast
+import json
+import pathlib
+from pathlib import Path
+import re
+import time
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+import unicodedata
+import zlib
+
+import toml
+
+from .converter import (
+    case_variants,
+    CaseFallbackTable,
+    compile_case_fallbacks,
+    compile_table,
+    PREVIEW_TEXT,
+    source_checksum,
+    SUFFIX_KEY,
+    SuffixTable,
+)
+from .exceptions import InvalidSourceError
+
+PACKAGE_PATH = pathlib.Path(__file__).parent
+TOML_PATH = PACKAGE_PATH / "translator.toml"
+ARTIFACT_PATH = PACKAGE_PATH / "translator_tables.py"
+
+Mappings = Dict[str, Dict[str, str]]
+Timings = Dict[str, Optional[float]]
+
+
+def _literal(value: Union[int, str]) -> str:
+    """Render a string or integer as a Python literal.
+
+    Args:
+        value (Union[int, str]): The string or integer to render.
+
+    Returns:
+        str: The Python literal, using double quotes for strings.
+    """
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _render_dict(name: str, tables: Mapping[str, Any]) -> List[str]:
+    """Render a dictionary assignment one item per line.
+
+    Args:
+        name (str): The name of the assigned variable.
+        tables (Mapping[str, Any]): The dictionary to render. Values that
+            are dictionaries are rendered one item per line too.
+
+    Returns:
+        List[str]: The rendered lines.
+    """
+    lines = [f"{name} = {{"]
+    for unicode_type, table in tables.items():
+        if not isinstance(table, Mapping):
+            lines.append(f"    {_literal(unicode_type)}: {_literal(table)},")
+            continue
+        if not table:
+            lines.append(f"    {_literal(unicode_type)}: {{}},")
+            continue
+        lines.append(f"    {_literal(unicode_type)}: {{")
+        lines.extend(
+            f"        {_literal(key)}: {_literal(value)},"
+            for key, value in table.items()
+        )
+        lines.append("    },")
+    lines.append("}")
+    return lines
+
+
+def _toml_string(text: str) -> str:
+    """Render a string as a TOML basic string.
+
+    Combining marks and control characters are escaped, so that they
+    stay readable on their own.
+
+    Args:
+        text (str): The string to render.
+
+    Returns:
+        str: The TOML string, in double quotes.
+    """
+    escaped_characters = []
+    for character in text:
+        if character in ('"', "\\"):
+            escaped_characters.append(f"\\{character}")
+        elif unicodedata.combining(character) or character < " " or character == "\x7f":
+            escaped_characters.append(f"\\u{ord(character):04x}")
+        else:
+            escaped_characters.append(character)
+    return f'"{"".join(escaped_characters)}"'
+
+
+def _toml_key(key: str) -> str:
+    """Render a TOML key, quoting it unless it is a bare key.
+
+    Args:
+        key (str): The key to render.
+
+    Returns:
+        str: The TOML key.
+    """
+    if re.fullmatch(r"[A-Za-z0-9_-]+", key):
+        return key
+    return _toml_string(key)
+
+
+def render_toml(mappings: Mapping[str, Mapping[str, str]]) -> str:
+    """Render styles in the layout of ``translator.toml``.
+
+    Args:
+        mappings (Mapping[str, Mapping[str, str]]): The mapping of every
+            style.
+
+    Returns:
+        str: One table per style, separated by blank lines.
+    """
+    tables = []
+    for unicode_type, mapping in mappings.items():
+        lines = [f"[{_toml_key(unicode_type)}]"]
+        lines.extend(
+            f"{_toml_key(character)} = {_toml_string(converted_character)}"
+            for character, converted_character in mapping.items()
+        )
+        tables.append("\n".join(lines) + "\n")
+    return "\n".join(tables)
+
+
+def _find_duplicates(characters: Iterable[str]) -> List[str]:
+    """Find the characters that appear more than once.
+
+    Args:
+        characters (Iterable[str]): The characters to check.
+
+    Returns:
+        List[str]: The repeated characters, in order of first
+        repetition.
+    """
+    seen = set()
+    duplicates: Dict[str, None] = {}
+    for character in characters:
+        if character in seen:
+            duplicates[character] = None
+        seen.add(character)
+    return list(duplicates)
+
+
+def _split_clusters(characters: str) -> List[str]:
+    """Split characters, keeping combining marks with their base.
+
+    Args:
+        characters (str): The characters to split.
+
+    Returns:
+        List[str]: Each character followed by the combining marks after
+        it.
+    """
+    clusters: List[str] = []
+    for character in characters:
+        if clusters and unicodedata.combining(character):
+            clusters[-1] += character
+        else:
+            clusters.append(character)
+    return clusters
+
+
+def split_mapping(
+    base_characters: str, converted_characters: str, location: str = "<string>"
+) -> Dict[str, str]:
+    """Map base characters to the converted characters that differ.
+
+    Both strings are checked and mapped in a single pass each.
+
+    Args:
+        base_characters (str): The characters to convert.
+        converted_characters (str): The converted characters, in the
+            same order. Combining marks are part of the converted
+            character before them.
+        location (str): Where the characters come from, for error
+            messages. By default "<string>".
+
+    Returns:
+        Dict[str, str]: The base characters whose converted character is
+        different, mapped to it.
+
+    Raises:
+        InvalidSourceError: Raised if the strings differ in length or
+            either repeats a character.
+    """
+    converted_clusters = _split_clusters(converted_characters)
+    if len(base_characters) != len(converted_clusters):
+        raise InvalidSourceError(
+            f"{location}: expected {len(base_characters)} characters,"
+            f" found {len(converted_clusters)}."
+        )
+    for characters in (base_characters, converted_clusters):
+        duplicates = _find_duplicates(characters)
+        if duplicates:
+            raise InvalidSourceError(
+                f"{location}: repeated characters: {', '.join(duplicates[:5])}"
+            )
+    return {
+        base_character: converted_character
+        for base_character, converted_character in zip(
+            base_characters, converted_clusters
+        )
+        if base_character != converted_character
+    }
+
+
+def parse_text_source(lines: Iterable[str], name: str = "<string>") -> Mappings:
+    """Parse the lines of a text source.
+
+    Args:
+        lines (Iterable[str]): The lines of the source. The first holds
+            the base characters, and each other non-blank line holds a
+            style name and its converted characters.
+        name (str): The name of the source, for error messages. By
+            default "<string>".
+
+    Returns:
+        Mappings: The mapping of every style in the source.
+
+    Raises:
+        InvalidSourceError: Raised if a line is malformed, a style is
+            defined twice, or its characters do not match the base
+            characters.
+    """
+    mappings: Mappings = {}
+    base_characters = None
+    for line_number, line in enumerate(lines, start=1):
+        if base_characters is None:
+            base_characters = line.strip()
+            continue
+        if not line.strip():
+            continue
+        location = f"{name}:{line_number}"
+        try:
+            unicode_type, converted_characters = line.split()
+        except ValueError as error:
+            raise InvalidSourceError(
+                f"{location}: expected a style name and its characters."
+            ) from error
+        if unicode_type in mappings:
+            raise InvalidSourceError(f"{location}: {unicode_type} is defined twice.")
+        mappings[unicode_type] = split_mapping(
+            base_characters, converted_characters, location
+        )
+    return mappings
+
+
+def read_source(path: Path) -> Mappings:
+    """Read a TOML or text source file.
+
+    Args:
+        path (Path): The path of the source. Files ending in ".toml" are
+            read as TOML, and any other file as a text source.
+
+    Returns:
+        Mappings: The mapping of every style in the source.
+
+    Raises:
+        InvalidSourceError: Raised if the source is malformed, or a table
+            has a key that is neither a single character nor a suffix
+            rule.
+    """
+    with open(path, encoding="utf-8") as source_file:
+        text = source_file.read()
+    if path.suffix != ".toml":
+        return parse_text_source(text.splitlines(), str(path))
+    try:
+        mappings = toml.loads(text)
+    except toml.TomlDecodeError as error:
+        raise InvalidSourceError(f"{path}: {error}") from error
+    for unicode_type, mapping in mappings.items():
+        if not isinstance(mapping, dict) or not all(
+            isinstance(character, str) and isinstance(converted_character, str)
+            for character, converted_character in mapping.items()
+        ):
+            raise InvalidSourceError(
+                f"{path}: {unicode_type} must be a table of strings."
+            )
+        invalid_keys = [key for key in mapping if len(key) != 1 and key != SUFFIX_KEY]
+        if invalid_keys:
+            raise InvalidSourceError(
+                f"{path}: {unicode_type} has invalid keys: {', '.join(invalid_keys)}"
+            )
+        duplicates = _find_duplicates(mapping.values())
+        if duplicates:
+            raise InvalidSourceError(
+                f"{path}: {unicode_type} repeats characters:"
+                f" {', '.join(duplicates[:5])}"
+            )
+    return mappings
+
+
+def merge_sources(paths: Iterable[Path]) -> Mappings:
+    """Read source files into one set of styles.
+
+    Args:
+        paths (Iterable[Path]): The source files, in the order their
+            styles are listed in.
+
+    Returns:
+        Mappings: The mapping of every style.
+
+    Raises:
+        InvalidSourceError: Raised if a source is malformed or two
+            sources define the same style.
+    """
+    mappings: Mappings = {}
+    origins: Dict[str, Path] = {}
+    for path in paths:
+        for unicode_type, mapping in read_source(path).items():
+            if unicode_type in origins:
+                raise InvalidSourceError(
+                    f"{unicode_type} is defined in both {origins[unicode_type]}"
+                    f" and {path}."
+                )
+            origins[unicode_type] = path
+            mappings[unicode_type] = mapping
+    return mappings
+
+
+def style_checksum(mapping: Mapping[str, str]) -> int:
+    """Return the checksum of one style's mapping.
+
+    Args:
+        mapping (Mapping[str, str]): The mapping of the style.
+
+    Returns:
+        int: The CRC-32 checksum of the mapping's items, in order.
+    """
+    return zlib.crc32(json.dumps(list(mapping.items())).encode())
+
+
+def read_artifact(artifact_path: Path) -> Dict[str, Any]:
+    """Read the constants of a generated module without importing it.
+
+    Args:
+        artifact_path (Path): The path of the generated module.
+
+    Returns:
+        Dict[str, Any]: The constants, or an empty dictionary if the
+        module is missing or cannot be parsed.
+    """
+    try:
+        module = ast.parse(artifact_path.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, ValueError):
+        return {}
+    constants = {}
+    for statement in module.body:
+        if isinstance(statement, ast.Assign) and isinstance(
+            statement.targets[0], ast.Name
+        ):
+            try:
+                constants[statement.targets[0].id] = ast.literal_eval(statement.value)
+            except ValueError:
+                continue
+    return constants
+
+
+def compile_styles(
+    mappings: Mapping[str, Mapping[str, str]],
+    previous: Optional[Mapping[str, Any]] = None,
+) -> Tuple[Dict[str, Dict[str, Any]], Timings]:
+    """Compile the case fallbacks and previews of every style.
+
+    Styles whose checksum matches ``previous`` reuse its compiled values.
+
+    Args:
+        mappings (Mapping[str, Mapping[str, str]]): The mapping of every
+            style.
+        previous (Mapping[str, Any], optional): The constants of the
+            previously generated module, as returned by
+            ``read_artifact``. By default every style is compiled.
+
+    Returns:
+        Tuple[Dict[str, Dict[str, Any]], Timings]: The "CASE_FALLBACKS",
+        "PREVIEWS", "STRICT_PREVIEWS" and "STYLE_CHECKSUMS" of every
+        style, and the seconds taken to compile each style, or None for
+        reused styles.
+    """
+    if previous is None:
+        previous = {}
+    previous_checksums = previous.get("STYLE_CHECKSUMS", {})
+    previous_previews = previous.get("PREVIEWS", {}).get(PREVIEW_TEXT, {})
+    previous_strict_previews = previous.get("STRICT_PREVIEWS", {}).get(PREVIEW_TEXT, {})
+    previous_case_fallbacks = previous.get("CASE_FALLBACKS", {})
+    compiled: Dict[str, Dict[str, Any]] = {
+        "CASE_FALLBACKS": {},
+        "PREVIEWS": {},
+        "STRICT_PREVIEWS": {},
+        "STYLE_CHECKSUMS": {},
+    }
+    timings: Timings = {}
+    variants = None
+    for unicode_type, mapping in mappings.items():
+        checksum = style_checksum(mapping)
+        compiled["STYLE_CHECKSUMS"][unicode_type] = checksum
+        if (
+            previous_checksums.get(unicode_type) == checksum
+            and unicode_type in previous_case_fallbacks
+            and unicode_type in previous_previews
+            and unicode_type in previous_strict_previews
+        ):
+            compiled["CASE_FALLBACKS"][unicode_type] = previous_case_fallbacks[
+                unicode_type
+            ]
+            compiled["PREVIEWS"][unicode_type] = previous_previews[unicode_type]
+            compiled["STRICT_PREVIEWS"][unicode_type] = previous_strict_previews[
+                unicode_type
+            ]
+            timings[unicode_type] = None
+            continue
+        if variants is None:
+            variants = case_variants()
+        start = time.perf_counter()
+        case_fallbacks = compile_case_fallbacks(dict(mapping), variants)
+        compiled["CASE_FALLBACKS"][unicode_type] = case_fallbacks
+        table: Dict[int, str]
+        strict_table: Dict[int, str]
+        if SUFFIX_KEY in mapping:
+            table = strict_table = SuffixTable(dict(mapping))
+        else:
+            table = CaseFallbackTable(dict(mapping), case_fallbacks)
+            strict_table = compile_table(dict(mapping))
+        compiled["PREVIEWS"][unicode_type] = PREVIEW_TEXT.translate(table)
+        compiled["STRICT_PREVIEWS"][unicode_type] = PREVIEW_TEXT.translate(strict_table)
+        timings[unicode_type] = time.perf_counter() - start
+    return compiled, timings
+
+
+def render_artifact(
+    mappings: Mapping[str, Mapping[str, str]],
+    source: bytes,
+    compiled: Optional[Mapping[str, Mapping[str, Any]]] = None,
+) -> str:
+    """Render the ``translator_tables`` module.
+
+    Args:
+        mappings (Mapping[str, Mapping[str, str]]): The parsed contents
+            of ``translator.toml``.
+        source (bytes): The raw contents of ``translator.toml``.
+        compiled (Mapping[str, Mapping[str, Any]], optional): The
+            result of ``compile_styles``. By default every style is
+            compiled.
+
+    Returns:
+        str: The Python source of the module.
+    """
+    if compiled is None:
+        compiled, _ = compile_styles(mappings)
+    lines = [
+        '"""Precompiled translation tables.',
+        "",
+        "Generated from translator.toml by ``python -m dressup.build``. Do not",
+        "edit by hand.",
+        '"""',
+        f"SOURCE_CHECKSUM = {source_checksum(source)}",
+        "",
+        *_render_dict("MAPPINGS", mappings),
+        "",
+        *_render_dict("CASE_FALLBACKS", compiled["CASE_FALLBACKS"]),
+        "",
+        *_render_dict("PREVIEWS", {PREVIEW_TEXT: compiled["PREVIEWS"]}),
+        "",
+        *_render_dict("STRICT_PREVIEWS", {PREVIEW_TEXT: compiled["STRICT_PREVIEWS"]}),
+        "",
+        *_render_dict("STYLE_CHECKSUMS", compiled["STYLE_CHECKSUMS"]),
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def _write_if_changed(path: Path, text: str) -> None:
+    """Write a UTF-8 file unless it already holds the same text.
+
+    Args:
+        path (Path): The path of the file.
+        text (str): The text to write.
+    """
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return
+    except OSError:
+        pass
+    path.write_text(text, encoding="utf-8")
+    pass
+
+
+def _write_artifact(
+    mappings: Mapping[str, Mapping[str, str]],
+    source: bytes,
+    artifact_path: Path,
+    force: bool,
+) -> Timings:
+    """Compile the styles that changed and write the generated module.
+
+    Args:
+        mappings (Mapping[str, Mapping[str, str]]): The mapping of every
+            style.
+        source (bytes): The raw contents of ``translator.toml``.
+        artifact_path (Path): The path of the generated module.
+        force (bool): Whether to compile every style.
+
+    Returns:
+        Timings: The seconds taken to compile each style, or None for
+        styles that did not change.
+    """
+    previous = None if force else read_artifact(artifact_path)
+    compiled, timings = compile_styles(mappings, previous)
+    _write_if_changed(artifact_path, render_artifact(mappings, source, compiled))
+    return timings
+
+
+def build(
+    toml_path: Path = TOML_PATH,
+    artifact_path: Path = ARTIFACT_PATH,
+    force: bool = False,
+) -> Timings:
+    """Write the ``translator_tables`` module for a TOML file.
+
+    Args:
+        toml_path (Path): The ``translator.toml`` file to compile.
+        artifact_path (Path): The path of the generated module.
+        force (bool): Whether to compile styles that did not change. By
+            default False.
+
+    Returns:
+        Timings: The seconds taken to compile each style, or None for
+        styles that did not change.
+    """
+    source = toml_path.read_bytes()
+    mappings = toml.loads(source.decode("utf-8"))
+    return _write_artifact(mappings, source, artifact_path, force)
+
+
+def build_tables(
+    sources: Sequence[Path],
+    toml_path: Path,
+    artifact_path: Path,
+    force: bool = False,
+) -> Timings:
+    """Compile source files into ``translator.toml`` and its module.
+
+    Only the styles in ``sources`` are written, so to add styles to an
+    existing ``translator.toml``, list it as a source too.
+
+    Args:
+        sources (Sequence[Path]): The TOML and text source files.
+        toml_path (Path): The path of the ``translator.toml`` to write.
+        artifact_path (Path): The path of the generated module.
+        force (bool): Whether to compile styles that did not change. By
+            default False.
+
+    Returns:
+        Timings: The seconds taken to compile each style, or None for
+        styles that did not change.
+
+    Raises:
+        InvalidSourceError: Raised if a source is malformed or two
+            sources define the same style.
+    """  # noqa: DAR402
+    mappings = merge_sources(sources)
+    toml_text = render_toml(mappings)
+    _write_if_changed(toml_path, toml_text)
+    return _write_artifact(mappings, toml_text.encode("utf-8"), artifact_path, force)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    build()
@@ -0,0 +1,178 @@
+"""Opt-in memoization of conversion results.
+
+The cache is disabled by default. Call ``enable`` to have ``convert``
+and ``show_all`` return stored results for text they have already
+converted with the same options. The cache is bounded both by its
+number of entries and by the total characters it holds, and results
+longer than a per-entry limit are never stored, so that a few huge
+inputs cannot evict everything else.
+
+Example:
+    Memoize repeated conversions.
+
+    >>> import dressup
+    >>> from dressup import cache
+    >>> _ = cache.enable(max_entries=1024)
+    >>> dressup.convert("Hello", "math bold")
+    '𝐇𝐞𝐥𝐥𝐨'
+    >>> dressup.convert("Hello", "math bold")
+    '𝐇𝐞𝐥𝐥𝐨'
+    >>> cache.stats()["hits"]
+    1
+    >>> cache.disable()
+"""
+import collections
+import threading
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class ResultCache:
+    """Thread-safe least recently used cache of conversion results.
+
+    Attributes:
+        max_entries (int): The maximum number of stored results.
+        max_characters (int): The maximum total size of the stored
+            results, counting the characters of each input and output.
+        max_item_characters (int): The largest result that is stored.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        max_characters: int = 1 << 20,
+        max_item_characters: Optional[int] = None,
+    ) -> None:
+        """Constructor."""
+        self.max_entries = max_entries
+        self.max_characters = max_characters
+        if max_item_characters is None:
+            max_item_characters = max_characters // 16
+        self.max_item_characters = min(max_item_characters, max_characters)
+        self._lock = threading.Lock()
+        self._entries: "collections.OrderedDict[Hashable, Tuple[object, int]]" = (
+            collections.OrderedDict()
+        )
+        self._characters = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        pass
+
+    def get(self, key: Hashable) -> Optional[object]:
+        """Return a stored result and mark it as recently used.
+
+        Args:
+            key (Hashable): The key of the result.
+
+        Returns:
+            Optional[object]: The result, or None if it is not stored.
+        """
+        with self._lock:
+            try:
+                value, _ = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: object, characters: int) -> None:
+        """Store a result, evicting the least recently used ones.
+
+        Args:
+            key (Hashable): The key of the result.
+            value (object): The result.
+            characters (int): The size of the result, in characters.
+        """
+        if characters > self.max_item_characters:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._characters -= previous[1]
+            self._entries[key] = (value, characters)
+            self._characters += characters
+            while (
+                len(self._entries) > self.max_entries
+                or self._characters > self.max_characters
+            ):
+                _, (_, evicted_characters) = self._entries.popitem(last=False)
+                self._characters -= evicted_characters
+                self._evictions += 1
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        """Return the usage statistics of the cache.
+
+        Returns:
+            Dict[str, int]: The number of "hits", "misses" and
+            "evictions" so far, and the current number of "entries" and
+            "characters".
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries),
+                "characters": self._characters,
+            }
+
+    def clear(self) -> None:
+        """Discard every stored result and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._characters = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+        pass
+
+
+result_cache: Optional[ResultCache] = None
+
+
+def enable(
+    max_entries: int = 4096,
+    max_characters: int = 1 << 20,
+    max_item_characters: Optional[int] = None,
+) -> ResultCache:
+    """Start memoizing ``convert`` and ``show_all`` in a new cache.
+
+    Args:
+        max_entries (int): The maximum number of stored results. By
+            default 4096.
+        max_characters (int): The maximum total size of the stored
+            results, counting the characters of each input and output.
+            By default 1048576.
+        max_item_characters (int, optional): The largest result that is
+            stored. By default a sixteenth of ``max_characters``.
+
+    Returns:
+        ResultCache: The cache now in use.
+    """
+    global result_cache
+    result_cache = ResultCache(max_entries, max_characters, max_item_characters)
+    return result_cache
+
+
+def disable() -> None:
+    """Stop memoizing and discard the cache."""
+    global result_cache
+    result_cache = None
+    pass
+
+
+def stats() -> Dict[str, int]:
+    """Return the usage statistics of the cache in use.
+
+    Returns:
+        Dict[str, int]: The result of ``ResultCache.stats``, or zeros if
+        the cache is disabled.
+    """
+    if result_cache is None:
+        return dict.fromkeys(
+            ("hits", "misses", "evictions", "entries", "characters"), 0
+        )
+    return result_cache.stats()
@@ -0,0 +1,300 @@
+"""Command-line entry point.
+
+Importing typer and rich takes most of the command-line interface's
+start-up time. ``dressup --version``, ``dressup --type TYPE CHARACTERS``
+and shell completion of ``--type`` in bash, zsh and fish are handled
+here without importing either, and every other invocation is passed on
+to ``dressup.console.app``.
+"""
+import os
+import re
+import shlex
+import sys
+from typing import List, Optional, Tuple
+
+COMPLETE_VARIABLE = "_DRESSUP_COMPLETE"
+VALUE_OPTIONS = ("-t", "--type", "-i", "--input", "-o", "--output", "-j", "--jobs")
+
+
+def parse_fast_args(args: List[str]) -> Optional[Tuple[str, str, bool, bool]]:
+    """Parse arguments that only convert characters to one type.
+
+    Args:
+        args (List[str]): The command-line arguments.
+
+    Returns:
+        Optional[Tuple[str, str, bool, bool]]: The characters, the
+        Unicode type, and whether to use strict case and to reverse.
+        None if ``args`` need the full command-line interface.
+    """
+    characters = None
+    unicode_type = None
+    strict_case = False
+    reverse = False
+    arguments = iter(args)
+    for argument in arguments:
+        if argument in ("-s", "--strict-case"):
+            strict_case = True
+        elif argument in ("-r", "--reverse"):
+            reverse = True
+        elif argument in ("-t", "--type"):
+            unicode_type = next(arguments, None)
+        elif argument.startswith("--type="):
+            unicode_type = argument[len("--type=") :]
+        elif argument.startswith("-") or characters is not None:
+            return None
+        else:
+            characters = argument
+    if characters is None or unicode_type is None or unicode_type.startswith("-"):
+        return None
+    return characters, unicode_type, strict_case, reverse
+
+
+def type_completions(
+    incomplete: str,
+    characters: Optional[str] = None,
+    strict_case: bool = False,
+    reverse: bool = False,
+) -> List[Tuple[str, str]]:
+    """Return the Unicode types that complete a --type value.
+
+    Only the matching Unicode types are converted, and the precompiled
+    previews are used when no characters are given and the previews are
+    not reversed.
+
+    Args:
+        incomplete (str): The incomplete Unicode type.
+        characters (str, optional): The characters to preview. By
+            default ``converter.PREVIEW_TEXT``.
+        strict_case (bool): Whether to forbid case fallback in the
+            previews. By default False.
+        reverse (bool): Whether to reverse the previews. By default
+            False.
+
+    Returns:
+        List[Tuple[str, str]]: The matching Unicode types, written with
+        dashes, and their previews.
+    """
+    from . import converter
+
+    registry = converter.registry
+    sample = converter.PREVIEW_TEXT if characters is None else characters
+    if reverse:
+        sample = sample[::-1]
+    completions = []
+    for unicode_type in registry.names_with_prefix(
+        converter.normalize_text(incomplete)
+    ):
+        if sample == converter.PREVIEW_TEXT:
+            converted_characters = registry.preview(unicode_type, strict_case)
+        else:
+            table = registry.table(unicode_type, strict_case=strict_case)
+            converted_characters = sample.translate(table)
+        completions.append((unicode_type.replace("_", "-"), converted_characters))
+    return completions
+
+
+def _split_words(line: str) -> List[str]:
+    """Split a command line the way the shell completion scripts do.
+
+    Args:
+        line (str): The command line, which may end inside quotes.
+
+    Returns:
+        List[str]: The words of the command line.
+    """
+    lexer = shlex.shlex(line, posix=True)
+    lexer.whitespace_split = True
+    lexer.commenters = ""
+    words = []
+    try:
+        for word in lexer:
+            words.append(word)
+    except ValueError:
+        words.append(lexer.token)
+    return words
+
+
+def _completion_words(shell: str) -> Tuple[List[str], str]:
+    """Read the words being completed from the environment.
+
+    Args:
+        shell (str): The name of the shell.
+
+    Returns:
+        Tuple[List[str], str]: The complete arguments and the
+        incomplete word.
+    """
+    if shell == "bash":
+        words = _split_words(os.environ.get("COMP_WORDS", ""))
+        word_index = int(os.environ.get("COMP_CWORD", "0"))
+        incomplete = words[word_index] if word_index < len(words) else ""
+        return words[1:word_index], incomplete
+    line = os.environ.get("_TYPER_COMPLETE_ARGS", "")
+    args = _split_words(line)[1:]
+    if args and not line.endswith(" "):
+        return args[:-1], args[-1]
+    return args, ""
+
+
+def parse_completion_args(
+    args: List[str], incomplete: str
+) -> Optional[Tuple[str, Optional[str], bool, bool]]:
+    """Parse a completion request for the value of --type.
+
+    Args:
+        args (List[str]): The complete arguments.
+        incomplete (str): The incomplete word.
+
+    Returns:
+        Optional[Tuple[str, Optional[str], bool, bool]]: The incomplete
+        Unicode type, the characters, and whether to use strict case and
+        to reverse. None if another word is being completed.
+    """
+    if incomplete.startswith("--type="):
+        incomplete = incomplete[len("--type=") :]
+    elif not args or args[-1] not in ("-t", "--type"):
+        return None
+    elif len(args) > 1 and args[-2] in VALUE_OPTIONS:
+        return None
+    else:
+        args = args[:-1]
+    characters = None
+    strict_case = False
+    reverse = False
+    arguments = iter(args)
+    for argument in arguments:
+        if argument in ("-s", "--strict-case"):
+            strict_case = True
+        elif argument in ("-r", "--reverse"):
+            reverse = True
+        elif argument in VALUE_OPTIONS:
+            next(arguments, None)
+        elif argument.startswith("-") or characters is not None:
+            return None
+        else:
+            characters = argument
+    return incomplete, characters, strict_case, reverse
+
+
+def _escape_zsh(text: str) -> str:
+    """Escape text for a zsh completion item.
+
+    Args:
+        text (str): The text to escape.
+
+    Returns:
+        str: The escaped text.
+    """
+    return (
+        text.replace('"', '""')
+        .replace("'", "''")
+        .replace("$", "\\$")
+        .replace("`", "\\`")
+    )
+
+
+def _format_completion(shell: str, value: str, preview: str) -> str:
+    """Format a completion item for a shell.
+
+    Args:
+        shell (str): The name of the shell.
+        value (str): The completed value.
+        preview (str): The preview shown next to the value.
+
+    Returns:
+        str: The completion item.
+    """
+    if shell == "bash":
+        return value
+    elif shell == "zsh":
+        if preview:
+            return f'"{_escape_zsh(value)}":"{_escape_zsh(preview)}"'
+        return f'"{_escape_zsh(value)}"'
+    elif preview:
+        formatted_preview = re.sub(r"\s", " ", preview)
+        return f"{value}\t{formatted_preview}"
+    return value
+
+
+def complete(instruction: str) -> Optional[int]:
+    """Answer a shell completion request for the value of --type.
+
+    The output matches the completion scripts that typer installs.
+
+    Args:
+        instruction (str): The value of ``COMPLETE_VARIABLE``, such as
+            "complete_bash".
+
+    Returns:
+        Optional[int]: The status code to exit with, or None if the
+        request needs the full command-line interface.
+    """
+    action, _, shell = instruction.partition("_")
+    if action != "complete" or shell not in ("bash", "zsh", "fish"):
+        return None
+    completion_args = parse_completion_args(*_completion_words(shell))
+    if completion_args is None:
+        return None
+    incomplete, characters, strict_case, reverse = completion_args
+    completions = [
+        (value, preview)
+        for value, preview in type_completions(
+            incomplete, characters, strict_case, reverse
+        )
+        if value.startswith(incomplete)
+    ]
+    if shell == "fish":
+        fish_action = os.environ.get("_TYPER_COMPLETE_FISH_ACTION", "")
+        if fish_action == "is-args":
+            return 0 if completions else 1
+        elif fish_action != "get-args":
+            completions = []
+    output = "\n".join(_format_completion(shell, *item) for item in completions)
+    if shell == "zsh":
+        output = f"_arguments '*: :(({output}))'" if completions else "_files"
+    print(output)
+    return 0
+
+
+def run(args: Optional[List[str]] = None) -> None:
+    """Run the command-line interface.
+
+    Args:
+        args (List[str], optional): The command-line arguments. By
+            default ``sys.argv[1:]``.
+    """
+    if args is None:
+        args = sys.argv[1:]
+    instruction = os.environ.get(COMPLETE_VARIABLE)
+    if instruction is not None:
+        status = complete(instruction)
+        if status is not None:
+            sys.exit(status)
+    elif args in (["-v"], ["--version"]):
+        from . import __version__
+
+        print(f"Dress up version: {__version__}")
+        return
+    else:
+        fast_args = parse_fast_args(args)
+        if fast_args is not None:
+            from . import converter, exceptions
+
+            characters, unicode_type, strict_case, reverse = fast_args
+            try:
+                converted_characters = converter.convert(
+                    characters,
+                    unicode_type=unicode_type,
+                    strict_case=strict_case,
+                    reverse=reverse,
+                )
+            except exceptions.InvalidUnicodeTypeError:
+                pass
+            else:
+                print(converted_characters)
+                return
+    from .console import app
+
+    app(args=args)
+    pass
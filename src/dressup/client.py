@@ -0,0 +1,205 @@
+"""Thin client of ``dressup-daemon``.
+
+``dressup-client`` takes the same arguments as ``dressup``. It sends
+them, and standard input when ``--input -`` is given, to a daemon
+listening on ``socket_path()`` and writes back what the daemon streams.
+The daemon keeps every translation table loaded, so neither typer, rich
+nor the mappings are loaded per call. If no daemon is running, or it
+cannot answer the arguments, they are run in this process with
+``dressup.cli.run`` instead.
+
+The client and the daemon exchange frames of one kind byte, a payload
+length as a 4-byte big-endian integer, and the payload. This module
+only imports the standard library modules it needs, to keep start-up
+short.
+"""
+import io
+import json
+import os
+import socket
+import struct
+import sys
+import threading
+from typing import BinaryIO, List, Optional, Tuple
+
+SOCKET_VARIABLE = "DRESSUP_SOCKET"
+READ_SIZE = 64 * 1024
+FRAME_HEADER = struct.Struct(">cI")
+OUTPUT = b"o"
+ERROR = b"e"
+SEND_INPUT = b"i"
+FALLBACK = b"f"
+EXIT = b"x"
+
+
+def socket_path() -> Optional[str]:
+    """Return the path of the daemon's socket.
+
+    Returns:
+        Optional[str]: The value of ``DRESSUP_SOCKET`` if set, or else
+        ``dressup.sock`` in ``XDG_RUNTIME_DIR``, or in a ``dressup-UID``
+        directory of the temporary directory that the daemon creates
+        private to its user. None if the platform has no Unix sockets.
+    """
+    if not hasattr(socket, "AF_UNIX"):  # pragma: no cover
+        return None
+    path = os.environ.get(SOCKET_VARIABLE)
+    if path:
+        return path
+    directory = os.environ.get("XDG_RUNTIME_DIR")
+    if not directory:
+        directory = os.path.join(
+            os.environ.get("TMPDIR", "/tmp"), f"dressup-{os.getuid()}"  # noqa: S108
+        )
+    return os.path.join(directory, "dressup.sock")
+
+
+def write_frame(stream: io.BufferedIOBase, kind: bytes, payload: bytes = b"") -> None:
+    """Write one frame.
+
+    Args:
+        stream (io.BufferedIOBase): The connection.
+        kind (bytes): The kind of the frame.
+        payload (bytes): The payload of the frame. By default empty.
+    """
+    stream.write(FRAME_HEADER.pack(kind, len(payload)) + payload)
+    pass
+
+
+def read_frame(stream: io.BufferedIOBase) -> Optional[Tuple[bytes, bytes]]:
+    """Read one frame.
+
+    Args:
+        stream (io.BufferedIOBase): The connection.
+
+    Returns:
+        Optional[Tuple[bytes, bytes]]: The kind and payload of the
+        frame, or None if the connection closed or was reset.
+    """
+    try:
+        header = stream.read(FRAME_HEADER.size)
+        if len(header) < FRAME_HEADER.size:
+            return None
+        kind, length = FRAME_HEADER.unpack(header)
+        payload = stream.read(length)
+    except ConnectionError:
+        return None
+    if len(payload) < length:
+        return None
+    return kind, payload
+
+
+def _send_input(connection: socket.socket, source: BinaryIO) -> None:
+    """Send standard input to the daemon, then end the request.
+
+    Args:
+        connection (socket.socket): The connection.
+        source (BinaryIO): The input to send.
+    """
+    read = getattr(source, "read1", source.read)
+    try:
+        for chunk in iter(lambda: read(READ_SIZE), b""):
+            connection.sendall(chunk)
+        connection.shutdown(socket.SHUT_WR)
+    except OSError:
+        pass
+    pass
+
+
+def request(
+    args: List[str], path: str, stdin: BinaryIO, stdout: BinaryIO, stderr: BinaryIO
+) -> Optional[int]:
+    """Have the daemon run a command.
+
+    Sockets owned by another user are never connected to, so that they
+    cannot answer in the daemon's place.
+
+    Args:
+        args (List[str]): The command-line arguments.
+        path (str): The path of the daemon's socket.
+        stdin (BinaryIO): The input sent when the daemon asks for it.
+        stdout (BinaryIO): Receives the output.
+        stderr (BinaryIO): Receives error messages.
+
+    Returns:
+        Optional[int]: The status code to exit with, or None if the
+        daemon is not running or cannot run the command.
+    """
+    try:
+        if os.stat(path).st_uid != os.getuid():
+            return None
+    except OSError:
+        return None
+    try:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(path)
+    except OSError:
+        connection.close()
+        return None
+    with connection:
+        try:
+            connection.sendall(json.dumps({"args": args}).encode() + b"\n")
+        except ConnectionError:
+            return None
+        return _receive(connection, stdin, stdout, stderr)
+
+
+def _receive(
+    connection: socket.socket, stdin: BinaryIO, stdout: BinaryIO, stderr: BinaryIO
+) -> Optional[int]:
+    """Act on the frames of the daemon until it exits.
+
+    Args:
+        connection (socket.socket): The connection.
+        stdin (BinaryIO): The input sent when the daemon asks for it.
+        stdout (BinaryIO): Receives the output.
+        stderr (BinaryIO): Receives error messages.
+
+    Returns:
+        Optional[int]: The status code to exit with, or None if the
+        daemon cannot run the command.
+    """
+    stream = connection.makefile("rb")
+    while True:
+        frame = read_frame(stream)
+        if frame is None:
+            stderr.write(b"The daemon closed the connection.\n")
+            return 1
+        kind, payload = frame
+        if kind == FALLBACK:
+            return None
+        elif kind == SEND_INPUT:
+            threading.Thread(
+                target=_send_input, args=(connection, stdin), daemon=True
+            ).start()
+        elif kind == OUTPUT:
+            stdout.write(payload)
+        elif kind == ERROR:
+            stderr.write(payload)
+        else:
+            stdout.flush()
+            return int(payload)
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    """Run a command on the daemon, or in this process.
+
+    Args:
+        args (List[str], optional): The command-line arguments. By
+            default ``sys.argv[1:]``.
+    """
+    if args is None:
+        args = sys.argv[1:]
+    path = socket_path()
+    status = None
+    if path is not None:
+        status = request(
+            args, path, sys.stdin.buffer, sys.stdout.buffer, sys.stderr.buffer
+        )
+    if status is None:
+        from .cli import run
+
+        run(args)
+    elif status:
+        sys.exit(status)
+    pass
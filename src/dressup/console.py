@@ -1,5 +1,9 @@
 """Command-line interface."""
-from typing import Generator, Tuple
+from pathlib import Path
+import sys
+import time
+from typing import Generator, Iterable, List, NoReturn, Optional, Tuple
+import zlib
 
 import rich.box
 import rich.console
@@ -8,9 +12,14 @@ import rich.table
 import typer
 from typer import Context
 
-from . import __version__, converter, exceptions
+from . import __version__, cli, converter, exceptions, streaming
 
 app = typer.Typer()
+serve_app = typer.Typer()
+daemon_app = typer.Typer()
+build_tables_app = typer.Typer()
+
+OUTPUT_BUFFER_SIZE = 1024 * 1024
 
 
 def version_callback(value: bool) -> None:
@@ -41,20 +50,121 @@ def complete_type(
         (Generator): Arguments that match ``incomplete`` along
             with a preview of the conversion.
     """
-    if ctx.args:
-        sample_text = ctx.args[0]
-    else:
-        sample_text = "Dress Up!"
-    incomplete = converter.normalize_text(incomplete)
-    converted_incomplete = converter.show_all(
-        sample_text,
-        strict_case=ctx.params.get("strict_case", False),
-        reverse=ctx.params.get("reverse", False),
+    yield from cli.type_completions(
+        incomplete,
+        ctx.args[0] if ctx.args else None,
+        strict_case=bool(ctx.params.get("strict_case", False)),
+        reverse=bool(ctx.params.get("reverse", False)),
+    )
+
+
+def print_table(characters: str, strict_case: bool, reverse: bool) -> None:
+    """Print all possible conversions as a table.
+
+    Args:
+        characters (str): The characters to convert.
+        strict_case (bool): Whether to forbid case fallback.
+        reverse (bool): Whether to reverse the output.
+    """
+    console = rich.console.Console()
+    converted_characters = converter.show_all(
+        characters, strict_case=strict_case, reverse=reverse
     )
-    for unicode_type, converted_characters in converted_incomplete.items():
-        unicode_type = converter.normalize_text(unicode_type)
-        if unicode_type.startswith(incomplete):
-            yield (unicode_type.replace("_", "-"), converted_characters)
+    title_style = rich.style.Style(color="magenta", bold=True)
+    header_style = rich.style.Style(color="magenta")
+    border_style = rich.style.Style(color="magenta")
+    table = rich.table.Table(
+        title="Dress up",
+        title_style=title_style,
+        header_style=header_style,
+        border_style=border_style,
+        box=rich.box.ROUNDED,
+    )
+    for column_name in ("Style", "Conversion"):
+        table.add_column(column_name, justify="left")
+    for character_type, converted_character in converted_characters.items():
+        table.add_row(character_type, converted_character)
+    console.print(table)
+    pass
+
+
+def fail(message: str) -> NoReturn:
+    """Print an error message and exit with a status code of one.
+
+    Args:
+        message (str): The error message.
+
+    Raises:
+        Exit: Exits the command line interface.
+    """
+    typer.secho(message, fg=typer.colors.BRIGHT_RED)
+    raise typer.Exit(code=1)
+
+
+def write_chunks(chunks: Iterable[str], output_path: Optional[str]) -> None:
+    """Write chunks of text to a file or standard output.
+
+    Args:
+        chunks (Iterable[str]): The chunks to write.
+        output_path (Optional[str]): The path of the file. Writes to
+            standard output if None or "-".
+    """
+    if output_path is None or output_path == "-":
+        sys.stdout.writelines(chunks)
+        sys.stdout.flush()
+    else:
+        with open(
+            output_path, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE
+        ) as output_file:
+            output_file.writelines(chunks)
+    pass
+
+
+def convert_file(
+    input_path: str,
+    output_path: Optional[str],
+    unicode_type: str,
+    strict_case: bool,
+    reverse: bool,
+    jobs: int = 1,
+) -> None:
+    """Convert a file, or standard input, in chunks.
+
+    Args:
+        input_path (str): The path of the file, or "-" for standard
+            input.
+        output_path (Optional[str]): The path of the output file, or
+            None for standard output.
+        unicode_type (str): The Unicode type to convert to.
+        strict_case (bool): Whether to forbid case fallback.
+        reverse (bool): Whether to reverse the output.
+        jobs (int): The number of processes to convert with. By default
+            1.
+    """
+    try:
+        if jobs > 1:
+            from . import parallel
+
+            converted_chunks = parallel.convert_parallel(
+                streaming.read_text(input_path),
+                unicode_type=unicode_type,
+                strict_case=strict_case,
+                reverse=reverse,
+                jobs=jobs,
+            )
+        else:
+            converted_chunks = streaming.convert_stream(
+                streaming.read_text(input_path),
+                unicode_type=unicode_type,
+                strict_case=strict_case,
+                reverse=reverse,
+            )
+        write_chunks(converted_chunks, output_path)
+    except exceptions.InvalidUnicodeTypeError as error:
+        fail(str(error).replace("_", "-"))
+    except (OSError, UnicodeDecodeError, zlib.error) as error:
+        fail(f"Could not convert {input_path}: {error}")
+    pass
 
 
 # TODO: Add a command that lists all types
@@ -75,6 +185,25 @@ def main(
         help="The Unicode type to convert to.",
         autocompletion=complete_type,
     ),
+    input_path: str = typer.Option(
+        None,
+        "--input",
+        "-i",
+        help="Read the characters from a file, or - for standard input.",
+    ),
+    output_path: str = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Write the conversion to a file.",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="The number of processes to convert --input with.",
+    ),
     version: bool = typer.Option(
         None,
         "--version",
@@ -88,33 +217,22 @@ def main(
 
     If --type is specified, convert to a specific type.
     """
-    if characters is None:
+    if unicode_type is None and (input_path is not None or output_path is not None):
+        fail("--input and --output require --type.")
+    elif input_path is not None:
+        if characters is not None:
+            fail("Provide either characters or --input, not both.")
+        convert_file(
+            input_path, output_path, unicode_type, strict_case, reverse, jobs=jobs
+        )
+    elif characters is None:
         typer.echo("No characters provided to convert.")
         if unicode_type is not None or strict_case or reverse:
             raise typer.Exit(code=1)
         else:
             raise typer.Exit(code=0)
     elif unicode_type is None:
-        console = rich.console.Console()
-        converted_characters = converter.show_all(
-            characters, strict_case=strict_case, reverse=reverse
-        )
-        title_style = rich.style.Style(color="magenta", bold=True)
-        header_style = rich.style.Style(color="magenta")
-        border_style = rich.style.Style(color="magenta")
-        table = rich.table.Table(
-            title="Dress up",
-            title_style=title_style,
-            header_style=header_style,
-            border_style=border_style,
-            box=rich.box.ROUNDED,
-        )
-        for column_name in ("Style", "Conversion"):
-            table.add_column(column_name, justify="left")
-        for character_type, converted_character in converted_characters.items():
-            table.add_row(character_type, converted_character)
-        console.print(table)
-        pass
+        print_table(characters, strict_case=strict_case, reverse=reverse)
     else:
         try:
             converted_characters = converter.convert(
@@ -124,11 +242,88 @@ def main(
                 reverse=reverse,
             )
         except exceptions.InvalidUnicodeTypeError as error:
-            exception_message = str(error).replace("_", "-")
-            typer.secho(
-                exception_message,
-                fg=typer.colors.BRIGHT_RED,
-            )
-            raise typer.Exit(code=1) from error
-        typer.echo(converted_characters)
+            fail(str(error).replace("_", "-"))
+        if output_path is None:
+            typer.echo(converted_characters)
+        else:
+            write_chunks([converted_characters], output_path)
+    pass
+
+
+@serve_app.command()
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="The address to listen on."),
+    port: int = typer.Option(8000, "--port", "-p", help="The port to listen on."),
+    max_body_size: int = typer.Option(
+        None,
+        "--max-body-size",
+        min=1,
+        help="The largest accepted request body, in bytes. By default 1 MiB.",
+    ),
+) -> None:
+    """Serve conversions over HTTP."""
+    from . import server
+
+    try:
+        server.serve(host, port, max_body_size=max_body_size or server.MAX_BODY_SIZE)
+    except KeyboardInterrupt:
+        pass
+    except OSError as error:
+        fail(f"Could not serve on {host}:{port}: {error}")
+    pass
+
+
+@daemon_app.command()
+def daemon(
+    socket_path: str = typer.Option(
+        None,
+        "--socket",
+        help="The path of the Unix socket. By default $DRESSUP_SOCKET.",
+    ),
+) -> None:
+    """Convert for dressup-client from a warm process."""
+    from . import client
+    from . import daemon as daemon_module
+
+    path = socket_path or client.socket_path()
+    if path is None:
+        fail("Unix sockets are not supported on this platform.")
+    try:
+        daemon_module.run(path)
+    except KeyboardInterrupt:
         pass
+    except OSError as error:
+        fail(f"Could not listen on {path}: {error}")
+    pass
+
+
+@build_tables_app.command()
+def build_tables(
+    sources: List[Path] = typer.Argument(
+        ..., help="TOML or text files of character mappings."
+    ),
+    toml_path: Path = typer.Option(..., "--toml", help="The translator.toml to write."),
+    artifact_path: Path = typer.Option(
+        ..., "--artifact", help="The precompiled tables to write."
+    ),
+    force: bool = typer.Option(
+        False, "--force", "-f", help="Compile styles that did not change."
+    ),
+) -> None:
+    """Compile character mappings into translator.toml and its tables."""
+    from . import build
+
+    start = time.perf_counter()
+    try:
+        timings = build.build_tables(sources, toml_path, artifact_path, force=force)
+    except (exceptions.InvalidSourceError, OSError) as error:
+        fail(str(error))
+    for unicode_type, seconds in timings.items():
+        status = "unchanged" if seconds is None else f"{seconds * 1000:.1f} ms"
+        typer.echo(f"{unicode_type.replace('_', '-'):<24} {status}")
+    compiled_count = sum(seconds is not None for seconds in timings.values())
+    typer.echo(
+        f"Compiled {compiled_count} of {len(timings)} styles"
+        f" in {(time.perf_counter() - start) * 1000:.1f} ms."
+    )
+    pass
@@ -1,11 +1,39 @@
 """Convert Unicode characters."""
-import pathlib
+import codecs
+import collections
+import functools
+import os
 import re
-from typing import Any, Dict, MutableMapping, Optional
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import (
+    Any,
+    cast,
+    Dict,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+import unicodedata
+import zlib
 
-import toml
+from . import cache, exceptions, metrics
 
-from . import exceptions
+TOML_PATH = os.path.join(os.path.dirname(__file__), "translator.toml")
+BATCH_SENTINEL = "\x00"
+PREVIEW_TEXT = "Dress Up!"
+ARRAY_SIZE = 256
+SUFFIX_KEY = "suffix"
+# Lazily filled tables stop storing unchanged code points once they hold
+# this many entries, so they stay bounded whatever text they convert.
+MAX_TABLE_SIZE = 4096
 
 
 class Translator(dict):
@@ -17,15 +45,26 @@ class Translator(dict):
         strict_case (bool): Whether to forbid characters from being
             converted to an upper or lower case counterpart if an exact
             match is not found. By default set to False.
+        unicode_type (str, optional): The Unicode type name used to label
+            fallback metrics. Optional.
+        case_folded (bool): Whether ``items`` already include the case
+            fallback of every character, so that missing keys are
+            returned unchanged. By default set to False.
     """
 
     def __init__(
-        self, items: Optional[Dict[str, str]] = None, strict_case: bool = False
+        self,
+        items: Optional[Dict[str, str]] = None,
+        strict_case: bool = False,
+        unicode_type: Optional[str] = None,
+        case_folded: bool = False,
     ) -> None:
         """Constructor."""
         if items is not None:
             self.update(items)
         self.strict_case = strict_case
+        self.unicode_type = unicode_type
+        self.case_folded = case_folded
         pass
 
     def __repr__(self) -> str:
@@ -42,9 +81,10 @@ class Translator(dict):
     def __missing__(self, key: str) -> str:
         """Return value in the case of a missing key.
 
-        If ``strict_case`` is True, will return the key itself. If
-        False, will first try to return a value matching the upper or
-        lowercase variant of the key.
+        If ``strict_case`` or ``case_folded`` is True, will return the
+        key itself. If False, will first try to return a value matching
+        the upper or lowercase variant of the key. Keys of a style with a
+        suffix rule are returned followed by the suffix instead.
 
         Args:
             key (str): The key missing from Translator.
@@ -52,41 +92,1080 @@ class Translator(dict):
         Returns:
             str: The returned value.
         """
-        if self.strict_case:
+        if SUFFIX_KEY in self:
+            return key + self[SUFFIX_KEY] if takes_suffix(key) else key
+        if self.strict_case or self.case_folded:
+            fallback_key = None
+        elif key.upper() in self:
+            fallback_key = key.upper()
+        elif key.lower() in self:
+            fallback_key = key.lower()
+        else:
+            fallback_key = None
+        if metrics.enabled:
+            metrics.increment(
+                "unmapped_characters_total"
+                if fallback_key is None
+                else "case_fallbacks_total",
+                unicode_type=self.unicode_type or "",
+            )
+        if fallback_key is None:
             return key
+        return self[fallback_key]
+
+
+def source_checksum(source: bytes) -> int:
+    """Return the checksum used to detect stale precompiled tables.
+
+    Args:
+        source (bytes): The contents of ``translator.toml``.
+
+    Returns:
+        int: The CRC-32 checksum of ``source``.
+    """
+    return zlib.crc32(source)
+
+
+def _read_source() -> bytes:
+    """Read the contents of the config file.
+
+    Returns:
+        bytes: The contents of ``translator.toml``.
+    """
+    with open(TOML_PATH, "rb") as toml_file:
+        return toml_file.read()
+
+
+def _load_artifact() -> Optional[ModuleType]:
+    """Import the precompiled tables if they match the config file.
+
+    Returns:
+        Optional[ModuleType]: The generated ``translator_tables``
+        module, or None if it is missing or was generated from a
+        different ``translator.toml``.
+    """
+    try:
+        from . import translator_tables
+    except ImportError:
+        return None
+    try:
+        source = _read_source()
+    except FileNotFoundError:
+        return translator_tables
+    if source_checksum(source) != translator_tables.SOURCE_CHECKSUM:
+        return None
+    return translator_tables
+
+
+def _load_mappings() -> MutableMapping[str, Any]:
+    """Load the raw character mappings from the config file.
+
+    ``toml`` is imported here so that it is only loaded when the
+    precompiled tables cannot be used.
+
+    Returns:
+        MutableMapping[str, Any]: A dictionary where the keys are the
+        unicode type, and the values are dictionaries whose keys are
+        typical characters and whose values are their converted
+        unicode.
+    """
+    import toml
+
+    toml_text = _read_source().decode("utf-8")
+    return toml.loads(toml_text)
+
+
+def _read_translator(strict_case: bool = False) -> MutableMapping[str, Any]:
+    """Read translator from config file.
+
+    Args:
+        strict_case (bool): Whether to forbid characters from being
+            converted to an upper or lower case counterpart if an exact
+            match is not found. By default set to False.
+
+    Returns:
+        MutableMapping[str, Any]: A dictionary where the keys are the
+        unicode type, and the values are nested dictionaries with the
+        keys are typical characters and the values are their
+        converted unicode.
+    """
+    unicode_mapping = _load_mappings()
+    translator = {
+        unicode_type: Translator(unicode_mapping[unicode_type], strict_case=strict_case)
+        for unicode_type in unicode_mapping
+    }
+    return translator
+
+
+class TomlIndex:
+    """Index of the sections of a TOML file of character mappings.
+
+    The byte offset of every ``[section]`` header is recorded once, so
+    that the Unicode type names can be listed without parsing any
+    tables, and single sections can be parsed on demand.
+
+    Attributes:
+        source (bytes): The contents of the TOML file.
+        offsets (Dict[str, Tuple[int, int]]): The start and end byte
+            offsets of each section, keyed by the section name.
+    """
+
+    _header_pattern = re.compile(
+        rb"^\[[ \t]*([A-Za-z0-9_-]+)[ \t]*\][ \t]*\r?$", re.MULTILINE
+    )
+
+    def __init__(self, source: bytes) -> None:
+        """Constructor."""
+        self.source = source
+        headers = list(self._header_pattern.finditer(source))
+        ends = [header.start() for header in headers[1:]] + [len(source)]
+        self.offsets = {
+            header.group(1).decode("utf-8"): (header.start(), end)
+            for header, end in zip(headers, ends)
+        }
+        pass
+
+    def names(self) -> List[str]:
+        """Return the section names in the order they appear.
+
+        Returns:
+            List[str]: The section names.
+        """
+        return list(self.offsets)
+
+    def load(self, unicode_type: str) -> Dict[str, str]:
+        """Parse a single section.
+
+        Args:
+            unicode_type (str): The name of the section.
+
+        Returns:
+            Dict[str, str]: The characters and their converted
+            counterparts.
+
+        Raises:
+            KeyError: If the section does not exist.
+        """
+        import toml
+
+        try:
+            start, end = self.offsets[unicode_type]
+        except KeyError:
+            raise KeyError(unicode_type) from None
+        section = toml.loads(self.source[start:end].decode("utf-8"))
+        return section[unicode_type]
+
+
+def compile_table(mapping: Dict[str, str]) -> Dict[int, str]:
+    """Compile a character mapping to a ``str.translate`` table.
+
+    Args:
+        mapping (Dict[str, str]): The characters and their converted
+            counterparts.
+
+    Returns:
+        Dict[int, str]: A dictionary where the keys are the code points
+        of the characters and the values are the converted characters.
+        A suffix rule is left out.
+    """
+    return {
+        ord(character): value
+        for character, value in mapping.items()
+        if character != SUFFIX_KEY
+    }
+
+
+def takes_suffix(character: str) -> bool:
+    """Return whether a suffix rule applies to a character.
+
+    Letters, numbers, punctuation and symbols take the suffix, while
+    whitespace, control characters and combining marks are kept
+    unchanged, so that marks never stack on a line break or on each
+    other.
+
+    Args:
+        character (str): A single character.
+
+    Returns:
+        bool: True if the suffix is appended to ``character``.
+    """
+    return unicodedata.category(character)[0] in "LNPS"
+
+
+class SuffixTable(dict):
+    """Translation table for ``str.translate`` with a suffix rule.
+
+    Mapped code points are converted to their value, and every other
+    character that ``takes_suffix`` is converted to itself followed by
+    the suffix, such as a combining strikethrough. Code points are
+    resolved the first time they are looked up and stored in the table,
+    so later lookups are a single dictionary access, as in
+    ``CaseFallbackTable``, until it holds ``MAX_TABLE_SIZE`` entries.
+    Past that they are resolved on every lookup, so that the table stays
+    bounded.
+
+    Attributes:
+        suffix (str): The characters appended to each character.
+    """
+
+    def __init__(self, mapping: Dict[str, str]) -> None:
+        """Constructor."""
+        super().__init__(compile_table(mapping))
+        self.suffix = mapping[SUFFIX_KEY]
+        pass
+
+    def __missing__(self, codepoint: int) -> str:
+        """Resolve the value of a missing code point.
+
+        Args:
+            codepoint (int): The code point missing from the table.
+
+        Returns:
+            str: The character followed by the suffix, or the character
+            itself if the suffix does not apply to it.
+
+        Raises:
+            KeyError: Raised if the character is kept unchanged and not
+                stored, so that ``str.translate`` leaves it as is.
+        """
+        character = chr(codepoint)
+        value = character + self.suffix if takes_suffix(character) else character
+        if len(self) < MAX_TABLE_SIZE:
+            self[codepoint] = value
+        elif value == character:
+            raise KeyError(codepoint)
+        return value
+
+
+class CodepointArray(list):
+    """Translation table for ``str.translate`` stored as an array.
+
+    Item ``n`` is the converted character of code point ``n``, for every
+    code point below ``ARRAY_SIZE``, so a lookup is plain indexing.
+    Unmapped code points hold the character itself, and ``str.translate``
+    leaves code points past the end of the array unchanged. Values are
+    interned, so an output shared by several tables is stored once.
+    """
+
+    pass
+
+
+TranslationTable = Union[Dict[int, str], CodepointArray]
+Style = Union[str, Tuple[str, ...]]
+
+
+def compile_array_table(mapping: Dict[str, str]) -> TranslationTable:
+    """Compile a character mapping to an array-backed translation table.
+
+    Args:
+        mapping (Dict[str, str]): The characters and their converted
+            counterparts.
+
+    Returns:
+        TranslationTable: A ``CodepointArray`` if every character is
+        below ``ARRAY_SIZE``, otherwise the dictionary returned by
+        ``compile_table``.
+    """
+    table = compile_table(mapping)
+    if any(codepoint >= ARRAY_SIZE for codepoint in table):
+        return table
+    return CodepointArray(
+        sys.intern(table.get(codepoint, chr(codepoint)))
+        for codepoint in range(ARRAY_SIZE)
+    )
+
+
+def compile_inverse_table(
+    mappings: Iterable[Dict[str, str]], keep_ascii: bool = False
+) -> Dict[int, str]:
+    """Compile character mappings to a table that undoes them.
+
+    A converted character that several mappings decode to different
+    characters is ambiguous and is left out of the table, so that it is
+    kept unchanged. A single code point suffix is removed.
+
+    Args:
+        mappings (Iterable[Dict[str, str]]): The characters and their
+            converted counterparts, for one or more Unicode types.
+        keep_ascii (bool): Whether to leave out converted characters
+            that are ASCII, so that plain text is never changed. By
+            default False.
+
+    Returns:
+        Dict[int, str]: A dictionary where the keys are the code points
+        of the converted characters and the values are the characters
+        they were converted from.
+    """
+    table: Dict[int, str] = {}
+    ambiguous = set()
+    for mapping in mappings:
+        for character, value in mapping.items():
+            if character == SUFFIX_KEY:
+                character = ""
+            if value == character or len(value) != 1:
+                continue
+            if keep_ascii and value.isascii():
+                continue
+            codepoint = ord(value)
+            if table.setdefault(codepoint, character) != character:
+                ambiguous.add(codepoint)
+    for codepoint in ambiguous:
+        del table[codepoint]
+    return table
+
+
+def compile_style_index(mappings: Iterable[Dict[str, str]]) -> Dict[int, int]:
+    """Index the Unicode types that produce each converted character.
+
+    ASCII characters and characters that a mapping leaves unchanged are
+    not indexed, so that plain text is not attributed to any type. A
+    single code point suffix is indexed like a converted character.
+
+    Args:
+        mappings (Iterable[Dict[str, str]]): The characters and their
+            converted counterparts, one mapping per Unicode type.
+
+    Returns:
+        Dict[int, int]: A dictionary where the keys are the code points
+        of the converted characters and the values are bitmasks whose
+        bit ``n`` is set if the ``n``-th mapping produces the character.
+    """
+    index: Dict[int, int] = {}
+    for bit, mapping in enumerate(mappings):
+        for character, value in mapping.items():
+            if value == character or len(value) != 1 or value.isascii():
+                continue
+            codepoint = ord(value)
+            index[codepoint] = index.get(codepoint, 0) | 1 << bit
+    return index
+
+
+def case_variants() -> Dict[str, List[str]]:
+    """Index every character by its upper and lower case counterparts.
+
+    Every code point is scanned, which takes most of a second, so this
+    is only called when building the precompiled tables.
+
+    Returns:
+        Dict[str, List[str]]: A dictionary where the keys are upper or
+        lower case strings and the values are the characters whose
+        ``str.upper`` or ``str.lower`` returns them.
+    """
+    variants: Dict[str, List[str]] = {}
+    for codepoint in range(sys.maxunicode + 1):
+        character = chr(codepoint)
+        upper = character.upper()
+        lower = character.lower()
+        if upper != character:
+            variants.setdefault(upper, []).append(character)
+        if lower not in (character, upper):
+            variants.setdefault(lower, []).append(character)
+    return variants
+
+
+def compile_case_fallbacks(
+    mapping: Dict[str, str], variants: Dict[str, List[str]]
+) -> Dict[int, str]:
+    """Resolve the case fallback of every unmapped character.
+
+    Args:
+        mapping (Dict[str, str]): The characters and their converted
+            counterparts.
+        variants (Dict[str, List[str]]): The result of
+            ``case_variants``.
+
+    Returns:
+        Dict[int, str]: A dictionary where the keys are the code points
+        of unmapped characters whose upper or lower case counterpart is
+        mapped, and the values are the converted counterpart, preferring
+        the upper case one.
+    """
+    case_fallbacks = {}
+    for key in mapping:
+        for character in variants.get(key, ()):
+            if character not in mapping:
+                case_fallbacks[ord(character)] = mapping.get(
+                    character.upper(), mapping.get(character.lower(), character)
+                )
+    return dict(sorted(case_fallbacks.items()))
+
+
+class CaseFallbackTable(dict):
+    """Translation table for ``str.translate`` with case fallback.
+
+    Keys are Unicode code points and values are their converted
+    characters. When ``case_fallbacks`` are given, the table holds every
+    case fallback from the start. Otherwise code points without an exact
+    match are resolved to the value of their upper or lower case
+    counterpart the first time they are looked up, and stored. Unchanged
+    code points are only stored until the table holds ``MAX_TABLE_SIZE``
+    entries, so that it stays bounded whatever text it converts.
+
+    Attributes:
+        mapping (Dict[str, str]): The characters and their converted
+            counterparts.
+        case_fallbacks (Dict[int, str], optional): The result of
+            ``compile_case_fallbacks`` for ``mapping``. Optional.
+    """
+
+    def __init__(
+        self,
+        mapping: Dict[str, str],
+        case_fallbacks: Optional[Dict[int, str]] = None,
+    ) -> None:
+        """Constructor."""
+        super().__init__(compile_table(mapping))
+        self.mapping = mapping
+        self.case_fallbacks = case_fallbacks
+        if case_fallbacks is not None:
+            self.update(case_fallbacks)
+        pass
+
+    def __missing__(self, codepoint: int) -> str:
+        """Resolve the value of a missing code point.
+
+        Args:
+            codepoint (int): The code point missing from the table.
+
+        Returns:
+            str: The converted upper or lower case counterpart, or the
+            character itself if neither is mapped.
+
+        Raises:
+            KeyError: Raised if the character is kept unchanged and not
+                stored, so that ``str.translate`` leaves it as is.
+        """
+        character = chr(codepoint)
+        if self.case_fallbacks is None:
+            value = self.mapping.get(
+                character.upper(), self.mapping.get(character.lower(), character)
+            )
         else:
-            if key.upper() in self:
-                return self[key.upper()]
-            elif key.lower() in self:
-                return self[key.lower()]
+            value = character
+        if value == character and len(self) >= MAX_TABLE_SIZE:
+            raise KeyError(codepoint)
+        self[codepoint] = value
+        return value
+
+
+def _translate_stages(characters: str, tables: Sequence[TranslationTable]) -> str:
+    """Translate characters with each table in turn.
+
+    Args:
+        characters (str): The characters to translate.
+        tables (Sequence[TranslationTable]): The translation tables, in
+            the order they are applied.
+
+    Returns:
+        str: The translated characters.
+    """
+    for table in tables:
+        characters = characters.translate(table)
+    return characters
+
+
+class PipelineTable(dict):
+    """Translation table for ``str.translate`` fusing several tables.
+
+    Every code point that one of the tables maps is converted through
+    all of them once, when the table is built. Other code points are
+    resolved when they are looked up, so that case fallbacks and suffix
+    rules still apply, and stored in the table like the others until it
+    holds ``MAX_TABLE_SIZE`` entries.
+
+    Attributes:
+        tables (List[TranslationTable]): The fused translation tables,
+            in the order they are applied.
+    """
+
+    def __init__(self, tables: Sequence[TranslationTable]) -> None:
+        """Constructor."""
+        super().__init__()
+        self.tables = list(tables)
+        codepoints: Set[int] = set()
+        for table in self.tables:
+            codepoints.update(
+                range(len(table)) if isinstance(table, CodepointArray) else table
+            )
+        for codepoint in sorted(codepoints):
+            self[codepoint] = _translate_stages(chr(codepoint), self.tables)
+        pass
+
+    def __missing__(self, codepoint: int) -> str:
+        """Resolve the value of a missing code point.
+
+        Args:
+            codepoint (int): The code point missing from the table.
+
+        Returns:
+            str: The character converted through every table.
+
+        Raises:
+            KeyError: Raised if the character is kept unchanged and not
+                stored, so that ``str.translate`` leaves it as is.
+        """
+        character = chr(codepoint)
+        value = _translate_stages(character, self.tables)
+        if len(self) < MAX_TABLE_SIZE:
+            self[codepoint] = value
+        elif value == character:
+            raise KeyError(codepoint)
+        return value
+
+
+def compile_pipeline_table(tables: Sequence[TranslationTable]) -> TranslationTable:
+    """Fuse translation tables applied one after another into one table.
+
+    Args:
+        tables (Sequence[TranslationTable]): The translation tables, in
+            the order they are applied.
+
+    Returns:
+        TranslationTable: A ``CodepointArray`` if every table is one,
+        otherwise a ``PipelineTable``. Translating with it is the same
+        as translating with each table in turn.
+    """
+    if all(isinstance(table, CodepointArray) for table in tables):
+        return CodepointArray(
+            sys.intern(_translate_stages(chr(codepoint), tables))
+            for codepoint in range(ARRAY_SIZE)
+        )
+    return PipelineTable(tables)
+
+
+class Utf8Table(dict):
+    """Encoding map for ``codecs.charmap_encode`` that also converts.
+
+    Keys are Unicode code points and values are the UTF-8 bytes of their
+    converted characters, so that encoding text with the map converts it
+    and encodes it in a single pass, without building the converted
+    string. Every ASCII code point is encoded when the map is built.
+    Other code points are encoded when they are looked up, and stored
+    until the map holds ``MAX_TABLE_SIZE`` entries, so that it stays
+    bounded.
+    Code points that the translation table leaves unchanged are encoded
+    to their own UTF-8 bytes.
+
+    Attributes:
+        table (TranslationTable): The translation table to convert with.
+    """
+
+    def __init__(self, table: TranslationTable) -> None:
+        """Constructor."""
+        super().__init__()
+        self.table = table
+        for codepoint in range(128):
+            self[codepoint] = chr(codepoint).translate(table).encode("utf-8")
+        pass
+
+    def __missing__(self, codepoint: int) -> bytes:
+        """Resolve the bytes of a missing code point.
+
+        Args:
+            codepoint (int): The code point missing from the map.
+
+        Returns:
+            bytes: The UTF-8 bytes of the converted character.
+        """
+        value = chr(codepoint).translate(self.table).encode("utf-8")
+        if len(self) < MAX_TABLE_SIZE:
+            self[codepoint] = value
+        return value
+
+
+class TranslatorRegistry:
+    """Process-wide registry of compiled Translator objects.
+
+    Each Unicode type is loaded and compiled the first time it is
+    requested, and the resulting Translator objects and translation
+    tables are reused by every later call. Mappings come from the
+    precompiled ``translator_tables`` module when it is up to date.
+    Otherwise ``translator.toml`` is indexed once and only the requested
+    sections are parsed. Building is guarded by a lock, so concurrent
+    first calls only load each Unicode type once.
+    """
+
+    _kinds = ("translator", "table", "preview")
+
+    def __init__(self) -> None:
+        """Constructor."""
+        self._lock = threading.RLock()
+        self._source: Optional[Union[ModuleType, TomlIndex]] = None
+        self._names: Optional[List[str]] = None
+        self._mappings: Dict[str, Dict[str, str]] = {}
+        self._cache: Dict[Tuple[str, bool], Dict[str, Any]] = {
+            (kind, strict_case): {}
+            for kind in self._kinds
+            for strict_case in (False, True)
+        }
+        self._inverse: Dict[Optional[str], Dict[int, str]] = {}
+        self._pipelines: Dict[Tuple[Tuple[str, ...], bool], TranslationTable] = {}
+        self._utf8_tables: Dict[Tuple[Style, bool], Utf8Table] = {}
+        self._style_index: Optional[Dict[int, int]] = None
+        self._prefixes: Optional[Dict[str, List[str]]] = None
+
+    def _open(self) -> Union[ModuleType, TomlIndex]:
+        """Locate the mappings, preferring the precompiled tables.
+
+        Must be called while holding the lock.
+
+        Returns:
+            Union[ModuleType, TomlIndex]: The ``translator_tables``
+            module if it is up to date, otherwise an index of
+            ``translator.toml``.
+        """
+        if self._source is None:
+            start = time.perf_counter()
+            artifact = _load_artifact()
+            if artifact is None:
+                self._source = TomlIndex(_read_source())
             else:
-                return key
+                self._source = artifact
+            if metrics.enabled:
+                source_name = "toml" if artifact is None else "artifact"
+                metrics.increment("source_loads_total", source=source_name)
+                metrics.observe(
+                    "source_load_seconds",
+                    time.perf_counter() - start,
+                    source=source_name,
+                )
+        return self._source
+
+    def names(self) -> List[str]:
+        """Return the name of every Unicode type without parsing them.
+
+        Returns:
+            List[str]: The Unicode type names.
+        """
+        if self._names is None:
+            with self._lock:
+                source = self._open()
+                if isinstance(source, TomlIndex):
+                    self._names = source.names()
+                else:
+                    self._names = list(source.MAPPINGS)
+        return list(self._names)
+
+    def names_with_prefix(self, prefix: str) -> List[str]:
+        """Return the Unicode type names that start with a prefix.
+
+        Every prefix of every name is indexed the first time this is
+        called, so later lookups are a single dictionary access.
+
+        Args:
+            prefix (str): The normalized start of a Unicode type name.
+
+        Returns:
+            List[str]: The matching Unicode type names.
+        """
+        if self._prefixes is None:
+            prefixes: Dict[str, List[str]] = {}
+            for unicode_type in self.names():
+                for end in range(len(unicode_type) + 1):
+                    prefixes.setdefault(unicode_type[:end], []).append(unicode_type)
+            self._prefixes = prefixes
+        return list(self._prefixes.get(prefix, ()))
+
+    def _mapping(self, unicode_type: str) -> Dict[str, str]:
+        """Load the raw character mapping of a Unicode type.
+
+        Must be called while holding the lock.
+
+        Args:
+            unicode_type (str): The normalized Unicode type name.
+
+        Returns:
+            Dict[str, str]: The characters and their converted
+            counterparts.
+        """
+        if unicode_type not in self._mappings:
+            source = self._open()
+            if isinstance(source, TomlIndex):
+                mapping = source.load(unicode_type)
+            else:
+                mapping = source.MAPPINGS[unicode_type]
+            self._mappings[unicode_type] = mapping
+        return self._mappings[unicode_type]
+
+    def mapping(self, unicode_type: str) -> Dict[str, str]:
+        """Return the raw character mapping of a Unicode type.
+
+        Args:
+            unicode_type (str): The normalized Unicode type name.
+
+        Returns:
+            Dict[str, str]: The characters and their converted
+            counterparts.
+
+        Raises:
+            KeyError: If ``unicode_type`` does not exist.
+        """  # noqa: DAR402
+        try:
+            return self._mappings[unicode_type]
+        except KeyError:
+            pass
+        with self._lock:
+            return self._mapping(unicode_type)
+
+    def _case_fallbacks(self, unicode_type: str) -> Optional[Dict[int, str]]:
+        """Return the precompiled case fallbacks of a Unicode type.
+
+        Must be called while holding the lock.
+
+        Args:
+            unicode_type (str): The normalized Unicode type name.
+
+        Returns:
+            Optional[Dict[int, str]]: The case fallbacks, or None if the
+            precompiled tables are not used, in which case fallbacks are
+            resolved on first use.
+        """
+        source = self._open()
+        if isinstance(source, TomlIndex):
+            return None
+        return source.CASE_FALLBACKS[unicode_type]
+
+    def _compile(
+        self, kind: str, unicode_type: str, strict_case: bool
+    ) -> Union[Translator, TranslationTable, str]:
+        """Compile one kind of object for a Unicode type.
+
+        Must be called while holding the lock.
+
+        Args:
+            kind (str): Either "translator", "table" or "preview".
+            unicode_type (str): The normalized Unicode type name.
+            strict_case (bool): Whether to forbid case fallback.
+
+        Returns:
+            Union[Translator, TranslationTable, str]: The Translator,
+            translation table, or conversion of ``PREVIEW_TEXT``.
+        """
+        mapping = self._mapping(unicode_type)
+        source = self._open()
+        if kind == "preview":
+            if isinstance(source, TomlIndex):
+                table = self.table(unicode_type, strict_case=strict_case)
+                return PREVIEW_TEXT.translate(table)
+            elif strict_case:
+                return source.STRICT_PREVIEWS[PREVIEW_TEXT][unicode_type]
+            else:
+                return source.PREVIEWS[PREVIEW_TEXT][unicode_type]
+        elif SUFFIX_KEY in mapping:
+            if kind == "translator":
+                return Translator(
+                    mapping, strict_case=strict_case, unicode_type=unicode_type
+                )
+            return SuffixTable(mapping)
+        elif strict_case:
+            if kind == "translator":
+                return Translator(mapping, strict_case=True, unicode_type=unicode_type)
+            return compile_array_table(mapping)
+        case_fallbacks = self._case_fallbacks(unicode_type)
+        if kind == "table":
+            return CaseFallbackTable(mapping, case_fallbacks)
+        elif case_fallbacks is None:
+            return Translator(mapping, unicode_type=unicode_type)
+        else:
+            items = {
+                **mapping,
+                **{
+                    chr(codepoint): value for codepoint, value in case_fallbacks.items()
+                },
+            }
+            return Translator(items, unicode_type=unicode_type, case_folded=True)
+
+    def _get(
+        self, kind: str, unicode_type: str, strict_case: bool
+    ) -> Union[Translator, TranslationTable, str]:
+        """Return a cached object, compiling it on first use.
+
+        Args:
+            kind (str): Either "translator", "table" or "preview".
+            unicode_type (str): The normalized Unicode type name.
+            strict_case (bool): Whether to forbid case fallback.
+
+        Returns:
+            Union[Translator, TranslationTable, str]: The Translator,
+            translation table, or conversion of ``PREVIEW_TEXT``.
+        """
+        strict_case = bool(strict_case)
+        compiled_objects = self._cache[kind, strict_case]
+        try:
+            compiled = compiled_objects[unicode_type]
+        except KeyError:
+            pass
+        else:
+            if metrics.enabled:
+                metrics.increment("cache_hits_total", kind=kind)
+            return compiled
+        with self._lock:
+            if unicode_type not in compiled_objects:
+                start = time.perf_counter()
+                compiled_objects[unicode_type] = self._compile(
+                    kind, unicode_type, strict_case
+                )
+                if metrics.enabled:
+                    metrics.increment("cache_misses_total", kind=kind)
+                    metrics.increment(
+                        "table_loads_total", kind=kind, unicode_type=unicode_type
+                    )
+                    metrics.observe(
+                        "table_load_seconds", time.perf_counter() - start, kind=kind
+                    )
+            return compiled_objects[unicode_type]
+
+    def translator(self, unicode_type: str, strict_case: bool = False) -> Translator:
+        """Return the translator for a Unicode type.
+
+        Args:
+            unicode_type (str): The normalized Unicode type name.
+            strict_case (bool): Whether the returned translator forbids
+                characters from being converted to an upper or lower case
+                counterpart if an exact match is not found. By default
+                False.
+
+        Returns:
+            Translator: The translator of ``unicode_type``.
+
+        Raises:
+            KeyError: If ``unicode_type`` does not exist.
+        """  # noqa: DAR402
+        return cast(Translator, self._get("translator", unicode_type, strict_case))
+
+    def table(self, unicode_type: str, strict_case: bool = False) -> TranslationTable:
+        """Return the ``str.translate`` table for a Unicode type.
+
+        Strict case tables of mappings within ``ARRAY_SIZE`` are
+        ``CodepointArray`` objects, and tables of styles with a suffix
+        rule are ``SuffixTable`` objects whatever the case.
+
+        Args:
+            unicode_type (str): The normalized Unicode type name.
+            strict_case (bool): Whether the returned table forbids
+                characters from being converted to an upper or lower case
+                counterpart if an exact match is not found. By default
+                False.
+
+        Returns:
+            TranslationTable: The translation table of ``unicode_type``.
+
+        Raises:
+            KeyError: If ``unicode_type`` does not exist.
+        """  # noqa: DAR402
+        return cast(TranslationTable, self._get("table", unicode_type, strict_case))
+
+    def preview(self, unicode_type: str, strict_case: bool = False) -> str:
+        """Return the conversion of ``PREVIEW_TEXT`` to a Unicode type.
+
+        Previews are read from the precompiled tables when they are up
+        to date, without compiling any translation table.
+
+        Args:
+            unicode_type (str): The normalized Unicode type name.
+            strict_case (bool): Whether the preview forbids case
+                fallback. By default False.
+
+        Returns:
+            str: The converted ``PREVIEW_TEXT``.
+
+        Raises:
+            KeyError: If ``unicode_type`` does not exist.
+        """  # noqa: DAR402
+        return cast(str, self._get("preview", unicode_type, strict_case))
+
+    def pipeline_table(
+        self, unicode_types: Tuple[str, ...], strict_case: bool = False
+    ) -> TranslationTable:
+        """Return the fused ``str.translate`` table of a pipeline.
+
+        Args:
+            unicode_types (Tuple[str, ...]): The normalized Unicode type
+                names, in the order they are applied.
+            strict_case (bool): Whether the table forbids case fallback.
+                By default False.
+
+        Returns:
+            TranslationTable: The result of ``compile_pipeline_table``
+            for the tables of ``unicode_types``.
+
+        Raises:
+            KeyError: If a Unicode type does not exist.
+        """  # noqa: DAR402
+        key = (unicode_types, bool(strict_case))
+        try:
+            return self._pipelines[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._pipelines:
+                self._pipelines[key] = compile_pipeline_table(
+                    [
+                        self.table(unicode_type, strict_case=strict_case)
+                        for unicode_type in unicode_types
+                    ]
+                )
+            return self._pipelines[key]
+
+    def utf8_table(self, unicode_type: Style, strict_case: bool = False) -> Utf8Table:
+        """Return the encoding map that converts to a Unicode type.
+
+        Args:
+            unicode_type (Style): The normalized Unicode type name, or a
+                tuple of them for a pipeline.
+            strict_case (bool): Whether the map forbids case fallback.
+                By default False.
+
+        Returns:
+            Utf8Table: The encoding map of ``unicode_type``.
 
+        Raises:
+            KeyError: If a Unicode type does not exist.
+        """  # noqa: DAR402
+        key = (unicode_type, bool(strict_case))
+        try:
+            return self._utf8_tables[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._utf8_tables:
+                if isinstance(unicode_type, str):
+                    table = self.table(unicode_type, strict_case=strict_case)
+                else:
+                    table = self.pipeline_table(unicode_type, strict_case=strict_case)
+                self._utf8_tables[key] = Utf8Table(table)
+            return self._utf8_tables[key]
 
-def _read_translator(strict_case: bool = False) -> MutableMapping[str, Any]:
-    """Read translator from config file.
+    def inverse(self, unicode_type: Optional[str] = None) -> Dict[int, str]:
+        """Return the ``str.translate`` table that undoes a conversion.
 
-    Args:
-        strict_case (bool): Whether to forbid characters from being
-            converted to an upper or lower case counterpart if an exact
-            match is not found. By default set to False.
+        Args:
+            unicode_type (str, optional): The normalized Unicode type
+                name. If None, the returned table undoes every Unicode
+                type at once, leaving ASCII and ambiguous characters
+                unchanged.
 
-    Returns:
-        MutableMapping[str, Any]: A dictionary where the keys are the
-        unicode type, and the values are nested dictionaries with the
-        keys are typical characters and the values are their
-        converted unicode.
-    """
-    toml_path = pathlib.Path(__file__).parent / pathlib.Path("translator.toml")
-    toml_text = toml_path.read_text()
-    unicode_mapping = toml.loads(toml_text)
-    translator = {
-        unicode_type: Translator(unicode_mapping[unicode_type], strict_case=strict_case)
-        for unicode_type in unicode_mapping
-    }
-    return translator
+        Returns:
+            Dict[int, str]: The inverse translation table.
+
+        Raises:
+            KeyError: If ``unicode_type`` does not exist.
+        """  # noqa: DAR402
+        try:
+            return self._inverse[unicode_type]
+        except KeyError:
+            pass
+        with self._lock:
+            if unicode_type not in self._inverse:
+                if unicode_type is None:
+                    mappings = [self._mapping(name) for name in self.names()]
+                else:
+                    mappings = [self._mapping(unicode_type)]
+                self._inverse[unicode_type] = compile_inverse_table(
+                    mappings, keep_ascii=unicode_type is None
+                )
+            return self._inverse[unicode_type]
+
+    def style_index(self) -> Dict[int, int]:
+        """Return the index of the Unicode types producing each character.
+
+        Returns:
+            Dict[int, int]: A dictionary where the keys are code points
+            and the values are bitmasks whose bit ``n`` is set if the
+            ``n``-th Unicode type in ``names`` produces the character.
+        """
+        if self._style_index is None:
+            with self._lock:
+                if self._style_index is None:
+                    self._style_index = compile_style_index(
+                        [self._mapping(name) for name in self.names()]
+                    )
+        return self._style_index
+
+    def is_open(self) -> bool:
+        """Return whether the mappings have been located.
+
+        Returns:
+            bool: True if ``names`` would return without reading any
+            files.
+        """
+        return self._source is not None
+
+    def is_compiled(self, unicode_type: str, strict_case: bool = False) -> bool:
+        """Return whether a translation table is ready without loading.
+
+        Args:
+            unicode_type (str): The normalized Unicode type name.
+            strict_case (bool): Whether the table forbids case fallback.
+                By default False.
 
+        Returns:
+            bool: True if ``table`` would return without reading or
+            compiling any mappings.
+        """
+        return unicode_type in self._cache["table", bool(strict_case)]
+
+    def get(self, strict_case: bool = False) -> Dict[str, Translator]:
+        """Return the translators for every Unicode type.
+
+        Args:
+            strict_case (bool): Whether the returned translators forbid
+                characters from being converted to an upper or lower case
+                counterpart if an exact match is not found. By default
+                False.
+
+        Returns:
+            Dict[str, Translator]: A dictionary where the keys are the
+            unicode type and the values are their Translator.
+        """
+        return {
+            unicode_type: self.translator(unicode_type, strict_case=strict_case)
+            for unicode_type in self.names()
+        }
+
+    def tables(self, strict_case: bool = False) -> Dict[str, TranslationTable]:
+        """Return the ``str.translate`` tables for every Unicode type.
+
+        Args:
+            strict_case (bool): Whether the returned tables forbid
+                characters from being converted to an upper or lower case
+                counterpart if an exact match is not found. By default
+                False.
+
+        Returns:
+            Dict[str, TranslationTable]: A dictionary where the keys are
+            the unicode type and the values are their translation table.
+        """
+        return {
+            unicode_type: self.table(unicode_type, strict_case=strict_case)
+            for unicode_type in self.names()
+        }
+
+    def clear(self) -> None:
+        """Discard all cached translators, tables and conversion results.
+
+        The next lookup will load the mappings again.
+        """
+        with self._lock:
+            self._source = None
+            self._names = None
+            self._mappings.clear()
+            for compiled in self._cache.values():
+                compiled.clear()
+            self._inverse.clear()
+            self._pipelines.clear()
+            self._utf8_tables.clear()
+            self._style_index = None
+            self._prefixes = None
+        if cache.result_cache is not None:
+            cache.result_cache.clear()
+        pass
+
+
+registry = TranslatorRegistry()
 
+
+@functools.lru_cache(maxsize=None)
 def _format_names(name: str) -> str:
     """Format dictionary key names to be human friendly.
 
@@ -99,8 +1178,167 @@ def _format_names(name: str) -> str:
     return name[0].upper() + name[1:].replace("_", " ")
 
 
+def _get_table(unicode_type: Style, strict_case: bool = False) -> TranslationTable:
+    """Return the translation table of a normalized Unicode type.
+
+    Args:
+        unicode_type (Style): The normalized Unicode type name, or a
+            tuple of them to fuse into a pipeline.
+        strict_case (bool): Whether to forbid case fallback. By default
+            False.
+
+    Returns:
+        TranslationTable: The translation table of ``unicode_type``.
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if ``unicode_type`` is invalid.
+    """
+    try:
+        if isinstance(unicode_type, str):
+            return registry.table(unicode_type, strict_case=strict_case)
+        return registry.pipeline_table(unicode_type, strict_case=strict_case)
+    except KeyError as error:
+        raise exceptions.InvalidUnicodeTypeError(
+            _invalid_type_message(error.args[0])
+        ) from error
+
+
+def _invalid_type_message(unicode_type: str) -> str:
+    """Describe an unknown Unicode type.
+
+    Args:
+        unicode_type (str): The normalized Unicode type name.
+
+    Returns:
+        str: The error message, listing the valid types.
+    """
+    valid_types = ", ".join(registry.names())
+    return (
+        f"'{unicode_type}' is not a valid Unicode type."
+        f" Valid types are {valid_types}."
+    )
+
+
+def _normalize_style(unicode_type: Union[str, Iterable[str]]) -> Style:
+    """Normalize a Unicode type, or a pipeline of them.
+
+    Args:
+        unicode_type (Union[str, Iterable[str]]): The Unicode type name,
+            or the names to apply one after another.
+
+    Returns:
+        Style: The normalized name, or a tuple of normalized names if
+        more than one is given.
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if no Unicode type is given.
+    """
+    if isinstance(unicode_type, str):
+        return normalize_text(unicode_type)
+    unicode_types = tuple(normalize_text(name) for name in unicode_type)
+    if not unicode_types:
+        raise exceptions.InvalidUnicodeTypeError(
+            "A pipeline needs at least one Unicode type."
+        )
+    if len(unicode_types) == 1:
+        return unicode_types[0]
+    return unicode_types
+
+
+def _stages(unicode_type: Style) -> List[str]:
+    """List the Unicode types of a normalized style.
+
+    Args:
+        unicode_type (Style): The result of ``_normalize_style``.
+
+    Returns:
+        List[str]: The normalized Unicode type names.
+    """
+    if isinstance(unicode_type, str):
+        return [unicode_type]
+    return list(unicode_type)
+
+
+def _normalize_types(types: Optional[Iterable[str]]) -> List[str]:
+    """Normalize a selection of Unicode types.
+
+    Args:
+        types (Iterable[str], optional): The Unicode type names. If None,
+            every Unicode type is selected.
+
+    Returns:
+        List[str]: The normalized Unicode type names.
+    """
+    if types is None:
+        return registry.names()
+    return [normalize_text(unicode_type) for unicode_type in types]
+
+
+def _record_conversion(
+    function: str,
+    unicode_types: List[str],
+    characters: str,
+    strict_case: bool,
+    start: float,
+) -> None:
+    """Record the metrics of a conversion.
+
+    Only called while metrics are enabled. Each distinct character is
+    classified once as mapped, converted through its other case, or left
+    unchanged. Each stage of a pipeline is classified against the output
+    of the stage before it.
+
+    Args:
+        function (str): The name of the conversion function.
+        unicode_types (List[str]): The normalized Unicode type names, in
+            the order they were applied.
+        characters (str): Every character that was converted.
+        strict_case (bool): Whether case fallback was forbidden.
+        start (float): The ``time.perf_counter`` value at the start of
+            the conversion.
+    """
+    elapsed = time.perf_counter() - start
+    for index, unicode_type in enumerate(unicode_types):
+        if index:
+            characters = characters.translate(
+                registry.table(unicode_types[index - 1], strict_case=strict_case)
+            )
+        character_counts = collections.Counter(characters)
+        mapping = registry.mapping(unicode_type)
+        suffix_rule = SUFFIX_KEY in mapping
+        case_fallbacks = 0
+        unmapped_characters = 0
+        for character, count in character_counts.items():
+            if character in mapping or (suffix_rule and takes_suffix(character)):
+                continue
+            elif not strict_case and (
+                character.upper() in mapping or character.lower() in mapping
+            ):
+                case_fallbacks += count
+            else:
+                unmapped_characters += count
+        metrics.increment(
+            "characters_converted_total", len(characters), unicode_type=unicode_type
+        )
+        if case_fallbacks:
+            metrics.increment(
+                "case_fallbacks_total", case_fallbacks, unicode_type=unicode_type
+            )
+        if unmapped_characters:
+            metrics.increment(
+                "unmapped_characters_total",
+                unmapped_characters,
+                unicode_type=unicode_type,
+            )
+    metrics.observe("conversion_seconds", elapsed, function=function)
+    pass
+
+
 def show_all(
-    characters: str, strict_case: bool = False, reverse: bool = False
+    characters: str,
+    strict_case: bool = False,
+    reverse: bool = False,
+    types: Optional[Iterable[str]] = None,
 ) -> Dict[str, str]:
     """Return all possible unicode conversions.
 
@@ -112,6 +1350,9 @@ def show_all(
         reverse (bool): Whether to reverse the returned characters. This
             can be useful when converting to ``unicode_type``
             "inverted" or "reverse". By default False.
+        types (Iterable[str], optional): The Unicode types to convert
+            to. Accepts the same values as ``unicode_type`` in
+            ``convert``. By default every type is returned.
 
     Returns:
         Dict(str, str): A dictionary with the converted characters.
@@ -134,18 +1375,51 @@ def show_all(
         'Negative square': '🅷🅴🅻🅻🅾', 'Cute': 'Héĺĺő', 'Math fraktur':
         'ℌ𝔢𝔩𝔩𝔬', 'Rock dots': 'Ḧëḷḷö', 'Small caps': 'ʜᴇʟʟᴏ', 'Stroked':
         'Ħɇłłø', 'Subscript': 'ₕₑₗₗₒ', 'Superscript': 'ᴴᵉˡˡᵒ',
-        'Inverted': 'ɥǝןןo', 'Reversed': 'Hɘ⅃⅃o'}
-    """
-    translator = _read_translator(strict_case=strict_case)
+        'Inverted': 'ɥǝןןo', 'Reversed': 'Hɘ⅃⅃o', 'Strikethrough':
+        'H̶e̶l̶l̶o̶', 'Underlined': 'H̲e̲l̲l̲o̲', 'Slashed': 'H̸e̸l̸l̸o̸'}
+
+        Show only a subset of the conversions.
+
+        >>> import dressup
+        >>> dressup.show_all("Hello", types=["math bold", "small caps"])
+        {'Math bold': '𝐇𝐞𝐥𝐥𝐨', 'Small caps': 'ʜᴇʟʟᴏ'}
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if a value inputted in ``types``
+            is invalid.
+    """  # noqa: DAR402
+    start = time.perf_counter() if metrics.enabled else 0.0
+    unicode_types = _normalize_types(types)
+    result_cache = cache.result_cache
+    if result_cache is not None:
+        key = (
+            "show_all",
+            characters,
+            tuple(unicode_types),
+            bool(strict_case),
+            bool(reverse),
+        )
+        cached_characters = result_cache.get(key)
+        if cached_characters is not None:
+            return dict(cast(Dict[str, str], cached_characters))
+    tables = [
+        _get_table(unicode_type, strict_case=strict_case)
+        for unicode_type in unicode_types
+    ]
     if reverse:
         characters = characters[::-1]
     converted_characters = {
-        _format_names(character_type): "".join(
-            translator[normalize_text(character_type)][character]
-            for character in characters
-        )
-        for character_type in translator
+        _format_names(unicode_type): characters.translate(table)
+        for unicode_type, table in zip(unicode_types, tables)
     }
+    if metrics.enabled:
+        _record_conversion("show_all", unicode_types, characters, strict_case, start)
+    if result_cache is not None:
+        result_cache.put(
+            key,
+            dict(converted_characters),
+            len(characters) + sum(map(len, converted_characters.values())),
+        )
 
     return converted_characters
 
@@ -166,14 +1440,19 @@ def normalize_text(text_input: str) -> str:
 
 
 def convert(
-    characters: str, unicode_type: str, strict_case: bool = False, reverse: bool = False
+    characters: str,
+    unicode_type: Union[str, Iterable[str]],
+    strict_case: bool = False,
+    reverse: bool = False,
 ) -> str:
     """Convert characters to a Unicode character type.
 
     Args:
         characters (str): The characters to convert.
-        unicode_type (str): The type of Unicode character types to
-            convert to. Valid values are "circle", "negative circle",
+        unicode_type (Union[str, Iterable[str]]): The type of Unicode
+            character types to convert to, or several types to apply
+            one after another in a single pass, as with ``pipeline``.
+            Valid values are "circle", "negative circle",
             "monospace", "math bold", "math bold fraktur",
             "math bold italic", "math bold script",
             "math double struck", "math monospace",
@@ -181,7 +1460,8 @@ def convert(
             "math sans italic", "parenthesized", "square",
             "negative square", "cute", "math fraktur", "rock dots",
             "small caps", "stroked", "subscript", "superscript",
-            "inverted", and "reversed".
+            "inverted", "reversed", "strikethrough", "underlined", and
+            "slashed".
         strict_case (bool): Whether to forbid a character from being
             converted to its lower or upper case counterpart if an exact
             mapping is not found. By default False.
@@ -225,31 +1505,395 @@ def convert(
         ...     reverse=True,
         ... )
         'o⅃⅃ɘH'
+
+        Convert the string "Quixotic" to small caps characters, falling
+        back to superscript for the characters small caps lacks.
+
+        >>> import dressup
+        >>> dressup.convert("Quixotic", ["small caps", "superscript"])
+        'Qᴜɪˣᴏᴛɪᴄ'
+    """  # noqa: DAR402
+    start = time.perf_counter() if metrics.enabled else 0.0
+    unicode_type = _normalize_style(unicode_type)
+    result_cache = cache.result_cache
+    if result_cache is not None:
+        key = ("convert", characters, unicode_type, bool(strict_case), bool(reverse))
+        cached_characters = result_cache.get(key)
+        if cached_characters is not None:
+            return cast(str, cached_characters)
+    table = _get_table(unicode_type, strict_case=strict_case)
+    if reverse:
+        characters = characters[::-1]
+    converted_characters = characters.translate(table)
+    if metrics.enabled:
+        _record_conversion(
+            "convert", _stages(unicode_type), characters, strict_case, start
+        )
+    if result_cache is not None:
+        result_cache.put(
+            key, converted_characters, len(characters) + len(converted_characters)
+        )
+    return converted_characters
+
+
+def undress(
+    characters: str, from_type: Optional[str] = None, reverse: bool = False
+) -> str:
+    """Convert Unicode characters back to the characters they came from.
+
+    Args:
+        characters (str): The characters to convert.
+        from_type (str, optional): The Unicode type the characters were
+            converted to. Accepts the same values as ``unicode_type`` in
+            ``convert``. If None, characters of every Unicode type are
+            converted at once. ASCII characters, and characters that
+            different Unicode types convert from different characters,
+            are then kept unchanged. By default None.
+        reverse (bool): Whether to reverse the returned characters. This
+            undoes ``reverse`` in ``convert``. By default False.
+
+    Returns:
+        str: The plain characters.
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if value inputted in
+            ``from_type`` is invalid.
+
+    Examples:
+        Convert text of mixed styles back to plain characters.
+
+        >>> import dressup
+        >>> dressup.undress("Ⓗ𝐞𝓵𝓵ᴏ 🅆𝕠ʀ𝔩𝖉")
+        'Hello World'
+
+        Choose the style when a character is ambiguous.
+
+        >>> import dressup
+        >>> dressup.undress("oןןǝɥ", from_type="inverted", reverse=True)
+        'hello'
     """
-    unicode_type = normalize_text(unicode_type)
-    translator = _read_translator()
+    if from_type is None:
+        table = registry.inverse()
+    else:
+        unicode_type = normalize_text(from_type)
+        try:
+            table = registry.inverse(unicode_type)
+        except KeyError as error:
+            raise exceptions.InvalidUnicodeTypeError(
+                _invalid_type_message(unicode_type)
+            ) from error
     if reverse:
         characters = characters[::-1]
+    return characters.translate(table)
+
+
+def _translate_batch(
+    strings: List[str], tables: List[TranslationTable], reverse: bool
+) -> List[List[str]]:
+    """Translate many strings with one ``str.translate`` call per table.
+
+    The strings are joined with a sentinel character that no table
+    maps, translated together, and split again. Batches that already
+    contain the sentinel are translated one string at a time instead.
+
+    Args:
+        strings (List[str]): The strings to translate.
+        tables (List[TranslationTable]): The translation tables.
+        reverse (bool): Whether to reverse each string.
+
+    Returns:
+        List[List[str]]: For each table, the translated strings in input
+        order.
+    """
+    if not strings:
+        return [[] for _ in tables]
+    joined = BATCH_SENTINEL.join(strings)
+    if joined.count(BATCH_SENTINEL) != len(strings) - 1:
+        if reverse:
+            strings = [string[::-1] for string in strings]
+        return [[string.translate(table) for string in strings] for table in tables]
+    if reverse:
+        joined = joined[::-1]
+    batches = []
+    for table in tables:
+        batch = joined.translate(table).split(BATCH_SENTINEL)
+        if reverse:
+            batch.reverse()
+        batches.append(batch)
+    return batches
+
+
+def convert_many(
+    strings: Iterable[str],
+    unicode_type: Union[str, Iterable[str]],
+    strict_case: bool = False,
+    reverse: bool = False,
+) -> List[str]:
+    """Convert many strings to a Unicode character type.
+
+    The Unicode type is looked up once, duplicate strings are converted
+    once, and the whole batch is converted in a single pass.
+
+    Args:
+        strings (Iterable[str]): The strings to convert.
+        unicode_type (Union[str, Iterable[str]]): The type of Unicode
+            character types to convert to, or several types to apply one
+            after another. Accepts the same values as ``convert``.
+        strict_case (bool): Whether to forbid a character from being
+            converted to its lower or upper case counterpart if an exact
+            mapping is not found. By default False.
+        reverse (bool): Whether to reverse each returned string. By
+            default False.
+
+    Returns:
+        List[str]: The converted strings, in the same order as
+        ``strings``.
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if value inputted in
+            ``unicode_type`` is invalid.
+
+    Example:
+        Convert several names to small caps characters.
+
+        >>> import dressup
+        >>> dressup.convert_many(["Ada", "Alan", "Ada"], "small caps")
+        ['ᴀᴅᴀ', 'ᴀʟᴀɴ', 'ᴀᴅᴀ']
+    """  # noqa: DAR402
+    start = time.perf_counter() if metrics.enabled else 0.0
+    unicode_type = _normalize_style(unicode_type)
+    table = _get_table(unicode_type, strict_case=strict_case)
+    strings = list(strings)
+    unique_strings = list(dict.fromkeys(strings))
+    (converted_strings,) = _translate_batch(unique_strings, [table], reverse=reverse)
+    conversions = dict(zip(unique_strings, converted_strings))
+    if metrics.enabled:
+        _record_conversion(
+            "convert_many",
+            _stages(unicode_type),
+            "".join(strings),
+            strict_case,
+            start,
+        )
+    return [conversions[string] for string in strings]
+
+
+def convert_bytes(
+    buffer: Union[bytes, bytearray, memoryview],
+    unicode_type: Union[str, Iterable[str]],
+    strict_case: bool = False,
+    reverse: bool = False,
+) -> bytes:
+    """Convert UTF-8 encoded characters to a Unicode character type.
+
+    A convenience wrapper around decoding, converting, and encoding. The
+    buffer is decoded to a string, which is then converted and encoded in
+    a single call using the cached UTF-8 bytes of every converted
+    character.
+
+    Args:
+        buffer (Union[bytes, bytearray, memoryview]): The UTF-8 encoded
+            characters to convert.
+        unicode_type (Union[str, Iterable[str]]): The type of Unicode
+            character types to convert to, or several types to apply one
+            after another. Accepts the same values as ``convert``.
+        strict_case (bool): Whether to forbid a character from being
+            converted to its lower or upper case counterpart if an exact
+            mapping is not found. By default False.
+        reverse (bool): Whether to reverse the returned characters. By
+            default False.
+
+    Returns:
+        bytes: The UTF-8 encoded converted characters.
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if value inputted in
+            ``unicode_type`` is invalid.
+        UnicodeDecodeError: Raised if ``buffer`` is not valid UTF-8.
+
+    Example:
+        Convert UTF-8 bytes to math bold characters.
+
+        >>> import dressup
+        >>> dressup.convert_bytes(b"Hello", "math bold").decode()
+        '𝐇𝐞𝐥𝐥𝐨'
+    """  # noqa: DAR402
+    start = time.perf_counter() if metrics.enabled else 0.0
+    unicode_type = _normalize_style(unicode_type)
     try:
-        type_mapping = translator[unicode_type]
+        utf8_table = registry.utf8_table(unicode_type, strict_case=strict_case)
     except KeyError as error:
-        valid_types = ", ".join(translator.keys())
         raise exceptions.InvalidUnicodeTypeError(
-            f"'{unicode_type}' is not a valid Unicode type."
-            f" Valid types are {valid_types}."
+            _invalid_type_message(error.args[0])
         ) from error
-    if strict_case:
-        converted_character = "".join(
-            type_mapping.get(character, character) for character in characters
+    characters = str(buffer, "utf-8")
+    if reverse:
+        characters = characters[::-1]
+    converted_bytes, _ = codecs.charmap_encode(characters, "strict", utf8_table)
+    if metrics.enabled:
+        _record_conversion(
+            "convert_bytes", _stages(unicode_type), characters, strict_case, start
         )
-    else:
-        converted_character = "".join(
-            type_mapping.get(
-                character,
-                type_mapping.get(
-                    character.upper(), type_mapping.get(character.lower(), character)
-                ),
-            )
-            for character in characters
+    return converted_bytes
+
+
+def show_all_many(
+    strings: Iterable[str],
+    strict_case: bool = False,
+    reverse: bool = False,
+    types: Optional[Iterable[str]] = None,
+) -> Dict[str, List[str]]:
+    """Convert many strings to all Unicode character types.
+
+    Args:
+        strings (Iterable[str]): The strings to convert.
+        strict_case (bool): Whether to forbid a character from being
+            converted to its lower or upper case counterpart if an exact
+            mapping is not found. By default False.
+        reverse (bool): Whether to reverse each returned string. By
+            default False.
+        types (Iterable[str], optional): The Unicode types to convert
+            to. By default every type is returned.
+
+    Returns:
+        Dict[str, List[str]]: A dictionary where the keys are the names
+        of character types and the values are the converted strings, in
+        the same order as ``strings``.
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if a value inputted in ``types``
+            is invalid.
+
+    Example:
+        Convert several names to two Unicode types.
+
+        >>> import dressup
+        >>> dressup.show_all_many(["Ada", "Alan"], types=["math bold", "square"])
+        {'Math bold': ['𝐀𝐝𝐚', '𝐀𝐥𝐚𝐧'], 'Square': ['🄰🄳🄰', '🄰🄻🄰🄽']}
+    """  # noqa: DAR402
+    start = time.perf_counter() if metrics.enabled else 0.0
+    unicode_types = _normalize_types(types)
+    tables = [
+        _get_table(unicode_type, strict_case=strict_case)
+        for unicode_type in unicode_types
+    ]
+    strings = list(strings)
+    unique_strings = list(dict.fromkeys(strings))
+    batches = _translate_batch(unique_strings, tables, reverse=reverse)
+    converted_strings = {}
+    for unicode_type, batch in zip(unicode_types, batches):
+        conversions = dict(zip(unique_strings, batch))
+        converted_strings[_format_names(unicode_type)] = [
+            conversions[string] for string in strings
+        ]
+    if metrics.enabled:
+        _record_conversion(
+            "show_all_many", unicode_types, "".join(strings), strict_case, start
+        )
+    return converted_strings
+
+
+class Pipeline:
+    """Unicode types applied one after another in a single pass.
+
+    The translation tables of the Unicode types are fused into one table
+    when the pipeline is created. The fused table is cached by the
+    registry, so pipelines of the same types, and ``convert`` called with
+    the same list of types, share it.
+
+    Attributes:
+        unicode_types (Tuple[str, ...]): The normalized Unicode type
+            names, in the order they are applied.
+        strict_case (bool): Whether to forbid case fallback.
+        reverse (bool): Whether to reverse the returned characters.
+    """
+
+    def __init__(
+        self,
+        unicode_types: Iterable[str],
+        strict_case: bool = False,
+        reverse: bool = False,
+    ) -> None:
+        """Constructor."""
+        self.unicode_types = tuple(_stages(_normalize_style(unicode_types)))
+        self.strict_case = strict_case
+        self.reverse = reverse
+        _get_table(self.unicode_types, strict_case=strict_case)
+        pass
+
+    def __repr__(self) -> str:
+        """Representation of Pipeline."""
+        return (
+            f"Pipeline({list(self.unicode_types)}, strict_case={self.strict_case},"
+            f" reverse={self.reverse})"
+        )
+
+    def convert(self, characters: str) -> str:
+        """Convert characters through every Unicode type.
+
+        Args:
+            characters (str): The characters to convert.
+
+        Returns:
+            str: The converted Unicode characters.
+        """
+        return convert(
+            characters,
+            self.unicode_types,
+            strict_case=self.strict_case,
+            reverse=self.reverse,
+        )
+
+    def convert_many(self, strings: Iterable[str]) -> List[str]:
+        """Convert many strings through every Unicode type.
+
+        Args:
+            strings (Iterable[str]): The strings to convert.
+
+        Returns:
+            List[str]: The converted strings, in the same order as
+            ``strings``.
+        """
+        return convert_many(
+            strings,
+            self.unicode_types,
+            strict_case=self.strict_case,
+            reverse=self.reverse,
         )
-    return converted_character
+
+
+def pipeline(
+    *unicode_types: str, strict_case: bool = False, reverse: bool = False
+) -> Pipeline:
+    """Compose Unicode types into a pipeline converting in one pass.
+
+    Each type converts the output of the one before it, so a later type
+    can act as a fallback for the characters an earlier type leaves
+    unchanged.
+
+    Args:
+        *unicode_types (str): The Unicode types to apply, in order.
+            Accepts the same values as ``unicode_type`` in ``convert``.
+        strict_case (bool): Whether to forbid a character from being
+            converted to its lower or upper case counterpart if an exact
+            mapping is not found. By default False.
+        reverse (bool): Whether to reverse the returned characters. The
+            characters are reversed once, before any conversion. By
+            default False.
+
+    Returns:
+        Pipeline: The compiled pipeline.
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if a Unicode type is invalid, or
+            none is given.
+
+    Example:
+        Write upside down, then strike the result through.
+
+        >>> import dressup
+        >>> upside_down = dressup.pipeline("inverted", "strikethrough", reverse=True)
+        >>> upside_down.convert("Hi!")
+        '¡̶ı̶ɥ̶'
+    """  # noqa: DAR402
+    return Pipeline(unicode_types, strict_case=strict_case, reverse=reverse)
@@ -0,0 +1,183 @@
+"""Keep a warm process that converts for ``dressup-client``.
+
+The daemon loads every translation table once and answers clients on a
+Unix socket, each in its own thread. It runs the arguments that
+``dressup`` handles without typer: converting characters with
+``--type``, or standard input with ``--type`` and ``--input -``. For
+any other arguments, including an invalid type, it tells the client to
+fall back to running them itself, so that output and error messages
+always match ``dressup``.
+"""
+import errno
+import json
+import os
+import socket
+import socketserver
+from typing import List, Optional, Tuple
+import zlib
+
+from . import cli, converter, streaming
+from .client import (
+    ERROR,
+    EXIT,
+    FALLBACK,
+    OUTPUT,
+    READ_SIZE,
+    SEND_INPUT,
+    write_frame,
+)
+
+MAX_REQUEST_SIZE = 1024 * 1024
+
+
+def parse_args(args: List[str]) -> Optional[Tuple[Optional[str], str, bool, bool]]:
+    """Parse the arguments that the daemon can run.
+
+    Args:
+        args (List[str]): The command-line arguments.
+
+    Returns:
+        Optional[Tuple[Optional[str], str, bool, bool]]: The characters,
+        or None to convert standard input, the Unicode type, and whether
+        to use strict case and to reverse. None if ``args`` need the full
+        command-line interface.
+    """
+    read_input = False
+    remaining_args = []
+    arguments = iter(args)
+    for argument in arguments:
+        if argument in ("-i", "--input"):
+            if next(arguments, None) != "-":
+                return None
+            read_input = True
+        elif argument == "--input=-":
+            read_input = True
+        else:
+            remaining_args.append(argument)
+    if not read_input:
+        return cli.parse_fast_args(remaining_args)
+    # An empty placeholder stands in for the characters, so that
+    # arguments with both characters and --input are left to the
+    # full interface, which rejects them.
+    fast_args = cli.parse_fast_args([*remaining_args, ""])
+    if fast_args is None:
+        return None
+    _, unicode_type, strict_case, reverse = fast_args
+    return None, unicode_type, strict_case, reverse
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Answer one client."""
+
+    def handle(self) -> None:
+        """Run the arguments of the client, or ask it to fall back."""
+        try:
+            self._handle()
+        except ConnectionError:
+            pass
+        pass
+
+    def _handle(self) -> None:
+        """Run the arguments of the client, or ask it to fall back."""
+        try:
+            args = json.loads(self.rfile.readline(MAX_REQUEST_SIZE))["args"]
+        except (ValueError, KeyError, TypeError):
+            args = None
+        parsed_args = None
+        if isinstance(args, list) and all(isinstance(arg, str) for arg in args):
+            parsed_args = parse_args(args)
+        if parsed_args is None or (
+            converter.normalize_text(parsed_args[1]) not in converter.registry.names()
+        ):
+            write_frame(self.wfile, FALLBACK)
+            return
+        characters, unicode_type, strict_case, reverse = parsed_args
+        if characters is not None:
+            converted_characters = converter.convert(
+                characters, unicode_type, strict_case=strict_case, reverse=reverse
+            )
+            write_frame(self.wfile, OUTPUT, f"{converted_characters}\n".encode())
+            write_frame(self.wfile, EXIT, b"0")
+            return
+        write_frame(self.wfile, SEND_INPUT)
+        chunks = iter(lambda: self.rfile.read1(READ_SIZE), b"")
+        try:
+            for converted_chunk in streaming.convert_stream(
+                streaming._decode_chunks(chunks),
+                unicode_type,
+                strict_case=strict_case,
+                reverse=reverse,
+            ):
+                write_frame(self.wfile, OUTPUT, converted_chunk.encode())
+        except (UnicodeDecodeError, zlib.error) as error:
+            write_frame(self.wfile, ERROR, f"Could not convert -: {error}\n".encode())
+            write_frame(self.wfile, EXIT, b"1")
+        else:
+            write_frame(self.wfile, EXIT, b"0")
+        pass
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server that answers each client in a thread.
+
+    The socket is made private to its user before it starts listening.
+    """
+
+    daemon_threads = True
+
+    def server_bind(self) -> None:
+        """Bind the socket, readable and writable only by its user."""
+        super().server_bind()
+        os.chmod(self.socket.getsockname(), 0o600)
+        pass
+
+
+def make_server(path: str) -> DaemonServer:
+    """Load every translation table and listen on a Unix socket.
+
+    The directory of the socket is created private to the current user
+    if it does not exist, and must belong to the current user. A socket
+    left behind by a daemon that is no longer running is replaced.
+
+    Args:
+        path (str): The path of the socket.
+
+    Returns:
+        DaemonServer: The listening server.
+
+    Raises:
+        OSError: Raised if a daemon is already listening on ``path``, the
+            directory of the socket belongs to another user, or the
+            socket cannot be created.
+    """  # noqa: DAR402
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    if os.stat(directory).st_uid != os.getuid():
+        raise OSError(errno.EPERM, "The directory belongs to another user", directory)
+    if os.path.exists(path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(path)
+            except ConnectionRefusedError:
+                os.unlink(path)
+            else:
+                raise OSError(errno.EADDRINUSE, "A daemon is already running", path)
+    for strict_case in (False, True):
+        converter.registry.tables(strict_case=strict_case)
+    return DaemonServer(path, _Handler)
+
+
+def run(path: str) -> None:
+    """Answer clients on a Unix socket until interrupted.
+
+    Args:
+        path (str): The path of the socket.
+    """
+    server = make_server(path)
+    print(f"Listening on {path}", flush=True)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        os.unlink(path)
+    pass
@@ -0,0 +1,96 @@
+"""Detect the Unicode character types used in text."""
+import collections
+from typing import Dict, Iterable, List
+
+from . import converter
+
+
+def _coverage(
+    characters: str, names: List[str], index: Dict[int, int]
+) -> Dict[str, float]:
+    """Measure how much of the characters each Unicode type produces.
+
+    Args:
+        characters (str): The characters to inspect.
+        names (List[str]): The Unicode type name of each bit of the
+            bitmasks in ``index``.
+        index (Dict[int, int]): The bitmask of the Unicode types
+            producing each code point.
+
+    Returns:
+        Dict[str, float]: The share of ``characters`` produced by each
+        detected Unicode type, largest first.
+    """
+    style_counts = [0] * len(names)
+    for character, count in collections.Counter(characters).items():
+        mask = index.get(ord(character), 0)
+        while mask:
+            lowest_bit = mask & -mask
+            style_counts[lowest_bit.bit_length() - 1] += count
+            mask ^= lowest_bit
+    detected_styles = sorted(
+        ((count, bit) for bit, count in enumerate(style_counts) if count),
+        key=lambda style: (-style[0], style[1]),
+    )
+    return {
+        converter._format_names(names[bit]): count / len(characters)
+        for count, bit in detected_styles
+    }
+
+
+def detect(characters: str) -> Dict[str, float]:
+    """Detect which Unicode character types text was converted to.
+
+    Each character is looked up once in an index of the Unicode types
+    that produce it, so the cost grows with the length of the text and
+    not with the number of Unicode types. ASCII characters are not
+    attributed to any type.
+
+    Args:
+        characters (str): The characters to inspect.
+
+    Returns:
+        Dict[str, float]: A dictionary where the keys are the names of
+        the detected character types and the values are the share of
+        ``characters`` each one produces, from 0 to 1. The largest share
+        comes first, and types that produce no character are left out.
+
+    Example:
+        Detect the character types of mixed text.
+
+        >>> import dressup
+        >>> dressup.detect("𝐇𝐞𝐥𝐥𝐨 ʜɪ")
+        {'Math bold': 0.625, 'Small caps': 0.25}
+    """
+    names = converter.registry.names()
+    index = converter.registry.style_index()
+    return _coverage(characters, names, index)
+
+
+def detect_many(strings: Iterable[str]) -> List[Dict[str, float]]:
+    """Detect the Unicode character types of many strings.
+
+    The index is looked up once and duplicate strings are inspected
+    once.
+
+    Args:
+        strings (Iterable[str]): The strings to inspect.
+
+    Returns:
+        List[Dict[str, float]]: The result of ``detect`` for each string,
+        in the same order as ``strings``.
+
+    Example:
+        Detect the character types of several names.
+
+        >>> import dressup
+        >>> dressup.detect_many(["ⓐⓓⓐ", "Alan", "ⓐⓓⓐ"])
+        [{'Circle': 1.0}, {}, {'Circle': 1.0}]
+    """
+    names = converter.registry.names()
+    index = converter.registry.style_index()
+    strings = list(strings)
+    detections = {
+        string: _coverage(string, names, index) for string in dict.fromkeys(strings)
+    }
+    return [dict(detections[string]) for string in strings]
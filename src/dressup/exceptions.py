@@ -15,3 +15,11 @@ class InvalidUnicodeTypeError(DressUpError, ValueError):
     def __repr__(self) -> str:
         """Representation of InvalidUnicodeTypeError."""
         return "InvalidUnicodeTypeError()"
+
+
+class InvalidSourceError(DressUpError, ValueError):
+    """A source file of character mappings is malformed."""
+
+    def __repr__(self) -> str:
+        """Representation of InvalidSourceError."""
+        return "InvalidSourceError()"
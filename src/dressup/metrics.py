@@ -0,0 +1,217 @@
+"""Opt-in runtime metrics.
+
+Metrics are disabled by default. While disabled, instrumented code only
+checks ``enabled`` and records nothing. Call ``enable`` to start
+counting table loads, cache hits and misses, converted characters and
+fallbacks, and timing table loads and conversions. Read them with
+``snapshot`` or export them in the Prometheus text format with
+``to_prometheus`` and ``write_prometheus``.
+
+Example:
+    Count the characters converted to each Unicode type.
+
+    >>> import dressup
+    >>> from dressup import metrics
+    >>> metrics.enable()
+    >>> dressup.convert("Hi!", "math bold")
+    '𝐇𝐢!'
+    >>> metrics.snapshot()["characters_converted_total"]
+    [{'labels': {'unicode_type': 'math_bold'}, 'value': 3}]
+    >>> metrics.disable()
+    >>> metrics.reset()
+"""
+import os
+import threading
+from typing import Dict, List, Tuple, Union
+
+DESCRIPTIONS = {
+    "source_loads_total": "Times the character mappings were located.",
+    "source_load_seconds": "Time spent locating the character mappings.",
+    "table_loads_total": "Translators, tables and previews compiled.",
+    "table_load_seconds": "Time spent compiling translators, tables and previews.",
+    "cache_hits_total": "Lookups answered by an already compiled object.",
+    "cache_misses_total": "Lookups that had to compile an object.",
+    "characters_converted_total": "Characters converted to each Unicode type.",
+    "case_fallbacks_total": "Characters converted through their other case.",
+    "unmapped_characters_total": "Characters left unchanged for lack of a mapping.",
+    "conversion_seconds": "Time spent in conversion functions.",
+}
+PREFIX = "dressup_"
+
+Labels = Tuple[Tuple[str, str], ...]
+
+enabled = False
+_lock = threading.Lock()
+_counters: Dict[str, Dict[Labels, int]] = {}
+_timers: Dict[str, Dict[Labels, List[float]]] = {}
+
+
+def enable() -> None:
+    """Start recording metrics."""
+    global enabled
+    enabled = True
+    pass
+
+
+def disable() -> None:
+    """Stop recording metrics. Recorded values are kept."""
+    global enabled
+    enabled = False
+    pass
+
+
+def reset() -> None:
+    """Discard every recorded value."""
+    with _lock:
+        _counters.clear()
+        _timers.clear()
+    pass
+
+
+def _labels(labels: Dict[str, object]) -> Labels:
+    """Convert keyword labels to a hashable, ordered key.
+
+    Args:
+        labels (Dict[str, object]): The label names and values.
+
+    Returns:
+        Labels: The label names and values as strings, sorted by name.
+    """
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def increment(name: str, value: int = 1, **labels: object) -> None:
+    """Add to a counter.
+
+    Callers check ``enabled`` first, so that disabled metrics cost a
+    single global lookup.
+
+    Args:
+        name (str): The counter name, such as "cache_hits_total".
+        value (int): The amount to add. By default 1.
+        labels (object): The label values of the counter.
+    """
+    key = _labels(labels)
+    with _lock:
+        samples = _counters.setdefault(name, {})
+        samples[key] = samples.get(key, 0) + value
+    pass
+
+
+def observe(name: str, seconds: float, **labels: object) -> None:
+    """Record a duration in a timer.
+
+    Args:
+        name (str): The timer name, such as "table_load_seconds".
+        seconds (float): The duration, in seconds.
+        labels (object): The label values of the timer.
+    """
+    key = _labels(labels)
+    with _lock:
+        timer = _timers.setdefault(name, {}).setdefault(key, [0, 0.0])
+        timer[0] += 1
+        timer[1] += seconds
+    pass
+
+
+def snapshot() -> Dict[str, List[Dict[str, object]]]:
+    """Return a copy of every recorded value.
+
+    Returns:
+        Dict[str, List[Dict[str, object]]]: A dictionary where the keys
+        are the metric names and the values are their samples. Each
+        sample has "labels", and either the "value" of a counter or the
+        "count" and "sum" of a timer.
+    """
+    metrics: Dict[str, List[Dict[str, object]]] = {}
+    with _lock:
+        for name, counter in _counters.items():
+            metrics[name] = [
+                {"labels": dict(labels), "value": value}
+                for labels, value in sorted(counter.items())
+            ]
+        for name, timer in _timers.items():
+            metrics[name] = [
+                {"labels": dict(labels), "count": count, "sum": total}
+                for labels, (count, total) in sorted(timer.items())
+            ]
+    return dict(sorted(metrics.items()))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format.
+
+    Args:
+        value (str): The label value.
+
+    Returns:
+        str: The escaped label value.
+    """
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _sample(name: str, labels: Labels, value: float) -> str:
+    """Format one Prometheus sample line.
+
+    Args:
+        name (str): The full sample name.
+        labels (Labels): The label names and values.
+        value (float): The sample value.
+
+    Returns:
+        str: The sample line.
+    """
+    if labels:
+        label_text = ",".join(
+            f'{label}="{_escape(label_value)}"' for label, label_value in labels
+        )
+        name = f"{name}{{{label_text}}}"
+    return f"{name} {value!r}"
+
+
+def to_prometheus() -> str:
+    """Render every recorded value in the Prometheus text format.
+
+    Counters are exported as counters and timers as summaries with a
+    ``_count`` and ``_sum`` sample. Metric names are prefixed with
+    ``PREFIX``.
+
+    Returns:
+        str: The exposition text.
+    """
+    with _lock:
+        counters = {
+            name: sorted(counter.items()) for name, counter in _counters.items()
+        }
+        timers = {name: sorted(timer.items()) for name, timer in _timers.items()}
+    lines = []
+    for name in sorted({*counters, *timers}):
+        full_name = f"{PREFIX}{name}"
+        lines.append(f"# HELP {full_name} {DESCRIPTIONS.get(name, name)}")
+        if name in timers:
+            lines.append(f"# TYPE {full_name} summary")
+            for labels, (count, total) in timers[name]:
+                lines.append(_sample(f"{full_name}_count", labels, count))
+                lines.append(_sample(f"{full_name}_sum", labels, total))
+        else:
+            lines.append(f"# TYPE {full_name} counter")
+            for labels, value in counters[name]:
+                lines.append(_sample(full_name, labels, value))
+    return "".join(f"{line}\n" for line in lines)
+
+
+def write_prometheus(path: Union[str, "os.PathLike[str]"]) -> None:
+    """Write every recorded value to a file in the Prometheus text format.
+
+    The file is replaced atomically, so that a collector reading it,
+    such as the node exporter's textfile collector, never sees a
+    partial write.
+
+    Args:
+        path (Union[str, os.PathLike[str]]): The file to write.
+    """
+    temporary_path = f"{os.fspath(path)}.{os.getpid()}.tmp"
+    with open(temporary_path, "w", encoding="utf-8") as metrics_file:
+        metrics_file.write(to_prometheus())
+    os.replace(temporary_path, path)
+    pass
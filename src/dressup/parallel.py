@@ -0,0 +1,154 @@
+"""Convert large inputs on several processes."""
+import collections
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Iterable, Iterator, List, Optional, Union
+
+from . import converter
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+_worker_table: Optional[converter.TranslationTable] = None
+
+
+def _init_worker(unicode_type: converter.Style, strict_case: bool) -> None:
+    """Load the translation table once in a worker process.
+
+    Args:
+        unicode_type (converter.Style): The normalized Unicode type name,
+            or a tuple of them to fuse into a pipeline.
+        strict_case (bool): Whether to forbid case fallback.
+    """
+    global _worker_table
+    _worker_table = converter._get_table(unicode_type, strict_case=strict_case)
+    pass
+
+
+def _convert_chunk(chunk: str, reverse: bool) -> str:
+    """Convert a chunk with the worker's translation table.
+
+    Args:
+        chunk (str): The characters to convert.
+        reverse (bool): Whether to reverse the chunk.
+
+    Returns:
+        str: The converted chunk.
+    """
+    if reverse:
+        chunk = chunk[::-1]
+    return chunk.translate(_worker_table)  # type: ignore[arg-type]
+
+
+def split_lines(chunks: Iterable[str], chunk_size: int) -> Iterator[str]:
+    """Regroup chunks of text so each one ends on a line boundary.
+
+    Each chunk is searched for a line break once, and the pending chunks
+    are only joined when one is returned, so a long line arriving in many
+    chunks takes linear time.
+
+    Args:
+        chunks (Iterable[str]): The chunks of text.
+        chunk_size (int): The minimum number of characters in each
+            returned chunk, except the last one. Lines longer than this
+            are not split.
+
+    Yields:
+        str: The regrouped chunks.
+    """
+    pending: List[str] = []
+    pending_size = 0
+    newline_index = -1
+    for chunk in chunks:
+        if "\n" in chunk:
+            newline_index = len(pending)
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size < chunk_size or newline_index < 0:
+            continue
+        newline_chunk = pending[newline_index]
+        end = newline_chunk.rfind("\n") + 1
+        text = "".join(pending[:newline_index]) + newline_chunk[:end]
+        yield text
+        pending = [newline_chunk[end:], *pending[newline_index + 1 :]]
+        pending_size -= len(text)
+        newline_index = -1
+    text = "".join(pending)
+    if text:
+        yield text
+
+
+def convert_parallel(
+    chunks: Iterable[str],
+    unicode_type: Union[str, Iterable[str]],
+    strict_case: bool = False,
+    reverse: bool = False,
+    jobs: int = 2,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Convert chunks of text on a pool of worker processes.
+
+    The text is regrouped on line boundaries and each group is converted
+    by a worker whose translation table is loaded once, when it starts.
+    Results are returned in input order, and at most two groups per
+    worker are in flight at a time.
+
+    Args:
+        chunks (Iterable[str]): The chunks of text to convert.
+        unicode_type (Union[str, Iterable[str]]): The type of Unicode
+            character types to convert to, or several types to apply one
+            after another. Accepts the same values as ``convert``.
+        strict_case (bool): Whether to forbid a character from being
+            converted to its lower or upper case counterpart if an exact
+            mapping is not found. By default False.
+        reverse (bool): Whether to reverse the returned characters. The
+            whole input is held in memory when True. By default False.
+        jobs (int): The number of worker processes. By default 2.
+        chunk_size (int): The approximate number of characters sent to
+            a worker at a time. By default 4 Mi.
+
+    Returns:
+        Iterator[str]: The converted chunks.
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if value inputted in
+            ``unicode_type`` is invalid.
+    """  # noqa: DAR402
+    style = converter._normalize_style(unicode_type)
+    converter._get_table(style, strict_case=strict_case)
+    groups = split_lines(chunks, chunk_size)
+    if reverse:
+        groups = reversed(list(groups))
+    return _map_ordered(groups, style, strict_case, reverse, jobs)
+
+
+def _map_ordered(
+    groups: Iterable[str],
+    unicode_type: converter.Style,
+    strict_case: bool,
+    reverse: bool,
+    jobs: int,
+) -> Iterator[str]:
+    """Convert groups on worker processes, preserving their order.
+
+    Args:
+        groups (Iterable[str]): The groups of text to convert.
+        unicode_type (converter.Style): The normalized Unicode type name,
+            or a tuple of them to fuse into a pipeline.
+        strict_case (bool): Whether to forbid case fallback.
+        reverse (bool): Whether to reverse each group.
+        jobs (int): The number of worker processes.
+
+    Yields:
+        str: The converted groups.
+    """
+    in_flight: Deque["Future[str]"] = collections.deque()
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(unicode_type, strict_case),
+    ) as executor:
+        for group in groups:
+            in_flight.append(executor.submit(_convert_chunk, group, reverse))
+            if len(in_flight) >= 2 * jobs:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
@@ -0,0 +1,527 @@
+"""Serve conversions over HTTP.
+
+A small HTTP/1.1 server built on asyncio streams, so that programs in
+any language can convert characters without paying for interpreter
+start-up on every call. Connections are kept alive between requests,
+every translation table is loaded before the server starts listening,
+and request bodies larger than ``MAX_BODY_SIZE`` bytes are rejected.
+
+Endpoints:
+    ``POST /convert`` takes a JSON object with "text" and "type", and
+    optionally "strict_case" and "reverse", and returns ``{"text": ...}``.
+
+    ``POST /show_all`` takes a JSON object with "text", and optionally
+    "types", "strict_case" and "reverse", and returns an object that maps
+    each type name to its conversion.
+
+    ``POST /batch`` takes a JSON array of ``/convert`` requests, and
+    returns an array of results. If the request's Content-Type is
+    "application/x-ndjson", it takes and returns one JSON value per
+    line instead. Each result is either ``{"text": ...}`` or
+    ``{"error": ...}``, so one invalid item does not fail the batch.
+
+    ``GET /health`` returns ``{"status": "ok"}``, and ``GET /metrics``
+    returns ``dressup.metrics`` in the Prometheus text format.
+"""
+import asyncio
+import http
+import json
+from typing import Dict, Tuple
+
+from . import aio, converter, exceptions, metrics
+
+MAX_BODY_SIZE = 1024 * 1024
+MAX_HEADER_SIZE = 16 * 1024
+KEEP_ALIVE_TIMEOUT = 75.0
+JSON_TYPE = "application/json"
+NDJSON_TYPE = "application/x-ndjson"
+PROMETHEUS_TYPE = "text/plain; version=0.0.4"
+
+Headers = Dict[str, str]
+
+
+class _HTTPError(Exception):
+    """An error to answer a request with.
+
+    Attributes:
+        status (int): The HTTP status code.
+        message (str): The error message.
+    """
+
+    def __init__(self, status: int, message: str) -> None:
+        """Constructor."""
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        pass
+
+
+def _dumps(value: object) -> bytes:
+    """Encode a value as compact UTF-8 JSON.
+
+    Lone surrogates, which JSON strings may hold but UTF-8 cannot
+    encode, are written as JSON escapes.
+
+    Args:
+        value (object): The value to encode.
+
+    Returns:
+        bytes: The encoded value.
+    """
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8", "backslashreplace"
+    )
+
+
+def _loads(body: bytes) -> object:
+    """Decode a JSON request body.
+
+    Args:
+        body (bytes): The request body.
+
+    Returns:
+        object: The decoded value.
+
+    Raises:
+        _HTTPError: Raised if the body is not valid JSON.
+    """
+    try:
+        return json.loads(body)
+    except ValueError as error:
+        raise _HTTPError(400, f"Invalid JSON: {error}") from error
+
+
+def _format_response(
+    status: int, body: bytes, content_type: str, keep_alive: bool
+) -> bytes:
+    """Format an HTTP response.
+
+    Args:
+        status (int): The HTTP status code.
+        body (bytes): The response body.
+        content_type (str): The media type of the body.
+        keep_alive (bool): Whether the connection stays open.
+
+    Returns:
+        bytes: The status line, headers and body.
+    """
+    head = (
+        f"HTTP/1.1 {status} {http.HTTPStatus(status).phrase}\r\n"
+        f"Content-Type: {content_type}; charset=utf-8\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+def _parse_head(head: bytes) -> Tuple[str, str, Headers, bool]:
+    """Parse the request line and headers of a request.
+
+    Args:
+        head (bytes): The request line and headers, ending with a blank
+            line.
+
+    Returns:
+        Tuple[str, str, Headers, bool]: The method, the path, the headers
+        with lowercase names, and whether the connection stays open.
+
+    Raises:
+        _HTTPError: Raised if the request is malformed.
+    """
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = request_line.split(" ")
+    except ValueError as error:
+        raise _HTTPError(400, "Malformed request line.") from error
+    if version not in ("HTTP/1.0", "HTTP/1.1"):
+        raise _HTTPError(505, f"Unsupported version {version}.")
+    headers = {}
+    for line in header_lines:
+        if line:
+            name, separator, value = line.partition(":")
+            if not separator:
+                raise _HTTPError(400, "Malformed header.")
+            headers[name.strip().lower()] = value.strip()
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.1":
+        keep_alive = connection != "close"
+    else:
+        keep_alive = connection == "keep-alive"
+    return method, target.partition("?")[0], headers, keep_alive
+
+
+async def _read_body(
+    reader: asyncio.StreamReader, method: str, headers: Headers, max_body_size: int
+) -> bytes:
+    """Read the body of a request.
+
+    Args:
+        reader (asyncio.StreamReader): The connection.
+        method (str): The method of the request.
+        headers (Headers): The headers of the request.
+        max_body_size (int): The largest accepted body, in bytes.
+
+    Returns:
+        bytes: The body.
+
+    Raises:
+        _HTTPError: Raised if the body is too large or its length is not
+            given.
+    """
+    if "transfer-encoding" in headers:
+        raise _HTTPError(501, "Chunked request bodies are not supported.")
+    length = headers.get("content-length")
+    if length is None:
+        if method == "POST":
+            raise _HTTPError(411, "Content-Length is required.")
+        return b""
+    if not (length.isascii() and length.isdigit()):
+        raise _HTTPError(400, "Invalid Content-Length.")
+    if int(length) > max_body_size:
+        raise _HTTPError(413, f"Request bodies are limited to {max_body_size} bytes.")
+    return await reader.readexactly(int(length))
+
+
+def _as_object(request: object) -> Dict[str, object]:
+    """Check that a decoded request is a JSON object.
+
+    Args:
+        request (object): The decoded request.
+
+    Returns:
+        Dict[str, object]: The request.
+
+    Raises:
+        _HTTPError: Raised if the request is not a JSON object.
+    """
+    if not isinstance(request, dict):
+        raise _HTTPError(400, "Expected a JSON object.")
+    return request
+
+
+def _text_args(request: Dict[str, object]) -> Tuple[str, bool, bool]:
+    """Validate the arguments shared by every conversion request.
+
+    Args:
+        request (Dict[str, object]): The decoded request.
+
+    Returns:
+        Tuple[str, bool, bool]: The characters, and whether to use strict
+        case and to reverse.
+
+    Raises:
+        _HTTPError: Raised if an argument is missing or has the wrong
+            type.
+    """
+    characters = request.get("text")
+    strict_case = request.get("strict_case", False)
+    reverse = request.get("reverse", False)
+    if not isinstance(characters, str):
+        raise _HTTPError(400, '"text" must be a string.')
+    if not isinstance(strict_case, bool) or not isinstance(reverse, bool):
+        raise _HTTPError(400, '"strict_case" and "reverse" must be booleans.')
+    return characters, strict_case, reverse
+
+
+def _conversion_args(request: object) -> Tuple[str, str, bool, bool]:
+    """Validate the arguments of a ``/convert`` request.
+
+    Args:
+        request (object): The decoded request.
+
+    Returns:
+        Tuple[str, str, bool, bool]: The characters, the Unicode type,
+        and whether to use strict case and to reverse.
+
+    Raises:
+        _HTTPError: Raised if an argument is missing or has the wrong
+            type.
+    """
+    request = _as_object(request)
+    characters, strict_case, reverse = _text_args(request)
+    unicode_type = request.get("type")
+    if not isinstance(unicode_type, str):
+        raise _HTTPError(400, '"type" must be a string.')
+    return characters, unicode_type, strict_case, reverse
+
+
+def _convert_item(request: object) -> Dict[str, str]:
+    """Convert one item of a batch.
+
+    Args:
+        request (object): The decoded ``/convert`` request.
+
+    Returns:
+        Dict[str, str]: The converted characters under "text", or an
+        error message under "error".
+    """
+    try:
+        characters, unicode_type, strict_case, reverse = _conversion_args(request)
+        return {
+            "text": converter.convert(
+                characters, unicode_type, strict_case=strict_case, reverse=reverse
+            )
+        }
+    except _HTTPError as error:
+        return {"error": error.message}
+    except exceptions.InvalidUnicodeTypeError as error:
+        return {"error": str(error).replace("_", "-")}
+
+
+def _convert_line(line: bytes) -> Dict[str, str]:
+    """Convert one line of an NDJSON batch.
+
+    Args:
+        line (bytes): The encoded ``/convert`` request.
+
+    Returns:
+        Dict[str, str]: The converted characters under "text", or an
+        error message under "error".
+    """
+    try:
+        request = _loads(line)
+    except _HTTPError as error:
+        return {"error": error.message}
+    return _convert_item(request)
+
+
+def _convert_batch(body: bytes, ndjson: bool) -> bytes:
+    """Convert every item of a batch.
+
+    Args:
+        body (bytes): The request body.
+        ndjson (bool): Whether the body holds one request per line.
+
+    Returns:
+        bytes: The response body.
+
+    Raises:
+        _HTTPError: Raised if the body of a JSON array batch is malformed.
+    """
+    if ndjson:
+        results = [_convert_line(line) for line in body.splitlines() if line.strip()]
+        return b"".join(_dumps(result) + b"\n" for result in results)
+    requests = _loads(body)
+    if not isinstance(requests, list):
+        raise _HTTPError(400, "Expected a JSON array.")
+    return _dumps([_convert_item(request) for request in requests])
+
+
+async def _convert(body: bytes) -> bytes:
+    """Answer a ``/convert`` request.
+
+    Args:
+        body (bytes): The request body.
+
+    Returns:
+        bytes: The response body.
+
+    Raises:
+        _HTTPError: Raised if the request is invalid.
+    """
+    characters, unicode_type, strict_case, reverse = _conversion_args(_loads(body))
+    try:
+        converted_characters = await aio.aconvert(
+            characters, unicode_type, strict_case=strict_case, reverse=reverse
+        )
+    except exceptions.InvalidUnicodeTypeError as error:
+        raise _HTTPError(400, str(error).replace("_", "-")) from error
+    return _dumps({"text": converted_characters})
+
+
+async def _show_all(body: bytes) -> bytes:
+    """Answer a ``/show_all`` request.
+
+    Args:
+        body (bytes): The request body.
+
+    Returns:
+        bytes: The response body.
+
+    Raises:
+        _HTTPError: Raised if the request is invalid.
+    """
+    request = _as_object(_loads(body))
+    characters, strict_case, reverse = _text_args(request)
+    types = request.get("types")
+    if types is not None and not (
+        isinstance(types, list) and all(isinstance(name, str) for name in types)
+    ):
+        raise _HTTPError(400, '"types" must be an array of strings.')
+    try:
+        converted_characters = await aio.ashow_all(
+            characters, strict_case=strict_case, reverse=reverse, types=types
+        )
+    except exceptions.InvalidUnicodeTypeError as error:
+        raise _HTTPError(400, str(error).replace("_", "-")) from error
+    return _dumps(converted_characters)
+
+
+async def _dispatch(
+    method: str, path: str, headers: Headers, body: bytes
+) -> Tuple[bytes, str]:
+    """Answer a request.
+
+    Batches larger than ``aio.OFFLOAD_THRESHOLD`` bytes are converted on
+    the event loop's default executor.
+
+    Args:
+        method (str): The method of the request.
+        path (str): The path of the request.
+        headers (Headers): The headers of the request.
+        body (bytes): The body of the request.
+
+    Returns:
+        Tuple[bytes, str]: The response body and its media type.
+
+    Raises:
+        _HTTPError: Raised if the request is invalid.
+    """
+    expected_method = "GET" if path in ("/health", "/metrics") else "POST"
+    if path not in ("/convert", "/show_all", "/batch", "/health", "/metrics"):
+        raise _HTTPError(404, f"No endpoint at {path}.")
+    if method != expected_method:
+        raise _HTTPError(405, f"{path} only accepts {expected_method}.")
+    if path == "/convert":
+        return await _convert(body), JSON_TYPE
+    elif path == "/show_all":
+        return await _show_all(body), JSON_TYPE
+    elif path == "/batch":
+        ndjson = headers.get("content-type", "").startswith(NDJSON_TYPE)
+        if len(body) > aio.OFFLOAD_THRESHOLD:
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(None, _convert_batch, body, ndjson)
+        else:
+            response = _convert_batch(body, ndjson)
+        return response, NDJSON_TYPE if ndjson else JSON_TYPE
+    elif path == "/health":
+        return _dumps({"status": "ok"}), JSON_TYPE
+    return metrics.to_prometheus().encode(), PROMETHEUS_TYPE
+
+
+async def _answer(
+    reader: asyncio.StreamReader, head: bytes, max_body_size: int
+) -> Tuple[bytes, bool]:
+    """Read the body of a request and answer it.
+
+    Unexpected errors are answered with a 500 response, which closes the
+    connection.
+
+    Args:
+        reader (asyncio.StreamReader): The connection.
+        head (bytes): The request line and headers.
+        max_body_size (int): The largest accepted body, in bytes.
+
+    Returns:
+        Tuple[bytes, bool]: The response, and whether the connection
+        stays open.
+    """
+    try:
+        method, path, headers, keep_alive = _parse_head(head)
+        body = await _read_body(reader, method, headers, max_body_size)
+    except _HTTPError as error:
+        response_body = _dumps({"error": error.message})
+        return _format_response(error.status, response_body, JSON_TYPE, False), False
+    try:
+        response_body, content_type = await _dispatch(method, path, headers, body)
+    except _HTTPError as error:
+        response_body = _dumps({"error": error.message})
+        response = _format_response(error.status, response_body, JSON_TYPE, keep_alive)
+    except Exception:
+        response_body = _dumps({"error": "Internal server error."})
+        return _format_response(500, response_body, JSON_TYPE, False), False
+    else:
+        response = _format_response(200, response_body, content_type, keep_alive)
+    return response, keep_alive
+
+
+async def _handle_connection(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, max_body_size: int
+) -> None:
+    """Answer the requests of one connection until it closes.
+
+    Args:
+        reader (asyncio.StreamReader): The incoming side of the
+            connection.
+        writer (asyncio.StreamWriter): The outgoing side of the
+            connection.
+        max_body_size (int): The largest accepted body, in bytes.
+    """
+    keep_alive = True
+    try:
+        while keep_alive:
+            try:
+                head = await asyncio.wait_for(
+                    reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT
+                )
+            except asyncio.LimitOverrunError:
+                response_body = _dumps({"error": "Request headers are too large."})
+                writer.write(_format_response(431, response_body, JSON_TYPE, False))
+                break
+            except (asyncio.IncompleteReadError, asyncio.TimeoutError):
+                break
+            response, keep_alive = await _answer(reader, head, max_body_size)
+            writer.write(response)
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+    pass
+
+
+async def start_server(
+    host: str = "127.0.0.1", port: int = 8000, max_body_size: int = MAX_BODY_SIZE
+) -> asyncio.base_events.Server:
+    """Load every translation table and start listening.
+
+    Args:
+        host (str): The address to listen on. By default "127.0.0.1".
+        port (int): The port to listen on, or 0 for any free port. By
+            default 8000.
+        max_body_size (int): The largest accepted request body, in
+            bytes. By default ``MAX_BODY_SIZE``.
+
+    Returns:
+        asyncio.base_events.Server: The listening server.
+    """
+    await aio.warm_up()
+    return await asyncio.start_server(
+        lambda reader, writer: _handle_connection(reader, writer, max_body_size),
+        host,
+        port,
+        limit=MAX_HEADER_SIZE,
+    )
+
+
+async def _serve_forever(host: str, port: int, max_body_size: int) -> None:
+    """Start a server and answer requests until cancelled.
+
+    Args:
+        host (str): The address to listen on.
+        port (int): The port to listen on.
+        max_body_size (int): The largest accepted request body, in
+            bytes.
+    """
+    server = await start_server(host, port, max_body_size)
+    address, bound_port = server.sockets[0].getsockname()[:2]
+    print(f"Serving on http://{address}:{bound_port}", flush=True)
+    async with server:
+        await server.serve_forever()
+    pass
+
+
+def serve(
+    host: str = "127.0.0.1", port: int = 8000, max_body_size: int = MAX_BODY_SIZE
+) -> None:
+    """Serve conversions over HTTP until interrupted.
+
+    Args:
+        host (str): The address to listen on. By default "127.0.0.1".
+        port (int): The port to listen on, or 0 for any free port. By
+            default 8000.
+        max_body_size (int): The largest accepted request body, in
+            bytes. By default ``MAX_BODY_SIZE``.
+    """
+    asyncio.run(_serve_forever(host, port, max_body_size))
+    pass
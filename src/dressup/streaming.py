@@ -0,0 +1,268 @@
+"""Convert streams of Unicode characters."""
+import codecs
+import functools
+import itertools
+import mmap
+import os
+import stat
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Union
+import zlib
+
+from . import converter
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+FILE_CHUNK_SIZE = 1024 * 1024
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _iter_chunks(
+    source: Union[Iterable[str], TextIO], chunk_size: int
+) -> Iterator[str]:
+    """Iterate over the chunks of a source.
+
+    Args:
+        source (Union[Iterable[str], TextIO]): An iterable of strings or
+            a text file object.
+        chunk_size (int): The number of characters to read at a time
+            from a file object.
+
+    Returns:
+        Iterator[str]: The chunks of ``source``.
+    """
+    read = getattr(source, "read", None)
+    if read is not None:
+        return iter(functools.partial(read, chunk_size), "")
+    return iter(source)
+
+
+def _translate_chunks(
+    chunks: Iterator[str], tables: List[converter.TranslationTable], reverse: bool
+) -> Iterator[List[str]]:
+    """Translate chunks with several tables.
+
+    Args:
+        chunks (Iterator[str]): The chunks to translate.
+        tables (List[converter.TranslationTable]): The translation tables.
+        reverse (bool): Whether to reverse the whole stream. The source
+            is buffered in full in this case, since its last character
+            is the first to be returned.
+
+    Yields:
+        List[str]: The chunk translated with each table.
+    """
+    if reverse:
+        chunks = reversed(list(chunks))
+    for chunk in chunks:
+        if reverse:
+            chunk = chunk[::-1]
+        yield [chunk.translate(table) for table in tables]
+
+
+def convert_stream(
+    source: Union[Iterable[str], TextIO],
+    unicode_type: Union[str, Iterable[str]],
+    strict_case: bool = False,
+    reverse: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Convert a stream of characters to a Unicode character type.
+
+    Chunks are converted as they are read, so memory use is bounded by
+    the chunk size rather than the size of the source.
+
+    Args:
+        source (Union[Iterable[str], TextIO]): The characters to
+            convert. Either an iterable of strings, such as a list or a
+            generator, or a text file object.
+        unicode_type (Union[str, Iterable[str]]): The type of Unicode
+            character types to convert to, or several types to apply one
+            after another. Accepts the same values as ``convert``.
+        strict_case (bool): Whether to forbid a character from being
+            converted to its lower or upper case counterpart if an exact
+            mapping is not found. By default False.
+        reverse (bool): Whether to reverse the returned characters. The
+            whole source is held in memory when True. By default False.
+        chunk_size (int): The number of characters to read at a time
+            from a file object. By default 65536.
+
+    Returns:
+        Iterator[str]: The converted chunks.
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if value inputted in
+            ``unicode_type`` is invalid.
+
+    Example:
+        Convert a list of chunks to negative circle characters.
+
+        >>> import dressup
+        >>> list(dressup.convert_stream(["Hel", "lo"], "negative circle"))
+        ['🅗🅔🅛', '🅛🅞']
+    """  # noqa: DAR402
+    table = converter._get_table(
+        converter._normalize_style(unicode_type), strict_case=strict_case
+    )
+    chunks = _iter_chunks(source, chunk_size)
+    return (
+        converted_chunks[0]
+        for converted_chunks in _translate_chunks(chunks, [table], reverse=reverse)
+    )
+
+
+def show_all_stream(
+    source: Union[Iterable[str], TextIO],
+    strict_case: bool = False,
+    reverse: bool = False,
+    types: Optional[Iterable[str]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Dict[str, str]]:
+    """Convert a stream of characters to all Unicode character types.
+
+    Args:
+        source (Union[Iterable[str], TextIO]): The characters to
+            convert. Either an iterable of strings, such as a list or a
+            generator, or a text file object.
+        strict_case (bool): Whether to forbid a character from being
+            converted to its lower or upper case counterpart if an exact
+            mapping is not found. By default False.
+        reverse (bool): Whether to reverse the returned characters. The
+            whole source is held in memory when True. By default False.
+        types (Iterable[str], optional): The Unicode types to convert
+            to. By default every type is returned.
+        chunk_size (int): The number of characters to read at a time
+            from a file object. By default 65536.
+
+    Returns:
+        Iterator[Dict[str, str]]: A dictionary for each chunk, where the
+        keys are the names of character types and the values are the
+        converted chunk.
+
+    Raises:
+        InvalidUnicodeTypeError: Raised if a value inputted in ``types``
+            is invalid.
+
+    Example:
+        Convert a list of chunks to math bold characters.
+
+        >>> import dressup
+        >>> list(dressup.show_all_stream(["Hel", "lo"], types=["math bold"]))
+        [{'Math bold': '𝐇𝐞𝐥'}, {'Math bold': '𝐥𝐨'}]
+    """  # noqa: DAR402
+    unicode_types = converter._normalize_types(types)
+    tables = [
+        converter._get_table(unicode_type, strict_case=strict_case)
+        for unicode_type in unicode_types
+    ]
+    names = [converter._format_names(unicode_type) for unicode_type in unicode_types]
+    chunks = _iter_chunks(source, chunk_size)
+    return (
+        dict(zip(names, converted_chunks))
+        for converted_chunks in _translate_chunks(chunks, tables, reverse=reverse)
+    )
+
+
+def _read_bytes(path: str, chunk_size: int) -> Iterator[bytes]:
+    """Read a file in chunks of bytes.
+
+    Regular files are memory-mapped. Standard input, pipes and empty
+    files are read with buffered reads.
+
+    Args:
+        path (str): The path of the file, or "-" for standard input.
+        chunk_size (int): The number of bytes in each chunk.
+
+    Yields:
+        bytes: The chunks of the file.
+    """
+    if path == "-":
+        yield from iter(functools.partial(sys.stdin.buffer.read, chunk_size), b"")
+        return
+    with open(path, "rb") as file:
+        file_stat = os.fstat(file.fileno())
+        if not stat.S_ISREG(file_stat.st_mode) or file_stat.st_size == 0:
+            yield from iter(functools.partial(file.read, chunk_size), b"")
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            for start in range(0, file_stat.st_size, chunk_size):
+                yield mapped[start : start + chunk_size]
+
+
+def _gunzip(chunks: Iterator[bytes], chunk_size: int) -> Iterator[bytes]:
+    """Decompress chunks of gzip data.
+
+    Concatenated gzip members are decompressed one after another, and
+    each returned chunk holds at most ``chunk_size`` bytes.
+
+    Args:
+        chunks (Iterator[bytes]): The compressed chunks.
+        chunk_size (int): The maximum number of bytes in each chunk.
+
+    Yields:
+        bytes: The decompressed chunks.
+
+    Raises:
+        error: Raised if the data is not valid gzip, or ends in the
+            middle of a member.
+    """
+    decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+    in_member = False
+    for chunk in chunks:
+        while chunk:
+            in_member = True
+            yield decompressor.decompress(chunk, chunk_size)
+            if decompressor.eof:
+                chunk = decompressor.unused_data
+                decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+                in_member = False
+            else:
+                chunk = decompressor.unconsumed_tail
+    yield decompressor.flush()
+    if in_member and not decompressor.eof:
+        raise zlib.error(
+            "Compressed file ended before the end-of-stream marker was reached"
+        )
+
+
+def read_text(path: str, chunk_size: int = FILE_CHUNK_SIZE) -> Iterator[str]:
+    """Read a UTF-8 file in chunks of text.
+
+    Gzip-compressed files are detected and decompressed as they are
+    read.
+
+    Args:
+        path (str): The path of the file, or "-" for standard input.
+        chunk_size (int): The number of bytes to read at a time. By
+            default 1 MiB.
+
+    Yields:
+        str: The decoded chunks of the file.
+    """
+    yield from _decode_chunks(_read_bytes(path, chunk_size), chunk_size)
+
+
+def _decode_chunks(
+    chunks: Iterator[bytes], chunk_size: int = FILE_CHUNK_SIZE
+) -> Iterator[str]:
+    """Decode chunks of UTF-8 bytes, which may be gzip-compressed.
+
+    Args:
+        chunks (Iterator[bytes]): The chunks of bytes.
+        chunk_size (int): The number of bytes to decompress at a time.
+            By default 1 MiB.
+
+    Yields:
+        str: The decoded chunks.
+    """
+    first_chunk = next(chunks, b"")
+    chunks = itertools.chain([first_chunk], chunks)
+    if first_chunk.startswith(GZIP_MAGIC):
+        chunks = _gunzip(chunks, chunk_size)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    decoder.decode(b"", final=True)
@@ -1,15 +1,23 @@
 """Package-wide test fixtures."""
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import threading
+from typing import Iterator
 from unittest.mock import Mock
 
 import pytest
 from pytest_mock import MockFixture
+import toml
+
+from dressup import converter, daemon
 
 
 @pytest.fixture
-def mock_toml_loads(mocker: MockFixture) -> Mock:
+def mock_toml_loads(mocker: MockFixture, tmp_path: Path) -> Iterator[Mock]:
     """Fixture for mocking toml.loads."""
-    mock = mocker.patch("toml.loads")
-    mock.return_value = {
+    unicode_mapping = {
         "circled": dict(
             zip(
                 "abcdefghijklmnopqrstuvwxyzDRESSUP", "ⓐⓑⓒⓓⓔⓕⓖⓗⓘⓙⓚⓛⓜⓝⓞⓟⓠⓡⓢⓣⓤⓥⓦⓧⓨⓩⒹⓇⒺⓈⓈⓊⓅ"
@@ -19,4 +27,28 @@ def mock_toml_loads(mocker: MockFixture) -> Mock:
             zip("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "🅐🅑🅒🅓🅔🅕🅖🅗🅘🅙🅚🅛🅜🅝🅞🅟🅠🅡🅢🅣🅤🅥🅦🅧🅨🅩")
         ),
     }
-    return mock
+    toml_path = tmp_path / "translator.toml"
+    toml_path.write_text(toml.dumps(unicode_mapping), encoding="utf-8")
+    mocker.patch("dressup.converter.TOML_PATH", toml_path)
+    mocker.patch("dressup.converter._load_artifact", return_value=None)
+    mock = mocker.patch("toml.loads")
+    mock.return_value = unicode_mapping
+    converter.registry.clear()
+    yield mock
+    converter.registry.clear()
+
+
+@pytest.fixture
+def daemon_path() -> Iterator[str]:
+    """Fixture for a daemon answering on a Unix socket."""
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "dressup.sock")
+    server = daemon.make_server(path)
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield path
+    server.shutdown()
+    server.server_close()
+    shutil.rmtree(directory)
@@ -0,0 +1,144 @@
+"""Test cases for the aio module."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, List
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockFixture
+
+from dressup import aio, converter, exceptions
+
+
+@pytest.mark.parametrize("threshold", [None, 0])
+@pytest.mark.parametrize("strict_case", [False, True])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_aconvert(
+    mock_toml_loads: Mock, threshold: int, strict_case: bool, reverse: bool
+) -> None:
+    """It converts the same way as convert."""
+    converted_characters = asyncio.run(
+        aio.aconvert(
+            "he(lo 💦",
+            "Negative circled",
+            strict_case=strict_case,
+            reverse=reverse,
+            threshold=threshold,
+        )
+    )
+    assert converted_characters == converter.convert(
+        "he(lo 💦", "Negative circled", strict_case=strict_case, reverse=reverse
+    )
+
+
+def test_aconvert_long(mocker: MockFixture) -> None:
+    """It converts long inputs on the executor in slices."""
+    mocker.patch("dressup.aio.SLICE_SIZE", 3)
+    executor = ThreadPoolExecutor(max_workers=1)
+    spy = mocker.spy(executor, "submit")
+    converted_characters = asyncio.run(
+        aio.aconvert("hello", "circle", threshold=4, executor=executor)
+    )
+    assert converted_characters == "ⓗⓔⓛⓛⓞ"
+    assert spy.called
+
+
+def test_aconvert_loads_on_executor(mocker: MockFixture, mock_toml_loads: Mock) -> None:
+    """It loads missing tables on the executor and reuses them after."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    submit = mocker.spy(executor, "submit")
+    asyncio.run(aio.aconvert("hello", "circled", executor=executor))
+    assert submit.call_count == 1
+    asyncio.run(aio.aconvert("hello", "circled", executor=executor))
+    assert submit.call_count == 1
+
+
+def test_aconvert_pipeline(mocker: MockFixture) -> None:
+    """It converts with several Unicode types the same way as convert."""
+    converter.registry.clear()
+    executor = ThreadPoolExecutor(max_workers=1)
+    submit = mocker.spy(executor, "submit")
+    unicode_types = ["small caps", "superscript"]
+    for _ in range(2):
+        converted_characters = asyncio.run(
+            aio.aconvert("Quixotic", unicode_types, executor=executor)
+        )
+        assert converted_characters == converter.convert("Quixotic", unicode_types)
+    assert submit.call_count == 1
+
+
+def test_aconvert_invalid_type(mock_toml_loads: Mock) -> None:
+    """It raises an InvalidUnicodeTypeError."""
+    with pytest.raises(exceptions.InvalidUnicodeTypeError):
+        asyncio.run(aio.aconvert("hello", "non-existant type"))
+
+
+@pytest.mark.parametrize("threshold", [None, 0])
+def test_ashow_all(mock_toml_loads: Mock, threshold: int) -> None:
+    """It converts the same way as show_all."""
+    converted_characters = asyncio.run(
+        aio.ashow_all("hello", reverse=True, threshold=threshold)
+    )
+    assert converted_characters == converter.show_all("hello", reverse=True)
+
+
+def test_ashow_all_types(mock_toml_loads: Mock) -> None:
+    """It converts to the requested Unicode types."""
+    converted_characters = asyncio.run(
+        aio.ashow_all("hello", types=iter(["negative-circled"]))
+    )
+    assert converted_characters == {"Negative circled": "🅗🅔🅛🅛🅞"}
+
+
+def test_warm_up(mock_toml_loads: Mock) -> None:
+    """It loads every translation table."""
+    asyncio.run(aio.warm_up())
+    for unicode_type in ("circled", "negative_circled"):
+        for strict_case in (False, True):
+            assert converter.registry.is_compiled(unicode_type, strict_case)
+
+
+def test_warm_up_types(mock_toml_loads: Mock) -> None:
+    """It loads the requested translation tables."""
+    asyncio.run(aio.warm_up(iter(["circled"])))
+    assert converter.registry.is_compiled("circled")
+    assert not converter.registry.is_compiled("negative_circled")
+
+
+async def generate_chunks() -> AsyncIterator[str]:
+    """Generate chunks of characters asynchronously."""
+    yield "he"
+    yield "(lo"
+
+
+async def collect(chunks: AsyncIterator[str]) -> List[str]:
+    """Collect the chunks of an asynchronous iterator."""
+    return [chunk async for chunk in chunks]
+
+
+@pytest.mark.parametrize(
+    "reverse, expected_output", [(False, ["ⓗⓔ", "(ⓛⓞ"]), (True, ["ⓞⓛ(", "ⓔⓗ"])]
+)
+def test_aconvert_stream(
+    mock_toml_loads: Mock, reverse: bool, expected_output: List[str]
+) -> None:
+    """It converts each chunk of an asynchronous iterator."""
+    converted_chunks = aio.aconvert_stream(
+        generate_chunks(), "circled", reverse=reverse, threshold=2
+    )
+    assert asyncio.run(collect(converted_chunks)) == expected_output
+
+
+def test_aconvert_stream_pipeline() -> None:
+    """It converts each chunk with several Unicode types."""
+    converted_chunks = aio.aconvert_stream(["Quix", "otic"], ["small caps", "cute"])
+    assert asyncio.run(collect(converted_chunks)) == [
+        converter.convert("Quix", ["small caps", "cute"]),
+        converter.convert("otic", ["small caps", "cute"]),
+    ]
+
+
+def test_aconvert_stream_iterable(mock_toml_loads: Mock) -> None:
+    """It converts each chunk of a synchronous iterable."""
+    converted_chunks = aio.aconvert_stream(["he", "(lo"], "circled")
+    assert asyncio.run(collect(converted_chunks)) == ["ⓗⓔ", "(ⓛⓞ"]
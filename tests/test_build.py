@@ -0,0 +1,196 @@
+"""Test cases for the build module."""
+from pathlib import Path
+from typing import List
+
+import pytest
+import toml
+
+from dressup import build, converter, exceptions
+
+
+def test_artifact_is_current() -> None:
+    """It matches the tables generated from translator.toml."""
+    source = build.TOML_PATH.read_bytes()
+    expected_artifact = build.render_artifact(toml.loads(source.decode()), source)
+    assert build.ARTIFACT_PATH.read_text(encoding="utf-8") == expected_artifact
+
+
+def test_build(tmp_path: Path) -> None:
+    """It writes an importable module with the compiled tables."""
+    toml_path = tmp_path / "translator.toml"
+    toml_path.write_text('[circled]\na = "ⓐ"\n"\\"" = "〃"\n', encoding="utf-8")
+    artifact_path = tmp_path / "translator_tables.py"
+    build.build(toml_path, artifact_path)
+    namespace: dict = {}
+    exec(artifact_path.read_text(encoding="utf-8"), namespace)  # noqa: S102
+    assert namespace["SOURCE_CHECKSUM"] == converter.source_checksum(
+        toml_path.read_bytes()
+    )
+    assert namespace["MAPPINGS"] == {"circled": {"a": "ⓐ", '"': "〃"}}
+    assert "TABLES" not in namespace
+    assert namespace["CASE_FALLBACKS"] == {"circled": {ord("A"): "ⓐ"}}
+    assert namespace["STYLE_CHECKSUMS"] == {
+        "circled": build.style_checksum({"a": "ⓐ", '"': "〃"})
+    }
+
+
+@pytest.fixture
+def sources(tmp_path: Path) -> List[Path]:
+    """Fixture for a text source and a TOML source."""
+    text_path = tmp_path / "styles.txt"
+    text_path.write_text("abc\ncircled ⓐⓑc\n\nsquare 🄰🄱🄲\n", encoding="utf-8")
+    toml_path = tmp_path / "extra.toml"
+    toml_path.write_text('[parenthesized]\na = "⒜"\n', encoding="utf-8")
+    return [text_path, toml_path]
+
+
+def test_split_mapping() -> None:
+    """It maps the characters that differ."""
+    assert build.split_mapping("abc", "ⓐbⓒ") == {"a": "ⓐ", "c": "ⓒ"}
+
+
+def test_split_mapping_combining_marks() -> None:
+    """It keeps combining marks with the character before them."""
+    assert build.split_mapping("ab!", "a̶b̶̶!") == {"a": "a̶", "b": "b̶̶"}
+
+
+@pytest.mark.parametrize(
+    "base_characters, converted_characters, expected_message",
+    [
+        ("abc", "ⓐⓑ", "line: expected 3 characters, found 2."),
+        ("aba", "ⓐⓑⓒ", "line: repeated characters: a"),
+        ("abc", "ⓐⓐⓐ", "line: repeated characters: ⓐ"),
+    ],
+)
+def test_split_mapping_invalid(
+    base_characters: str, converted_characters: str, expected_message: str
+) -> None:
+    """It rejects characters that cannot be paired."""
+    with pytest.raises(exceptions.InvalidSourceError, match=expected_message):
+        build.split_mapping(base_characters, converted_characters, "line")
+
+
+@pytest.mark.parametrize(
+    "lines, expected_message",
+    [
+        (["ab", "circled ⓐⓑ", "circled ⓐⓑ"], "styles.txt:3: circled is defined twice."),
+        (["ab", "circled"], "styles.txt:2: expected a style name"),
+    ],
+)
+def test_parse_text_source_invalid(lines: List[str], expected_message: str) -> None:
+    """It rejects malformed lines."""
+    with pytest.raises(exceptions.InvalidSourceError, match=expected_message):
+        build.parse_text_source(lines, "styles.txt")
+
+
+@pytest.mark.parametrize(
+    "text, expected_message",
+    [
+        ("[circled\n", "Key group not on a line by itself"),
+        ('circled = "ⓐ"\n', "circled must be a table of strings."),
+        ("[circled]\na = 1\n", "circled must be a table of strings."),
+        ('[circled]\na = "ⓐ"\nb = "ⓐ"\n', "circled repeats characters: ⓐ"),
+        ('[circled]\nab = "ⓐ"\n', "circled has invalid keys: ab"),
+    ],
+)
+def test_read_source_invalid_toml(
+    tmp_path: Path, text: str, expected_message: str
+) -> None:
+    """It rejects malformed TOML sources."""
+    path = tmp_path / "styles.toml"
+    path.write_text(text, encoding="utf-8")
+    with pytest.raises(exceptions.InvalidSourceError, match=expected_message):
+        build.read_source(path)
+
+
+def test_merge_sources(sources: List[Path]) -> None:
+    """It merges styles in the order of the sources."""
+    assert build.merge_sources(sources) == {
+        "circled": {"a": "ⓐ", "b": "ⓑ"},
+        "square": {"a": "🄰", "b": "🄱", "c": "🄲"},
+        "parenthesized": {"a": "⒜"},
+    }
+
+
+def test_merge_sources_conflict(sources: List[Path], tmp_path: Path) -> None:
+    """It rejects styles defined in two sources."""
+    conflicting_path = tmp_path / "conflict.toml"
+    conflicting_path.write_text('[square]\na = "🅰"\n', encoding="utf-8")
+    with pytest.raises(
+        exceptions.InvalidSourceError, match="square is defined in both"
+    ):
+        build.merge_sources([*sources, conflicting_path])
+
+
+def test_read_artifact(tmp_path: Path) -> None:
+    """It reads literal constants and skips everything else."""
+    path = tmp_path / "translator_tables.py"
+    path.write_text('A = {"a": 1}\nB = len("b")\nC.d = 1\nimport os\n')
+    assert build.read_artifact(path) == {"A": {"a": 1}}
+    path.write_text("A = (\n")
+    assert build.read_artifact(path) == {}
+    assert build.read_artifact(tmp_path / "missing.py") == {}
+
+
+def test_render_toml() -> None:
+    """It escapes quotes, backslashes, combining marks and control codes."""
+    mappings = {"styled": {'"': "〃", "\\": "⦸", "a b": "x\t", "suffix": "\u0336"}}
+    expected_text = (
+        '[styled]\n"\\"" = "〃"\n"\\\\" = "⦸"\n"a b" = "x\\u0009"\n'
+        'suffix = "\\u0336"\n'
+    )
+    assert build.render_toml(mappings) == expected_text
+    assert toml.loads(expected_text) == mappings
+
+
+def test_render_toml_round_trip() -> None:
+    """It reproduces the shipped translator.toml."""
+    mappings = build.read_source(build.TOML_PATH)
+    assert build.render_toml(mappings) == build.TOML_PATH.read_text(encoding="utf-8")
+
+
+def test_build_tables(sources: List[Path], tmp_path: Path) -> None:
+    """It writes translator.toml and its tables, then reuses them."""
+    toml_path = tmp_path / "translator.toml"
+    artifact_path = tmp_path / "translator_tables.py"
+    timings = build.build_tables(sources, toml_path, artifact_path)
+    assert list(timings) == ["circled", "square", "parenthesized"]
+    assert all(seconds is not None for seconds in timings.values())
+    namespace: dict = {}
+    exec(artifact_path.read_text(encoding="utf-8"), namespace)  # noqa: S102
+    assert namespace["SOURCE_CHECKSUM"] == converter.source_checksum(
+        toml_path.read_bytes()
+    )
+    assert namespace["MAPPINGS"] == build.merge_sources(sources)
+    assert set(namespace["PREVIEWS"][converter.PREVIEW_TEXT]) == set(timings)
+    modified_time = artifact_path.stat().st_mtime_ns
+    assert set(build.build_tables(sources, toml_path, artifact_path).values()) == {None}
+    assert artifact_path.stat().st_mtime_ns == modified_time
+
+
+def test_build_tables_changed_style(sources: List[Path], tmp_path: Path) -> None:
+    """It only compiles the styles that changed."""
+    toml_path = tmp_path / "translator.toml"
+    artifact_path = tmp_path / "translator_tables.py"
+    build.build_tables(sources, toml_path, artifact_path)
+    sources[1].write_text('[parenthesized]\nb = "⒝"\n', encoding="utf-8")
+    timings = build.build_tables(sources, toml_path, artifact_path)
+    assert [name for name, seconds in timings.items() if seconds is not None] == [
+        "parenthesized"
+    ]
+    forced_timings = build.build_tables(sources, toml_path, artifact_path, force=True)
+    assert None not in forced_timings.values()
+    rebuilt_artifact = artifact_path.read_text(encoding="utf-8")
+    source = toml_path.read_bytes()
+    assert rebuilt_artifact == build.render_artifact(
+        toml.loads(source.decode()), source
+    )
+
+
+def test_compile_styles_suffix() -> None:
+    """It previews suffix rules whatever the case."""
+    compiled, _ = build.compile_styles({"strikethrough": {"suffix": "̶"}})
+    expected_preview = "D̶r̶e̶s̶s̶ U̶p̶!̶"
+    assert compiled["PREVIEWS"] == {"strikethrough": expected_preview}
+    assert compiled["STRICT_PREVIEWS"] == {"strikethrough": expected_preview}
+    assert compiled["CASE_FALLBACKS"] == {"strikethrough": {}}
@@ -0,0 +1,121 @@
+"""Test cases for the cache module."""
+import concurrent.futures
+from typing import Iterator
+
+import pytest
+from pytest_mock import MockFixture
+
+from dressup import cache, converter, exceptions
+
+
+@pytest.fixture
+def result_cache() -> Iterator[cache.ResultCache]:
+    """Fixture for memoizing conversions in a fresh cache."""
+    yield cache.enable()
+    cache.disable()
+
+
+def test_convert_hit(result_cache: cache.ResultCache, mocker: MockFixture) -> None:
+    """It converts repeated text once."""
+    spy = mocker.spy(converter, "_get_table")
+    assert converter.convert("Hello", "math bold") == "𝐇𝐞𝐥𝐥𝐨"
+    assert converter.convert("Hello", "Math-Bold") == "𝐇𝐞𝐥𝐥𝐨"
+    assert spy.call_count == 1
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "entries": 1,
+        "characters": 10,
+    }
+
+
+def test_convert_options(result_cache: cache.ResultCache) -> None:
+    """It keys results on the case and reverse options."""
+    assert converter.convert("hi", "negative circle") == "🅗🅘"
+    assert converter.convert("hi", "negative circle", strict_case=True) == "hi"
+    assert converter.convert("hi", "negative circle", reverse=True) == "🅘🅗"
+    assert cache.stats()["entries"] == 3
+
+
+def test_invalid_type_not_cached(result_cache: cache.ResultCache) -> None:
+    """It raises for an invalid type every time."""
+    for _ in range(2):
+        with pytest.raises(exceptions.InvalidUnicodeTypeError):
+            converter.convert("Hello", "invalid")
+    assert cache.stats()["entries"] == 0
+
+
+def test_show_all_hit(result_cache: cache.ResultCache, mocker: MockFixture) -> None:
+    """It returns a copy of the stored conversions."""
+    spy = mocker.spy(converter, "_get_table")
+    converted_characters = converter.show_all("Hi", types=["square"])
+    converted_characters["Square"] = "changed"
+    assert converter.show_all("Hi", types=["Square"]) == {"Square": "🄷🄸"}
+    assert converter.show_all("Hi") != {"Square": "🄷🄸"}
+    assert spy.call_count == 1 + len(converter.registry.names())
+    assert cache.stats()["hits"] == 1
+
+
+def test_evicts_least_recently_used() -> None:
+    """It evicts the least recently used result past max_entries."""
+    result_cache = cache.ResultCache(max_entries=2)
+    result_cache.put("first", "1", 1)
+    result_cache.put("second", "2", 1)
+    assert result_cache.get("first") == "1"
+    result_cache.put("third", "3", 1)
+    assert result_cache.get("second") is None
+    assert result_cache.get("first") == "1"
+    assert result_cache.stats()["evictions"] == 1
+
+
+def test_bounded_by_characters() -> None:
+    """It evicts results past max_characters and skips large ones."""
+    result_cache = cache.ResultCache(max_characters=10, max_item_characters=6)
+    result_cache.put("first", "1", 6)
+    result_cache.put("second", "2", 5)
+    result_cache.put("huge", "3", 7)
+    assert result_cache.get("first") is None
+    assert result_cache.get("huge") is None
+    assert result_cache.stats()["characters"] == 5
+
+
+def test_replace_entry() -> None:
+    """It counts the characters of a replaced result once."""
+    result_cache = cache.ResultCache()
+    result_cache.put("key", "first", 4)
+    result_cache.put("key", "second", 6)
+    assert result_cache.get("key") == "second"
+    assert result_cache.stats()["characters"] == 6
+
+
+def test_default_item_limit() -> None:
+    """It limits results to a sixteenth of the total by default."""
+    assert cache.ResultCache(max_characters=160).max_item_characters == 10
+
+
+def test_stats_disabled() -> None:
+    """It reports zeros while disabled."""
+    assert set(cache.stats().values()) == {0}
+
+
+def test_registry_clear(result_cache: cache.ResultCache) -> None:
+    """It discards results when the registry is cleared."""
+    converter.convert("Hello", "math bold")
+    converter.registry.clear()
+    assert cache.stats()["entries"] == 0
+
+
+def test_threads(result_cache: cache.ResultCache) -> None:
+    """It returns consistent results across threads."""
+    words = ["alpha", "beta", "gamma"] * 200
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(lambda word: converter.convert(word, "circle"), words)
+        )
+    assert results == [
+        converter.convert(word, "circle", strict_case=True) for word in words
+    ]
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 2 * len(words)
+    assert stats["entries"] == 6
@@ -0,0 +1,271 @@
+"""Test cases for the cli module."""
+import os
+import subprocess  # noqa: S404
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+from pytest_mock import MockFixture
+
+import dressup
+from dressup import cli, converter
+
+
+@pytest.mark.parametrize(
+    "args, expected_output",
+    [
+        (["-t", "monospace", "hi"], ("hi", "monospace", False, False)),
+        (["hi", "--type=math bold", "-s"], ("hi", "math bold", True, False)),
+        (["--reverse", "--strict-case", "-t", "x", ""], ("", "x", True, True)),
+        (["hi"], None),
+        (["-t", "monospace"], None),
+        (["-t"], None),
+        (["-t", "-s", "hi"], None),
+        (["-t", "monospace", "hi", "there"], None),
+        (["-t", "monospace", "-i", "input.txt"], None),
+        (["-sr", "-t", "monospace", "hi"], None),
+    ],
+)
+def test_parse_fast_args(
+    args: List[str], expected_output: Optional[Tuple[str, str, bool, bool]]
+) -> None:
+    """It only parses arguments that convert to a single type."""
+    assert cli.parse_fast_args(args) == expected_output
+
+
+def test_run_converts(mocker: MockFixture, capsys: pytest.CaptureFixture) -> None:
+    """It converts to a single type without the full interface."""
+    app = mocker.patch("dressup.console.app")
+    cli.run(["-t", "negative circle", "-r", "Hello"])
+    assert capsys.readouterr().out == "🅞🅛🅛🅔🅗\n"
+    app.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "word, expected_output",
+    [
+        ("serve", "ⓢⓔⓡⓥⓔ\n"),
+        ("daemon", "ⓓⓐⓔⓜⓞⓝ\n"),
+        ("build-tables", "ⓑⓤⓘⓛⓓ⊖ⓣⓐⓑⓛⓔⓢ\n"),
+    ],
+)
+def test_run_converts_service_names(
+    capsys: pytest.CaptureFixture, word: str, expected_output: str
+) -> None:
+    """It converts the names of the services like any other word."""
+    cli.run([word, "-t", "circle"])
+    assert capsys.readouterr().out == expected_output
+
+
+@pytest.mark.parametrize("option", ["-v", "--version"])
+def test_run_version(
+    mocker: MockFixture, capsys: pytest.CaptureFixture, option: str
+) -> None:
+    """It prints the version without the full interface."""
+    app = mocker.patch("dressup.console.app")
+    cli.run([option])
+    assert capsys.readouterr().out == f"Dress up version: {dressup.__version__}\n"
+    app.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["Hello"],
+        ["-t", "non-existant type", "Hello"],
+        ["--help"],
+        ["serve"],
+        ["daemon"],
+        ["build-tables"],
+    ],
+)
+def test_run_falls_back(mocker: MockFixture, args: List[str]) -> None:
+    """It passes other arguments to the full interface."""
+    app = mocker.patch("dressup.console.app")
+    cli.run(args)
+    app.assert_called_once_with(args=args)
+
+
+@pytest.mark.parametrize(
+    "instruction, line",
+    [
+        ("source_bash", "dressup -t "),
+        ("complete_powershell", "dressup -t "),
+        ("complete_zsh", "dressup --str"),
+        ("complete_zsh", "dressup -i -t "),
+    ],
+)
+def test_run_completion_falls_back(
+    mocker: MockFixture, monkeypatch: pytest.MonkeyPatch, instruction: str, line: str
+) -> None:
+    """It leaves other completion requests to the full interface."""
+    monkeypatch.setenv(cli.COMPLETE_VARIABLE, instruction)
+    monkeypatch.setenv("_TYPER_COMPLETE_ARGS", line)
+    app = mocker.patch("dressup.console.app")
+    cli.run(["--version"])
+    app.assert_called_once_with(args=["--version"])
+
+
+@pytest.mark.parametrize(
+    "shell, line, fish_action, expected_output, expected_status",
+    [
+        (
+            "bash",
+            "dressup -t math-bold-",
+            "",
+            "math-bold-fraktur\nmath-bold-italic\n" "math-bold-script\n",
+            0,
+        ),
+        (
+            "zsh",
+            'dressup "a$b" -t sq',
+            "",
+            """_arguments '*: :(("square":"🄰\\$🄱"))'\n""",
+            0,
+        ),
+        ("zsh", 'dressup "" -t sq', "", """_arguments '*: :(("square"))'\n""", 0),
+        ("zsh", "dressup -t x", "", "_files\n", 0),
+        ("fish", "dressup --type=ci", "get-args", "circle\tⒹⓡⓔⓢⓢ Ⓤⓟ!\n", 0),
+        ("fish", "dressup '' -t ci", "get-args", "circle\n", 0),
+        ("fish", "dressup -t ci", "is-args", "", 0),
+        ("fish", "dressup -t x", "is-args", "", 1),
+        ("fish", "dressup -t ci", "", "\n", 0),
+    ],
+)
+def test_run_completion(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+    shell: str,
+    line: str,
+    fish_action: str,
+    expected_output: str,
+    expected_status: int,
+) -> None:
+    """It answers completion of --type in the format of each shell."""
+    monkeypatch.setenv(cli.COMPLETE_VARIABLE, f"complete_{shell}")
+    monkeypatch.setenv("_TYPER_COMPLETE_ARGS", line)
+    monkeypatch.setenv("_TYPER_COMPLETE_FISH_ACTION", fish_action)
+    words = line.split(" ")
+    monkeypatch.setenv("COMP_WORDS", line)
+    monkeypatch.setenv("COMP_CWORD", str(len(words) - 1))
+    with pytest.raises(SystemExit) as execinfo:
+        cli.run([])
+    assert execinfo.value.code == expected_status
+    assert capsys.readouterr().out == expected_output
+
+
+@pytest.mark.parametrize(
+    "args, incomplete, expected_output",
+    [
+        (["-t"], "ma", ("ma", None, False, False)),
+        (["Hi", "-s", "-r", "--type"], "", ("", "Hi", True, True)),
+        (["-j", "2", "Hi"], "--type=ci", ("ci", "Hi", False, False)),
+        ([], "ci", None),
+        (["Hi"], "ci", None),
+        (["-o", "-t"], "ci", None),
+        (["Hi", "there", "-t"], "ci", None),
+    ],
+)
+def test_parse_completion_args(
+    args: List[str],
+    incomplete: str,
+    expected_output: Optional[Tuple[str, Optional[str], bool, bool]],
+) -> None:
+    """It only parses requests to complete the value of --type."""
+    assert cli.parse_completion_args(args, incomplete) == expected_output
+
+
+@pytest.mark.parametrize(
+    "line, expected_words",
+    [
+        ("dressup 'a b' c", ["dressup", "a b", "c"]),
+        ("dressup 'a b", ["dressup", "a b"]),
+    ],
+)
+def test_split_words(line: str, expected_words: List[str]) -> None:
+    """It splits words, keeping an unterminated quoted word."""
+    assert cli._split_words(line) == expected_words
+
+
+def test_completion_words_past_end(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It completes an empty word after the last one in bash."""
+    monkeypatch.setenv("COMP_WORDS", "dressup -t")
+    monkeypatch.setenv("COMP_CWORD", "2")
+    assert cli._completion_words("bash") == (["-t"], "")
+
+
+@pytest.mark.parametrize(
+    "characters, strict_case, reverse, expected_output",
+    [
+        (None, False, False, [("circle", "Ⓓⓡⓔⓢⓢ Ⓤⓟ!")]),
+        ("Dress Up!", True, True, [("circle", "!ⓟⓊ ⓢⓢⓔⓡⒹ")]),
+        ("hi", False, False, [("circle", "ⓗⓘ")]),
+        (None, False, True, [("circle", "!ⓟⓊ ⓢⓢⓔⓡⒹ")]),
+    ],
+)
+def test_type_completions(
+    characters: Optional[str],
+    strict_case: bool,
+    reverse: bool,
+    expected_output: List[Tuple[str, str]],
+) -> None:
+    """It previews the matching Unicode types."""
+    assert (
+        cli.type_completions("ci", characters, strict_case, reverse) == expected_output
+    )
+
+
+@pytest.mark.parametrize("characters", [None, "Hi"])
+def test_type_completions_reverse_suffix(characters: Optional[str]) -> None:
+    """It reverses the characters before adding combining marks."""
+    sample = converter.PREVIEW_TEXT if characters is None else characters
+    assert cli.type_completions("strike", characters, reverse=True) == [
+        ("strikethrough", converter.convert(sample, "strikethrough", reverse=True))
+    ]
+
+
+def test_run_reads_argv(mocker: MockFixture, capsys: pytest.CaptureFixture) -> None:
+    """It reads the arguments from sys.argv by default."""
+    mocker.patch.object(sys, "argv", ["dressup", "-t", "monospace", "hi"])
+    cli.run()
+    assert capsys.readouterr().out == "ｈｉ\n"
+
+
+@pytest.mark.parametrize(
+    "args, environment",
+    [
+        (["-t", "monospace", "hi"], {}),
+        (["--version"], {}),
+        ([], {cli.COMPLETE_VARIABLE: "complete_zsh", "_TYPER_COMPLETE_ARGS": "x -t c"}),
+    ],
+)
+def test_fast_paths_skip_rich(args: List[str], environment: Dict[str, str]) -> None:
+    """It does not import typer or rich for the fast paths."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-m", "dressup", *args],
+        capture_output=True,
+        check=True,
+        env={**os.environ, **environment},
+        text=True,
+    )
+    imported_modules = {
+        line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()
+    }
+    assert "rich" not in imported_modules
+    assert "typer" not in imported_modules
+
+
+def test_interface_skips_services() -> None:
+    """It does not import the services to convert characters."""
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-m", "dressup", "Hello"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    imported_modules = {
+        line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()
+    }
+    assert "rich" in imported_modules
+    services = {"dressup.server", "dressup.daemon", "dressup.parallel"}
+    assert services.isdisjoint(imported_modules)
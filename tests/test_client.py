@@ -0,0 +1,207 @@
+"""Test cases for the client module."""
+import gzip
+import io
+import os
+import socket
+import tempfile
+import threading
+from typing import Iterator, List, Optional, Tuple
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockFixture
+
+from dressup import client
+
+
+def run_request(
+    args: List[str], path: str, stdin: bytes = b""
+) -> Tuple[Optional[int], bytes, bytes]:
+    """Send a request to a daemon.
+
+    Args:
+        args (List[str]): The command-line arguments.
+        path (str): The path of the daemon's socket.
+        stdin (bytes): The standard input. By default empty.
+
+    Returns:
+        Tuple[Optional[int], bytes, bytes]: The status code, the output
+        and the error messages.
+    """
+    stdout = io.BytesIO()
+    stderr = io.BytesIO()
+    status = client.request(args, path, io.BytesIO(stdin), stdout, stderr)
+    return status, stdout.getvalue(), stderr.getvalue()
+
+
+@pytest.fixture
+def closing_path() -> Iterator[str]:
+    """Fixture for a socket that closes every connection at once."""
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "closing.sock")
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(path)
+    listener.listen()
+
+    def accept() -> None:
+        connection, _ = listener.accept()
+        connection.recv(1024)
+        connection.close()
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    yield path
+    thread.join()
+    listener.close()
+    os.unlink(path)
+    os.rmdir(directory)
+
+
+def test_request_characters(daemon_path: str) -> None:
+    """It writes the characters converted by the daemon."""
+    assert run_request(["-t", "math bold", "-r", "Hello"], daemon_path) == (
+        0,
+        "𝐨𝐥𝐥𝐞𝐇\n".encode(),
+        b"",
+    )
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_request_input(daemon_path: str, compress: bool) -> None:
+    """It streams standard input through the daemon."""
+    stdin = "hello 💦\n".encode() * 10000
+    if compress:
+        stdin = gzip.compress(stdin)
+    status, stdout, stderr = run_request(
+        ["--type", "circle", "--input", "-"], daemon_path, stdin
+    )
+    assert (status, stderr) == (0, b"")
+    assert stdout.decode() == "ⓗⓔⓛⓛⓞ 💦\n" * 10000
+
+
+def test_request_invalid_input(daemon_path: str) -> None:
+    """It exits with code 1 when standard input cannot be decoded."""
+    status, stdout, stderr = run_request(
+        ["-t", "circle", "-i", "-"], daemon_path, b"\xff"
+    )
+    assert (status, stdout) == (1, b"")
+    assert stderr.startswith(b"Could not convert -: 'utf-8' codec")
+
+
+@pytest.mark.parametrize(
+    "args", [["Hello"], ["-t", "invalid", "Hello"], ["-t", "circle", "-i", "a.txt"]]
+)
+def test_request_fallback(daemon_path: str, args: List[str]) -> None:
+    """It leaves arguments the daemon cannot run to the caller."""
+    assert run_request(args, daemon_path) == (None, b"", b"")
+
+
+def test_request_not_running() -> None:
+    """It leaves every request to the caller without a daemon."""
+    assert run_request(["-t", "circle", "Hello"], "/nonexistent/dressup.sock") == (
+        None,
+        b"",
+        b"",
+    )
+
+
+def test_request_stale() -> None:
+    """It leaves every request to the caller when the socket is stale."""
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "dressup.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(path)
+    assert run_request(["-t", "circle", "Hello"], path) == (None, b"", b"")
+    os.unlink(path)
+    os.rmdir(directory)
+
+
+def test_request_other_user(daemon_path: str, mocker: MockFixture) -> None:
+    """It does not connect to a socket owned by another user."""
+    mocker.patch("os.getuid", return_value=os.getuid() + 1)
+    assert run_request(["-t", "circle", "Hello"], daemon_path) == (None, b"", b"")
+
+
+def test_request_closed(closing_path: str) -> None:
+    """It exits with code 1 when the daemon closes the connection."""
+    status, _, stderr = run_request(["-t", "circle", "Hello"], closing_path)
+    assert status == 1
+    assert stderr == b"The daemon closed the connection.\n"
+
+
+def test_read_frame_truncated() -> None:
+    """It treats a truncated frame as a closed connection."""
+    frame = client.FRAME_HEADER.pack(client.OUTPUT, 10) + b"short"
+    assert client.read_frame(io.BytesIO(frame)) is None
+
+
+def test_read_frame_reset() -> None:
+    """It treats a reset connection as a closed one."""
+    stream = Mock(spec=io.BufferedReader)
+    stream.read.side_effect = ConnectionResetError
+    assert client.read_frame(stream) is None
+
+
+def test_send_input_broken() -> None:
+    """It stops sending when the daemon stops reading."""
+    connection = Mock(spec=socket.socket)
+    connection.sendall.side_effect = BrokenPipeError
+    client._send_input(connection, io.BytesIO(b"hello"))
+    connection.shutdown.assert_not_called()
+
+
+def test_socket_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It reads the path of the socket from the environment."""
+    monkeypatch.setenv(client.SOCKET_VARIABLE, "/run/dressup.sock")
+    assert client.socket_path() == "/run/dressup.sock"
+    monkeypatch.delenv(client.SOCKET_VARIABLE)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    assert client.socket_path() == "/run/user/1000/dressup.sock"
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    monkeypatch.setenv("TMPDIR", "/var/tmp")
+    assert client.socket_path() == f"/var/tmp/dressup-{os.getuid()}/dressup.sock"
+
+
+def test_main(
+    daemon_path: str,
+    monkeypatch: pytest.MonkeyPatch,
+    capfdbinary: pytest.CaptureFixture,
+) -> None:
+    """It writes what the daemon answers."""
+    monkeypatch.setenv(client.SOCKET_VARIABLE, daemon_path)
+    client.main(["-t", "circle", "hi"])
+    assert capfdbinary.readouterr().out == "ⓗⓘ\n".encode()
+
+
+def test_main_fails(
+    daemon_path: str, monkeypatch: pytest.MonkeyPatch, mocker: MockFixture
+) -> None:
+    """It exits with the status code of the daemon."""
+    monkeypatch.setenv(client.SOCKET_VARIABLE, daemon_path)
+    mocker.patch("sys.stdin", io.TextIOWrapper(io.BytesIO(b"\xff")))
+    with pytest.raises(SystemExit) as exit_info:
+        client.main(["-t", "circle", "-i", "-"])
+    assert exit_info.value.code == 1
+
+
+def test_main_fallback(monkeypatch: pytest.MonkeyPatch, mocker: MockFixture) -> None:
+    """It runs the arguments in process without a daemon."""
+    monkeypatch.setenv(client.SOCKET_VARIABLE, "/nonexistent/dressup.sock")
+    monkeypatch.setattr("sys.argv", ["dressup-client", "Hello"])
+    run = mocker.patch("dressup.cli.run")
+    client.main()
+    run.assert_called_once_with(["Hello"])
+
+
+def test_main_unsupported(mocker: MockFixture) -> None:
+    """It runs the arguments in process without Unix sockets."""
+    mocker.patch("dressup.client.socket_path", return_value=None)
+    run = mocker.patch("dressup.cli.run")
+    client.main(["Hello"])
+    run.assert_called_once_with(["Hello"])
+
+
+def test_request_send_fails(daemon_path: str, mocker: MockFixture) -> None:
+    """It leaves the request to the caller if it cannot be sent."""
+    mocker.patch("socket.socket.sendall", side_effect=BrokenPipeError)
+    assert run_request(["-t", "circle", "Hello"], daemon_path) == (None, b"", b"")
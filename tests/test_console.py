@@ -1,4 +1,6 @@
 """Test cases for the console module."""
+import gzip
+from pathlib import Path
 import textwrap
 from typing import List
 from unittest.mock import Mock
@@ -10,7 +12,7 @@ import typer.testing
 from typer.testing import CliRunner
 
 import dressup
-from dressup import console
+from dressup import console, converter
 
 
 @pytest.fixture
@@ -322,3 +324,261 @@ def test_invalid_unicode_type_message(runner: CliRunner, mock_toml_loads: Mock)
         " Valid types are circled, negative-circled.\n"
     )
     assert message == expected_message
+
+
+def test_complete_type_matches_prefix(
+    mock_typer_context_no_argument: Mock, mock_toml_loads: Mock
+) -> None:
+    """It only completes the Unicode types that match the prefix."""
+    completion_list = list(console.complete_type(mock_typer_context_no_argument, "neg"))
+    assert completion_list == [("negative-circled", "🅓🅡🅔🅢🅢 🅤🅟!")]
+    assert mock_toml_loads.call_count == 1
+
+
+def test_complete_type_uses_previews(mock_typer_context_no_argument: Mock) -> None:
+    """It completes the default sample without compiling tables."""
+    converter.registry.clear()
+    completion_list = list(
+        console.complete_type(mock_typer_context_no_argument, "math-bold-")
+    )
+    assert completion_list == [
+        ("math-bold-fraktur", "𝕯𝖗𝖊𝖘𝖘 𝖀𝖕!"),
+        ("math-bold-italic", "𝑫𝒓𝒆𝒔𝒔 𝑼𝒑!"),
+        ("math-bold-script", "𝓓𝓻𝓮𝓼𝓼 𝓤𝓹!"),
+    ]
+    assert not converter.registry.is_compiled("math_bold_fraktur")
+
+
+@pytest.fixture
+def input_file(tmp_path: Path) -> Path:
+    """Fixture for a file of characters to convert."""
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("hello\nhe(lo\n", encoding="utf-8")
+    return input_path
+
+
+@pytest.mark.parametrize(
+    "arguments, expected_output",
+    [
+        ([], "ⓗⓔⓛⓛⓞ\nⓗⓔ(ⓛⓞ\n"),
+        (["--reverse"], "\nⓞⓛ(ⓔⓗ\nⓞⓛⓛⓔⓗ"),
+    ],
+)
+def test_cli_input(
+    runner: CliRunner,
+    mock_toml_loads: Mock,
+    input_file: Path,
+    arguments: List[str],
+    expected_output: str,
+) -> None:
+    """It converts the contents of a file."""
+    result = runner.invoke(
+        console.app, ["--input", str(input_file), "--type", "circled", *arguments]
+    )
+    assert result.exit_code == 0
+    assert result.stdout == expected_output
+
+
+def test_cli_input_gzip(
+    runner: CliRunner, mock_toml_loads: Mock, tmp_path: Path
+) -> None:
+    """It converts the contents of a gzip-compressed file."""
+    input_path = tmp_path / "input.txt.gz"
+    input_path.write_bytes(gzip.compress("hello\n".encode()))
+    result = runner.invoke(
+        console.app, ["--input", str(input_path), "--type", "circled"]
+    )
+    assert result.stdout == "ⓗⓔⓛⓛⓞ\n"
+
+
+def test_cli_input_truncated_gzip(
+    runner: CliRunner, mock_toml_loads: Mock, tmp_path: Path
+) -> None:
+    """It fails when a gzip-compressed file is cut short."""
+    input_path = tmp_path / "input.txt.gz"
+    input_path.write_bytes(gzip.compress(("hello\n" * 100).encode())[:-8])
+    result = runner.invoke(
+        console.app, ["--input", str(input_path), "--type", "circled"]
+    )
+    assert result.exit_code == 1
+    assert "end-of-stream marker" in result.stdout
+
+
+def test_cli_input_stdin(runner: CliRunner, mock_toml_loads: Mock) -> None:
+    """It converts standard input."""
+    result = runner.invoke(
+        console.app, ["--input", "-", "--type", "circled"], input="hello"
+    )
+    assert result.stdout == "ⓗⓔⓛⓛⓞ"
+
+
+def test_cli_output(
+    runner: CliRunner, mock_toml_loads: Mock, input_file: Path, tmp_path: Path
+) -> None:
+    """It writes the conversion to a file."""
+    output_path = tmp_path / "output.txt"
+    result = runner.invoke(
+        console.app,
+        ["-i", str(input_file), "-o", str(output_path), "-t", "circled"],
+    )
+    assert result.stdout == ""
+    assert output_path.read_text(encoding="utf-8") == "ⓗⓔⓛⓛⓞ\nⓗⓔ(ⓛⓞ\n"
+
+
+def test_cli_output_characters(
+    runner: CliRunner, mock_toml_loads: Mock, tmp_path: Path
+) -> None:
+    """It writes the conversion of the argument to a file."""
+    output_path = tmp_path / "output.txt"
+    runner.invoke(console.app, ["hello", "-o", str(output_path), "-t", "circled"])
+    assert output_path.read_text(encoding="utf-8") == "ⓗⓔⓛⓛⓞ"
+
+
+@pytest.mark.parametrize(
+    "arguments, expected_message",
+    [
+        (["--input", "-"], "--input and --output require --type.\n"),
+        (["hello", "--output", "-"], "--input and --output require --type.\n"),
+        (
+            ["hello", "--input", "-", "--type", "circled"],
+            "Provide either characters or --input, not both.\n",
+        ),
+        (
+            ["--input", "-", "--type", "invalid_type"],
+            "'invalid-type' is not a valid Unicode type."
+            " Valid types are circled, negative-circled.\n",
+        ),
+    ],
+)
+def test_cli_input_fails(
+    runner: CliRunner,
+    mock_toml_loads: Mock,
+    arguments: List[str],
+    expected_message: str,
+) -> None:
+    """It exits with code 1 and a message on invalid file options."""
+    result = runner.invoke(console.app, arguments)
+    assert result.exit_code == 1
+    assert result.stdout == expected_message
+
+
+def test_cli_missing_input(
+    runner: CliRunner, mock_toml_loads: Mock, tmp_path: Path
+) -> None:
+    """It exits with code 1 when the input file does not exist."""
+    input_path = tmp_path / "missing.txt"
+    result = runner.invoke(console.app, ["-i", str(input_path), "-t", "circled"])
+    assert result.exit_code == 1
+    assert result.stdout.startswith(f"Could not convert {input_path}")
+
+
+@pytest.mark.parametrize("reverse", [[], ["--reverse"]])
+def test_cli_jobs(runner: CliRunner, tmp_path: Path, reverse: List[str]) -> None:
+    """It converts a file on several processes like a single process."""
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("Hello\nWorld 💦\n" * 100, encoding="utf-8")
+    arguments = ["--input", str(input_path), "--type", "math-bold", *reverse]
+    single_result = runner.invoke(console.app, arguments)
+    parallel_result = runner.invoke(console.app, [*arguments, "--jobs", "2"])
+    assert parallel_result.exit_code == 0
+    assert parallel_result.stdout == single_result.stdout
+
+
+def test_serve(runner: CliRunner, mocker: MockFixture) -> None:
+    """It serves on the given address."""
+    serve = mocker.patch("dressup.server.serve")
+    result = runner.invoke(console.serve_app, ["--port", "0", "--max-body-size", "10"])
+    assert result.exit_code == 0
+    serve.assert_called_once_with("127.0.0.1", 0, max_body_size=10)
+
+
+def test_serve_interrupted(runner: CliRunner, mocker: MockFixture) -> None:
+    """It exits quietly when interrupted."""
+    mocker.patch("dressup.server.serve", side_effect=KeyboardInterrupt)
+    result = runner.invoke(console.serve_app, [])
+    assert result.exit_code == 0
+
+
+def test_serve_fails(runner: CliRunner, mocker: MockFixture) -> None:
+    """It exits with code 1 when it cannot listen."""
+    mocker.patch("dressup.server.serve", side_effect=OSError("Address in use"))
+    result = runner.invoke(console.serve_app, ["--port", "80"])
+    assert result.exit_code == 1
+    assert result.stdout == "Could not serve on 127.0.0.1:80: Address in use\n"
+
+
+def test_daemon(
+    runner: CliRunner, mocker: MockFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It listens on the socket from the environment by default."""
+    monkeypatch.setenv("DRESSUP_SOCKET", "/run/dressup.sock")
+    run = mocker.patch("dressup.daemon.run")
+    result = runner.invoke(console.daemon_app, [])
+    assert result.exit_code == 0
+    run.assert_called_once_with("/run/dressup.sock")
+
+
+def test_daemon_interrupted(runner: CliRunner, mocker: MockFixture) -> None:
+    """It exits quietly when interrupted."""
+    mocker.patch("dressup.daemon.run", side_effect=KeyboardInterrupt)
+    result = runner.invoke(console.daemon_app, ["--socket", "/run/dressup.sock"])
+    assert result.exit_code == 0
+
+
+def test_daemon_fails(runner: CliRunner, mocker: MockFixture) -> None:
+    """It exits with code 1 when it cannot listen."""
+    mocker.patch("dressup.daemon.run", side_effect=OSError("Address in use"))
+    result = runner.invoke(console.daemon_app, ["--socket", "/run/dressup.sock"])
+    assert result.exit_code == 1
+    assert result.stdout == "Could not listen on /run/dressup.sock: Address in use\n"
+
+
+def test_daemon_unsupported(runner: CliRunner, mocker: MockFixture) -> None:
+    """It exits with code 1 without Unix sockets."""
+    mocker.patch("dressup.client.socket_path", return_value=None)
+    result = runner.invoke(console.daemon_app, [])
+    assert result.exit_code == 1
+
+
+def test_build_tables(runner: CliRunner, tmp_path: Path) -> None:
+    """It prints the time taken by each style."""
+    source_path = tmp_path / "styles.txt"
+    source_path.write_text("ab\nmath_bold 𝐚𝐛\n", encoding="utf-8")
+    args = [
+        str(source_path),
+        "--toml",
+        str(tmp_path / "translator.toml"),
+        "--artifact",
+        str(tmp_path / "translator_tables.py"),
+    ]
+    result = runner.invoke(console.build_tables_app, args)
+    assert result.exit_code == 0
+    assert result.stdout.startswith("math-bold")
+    assert "Compiled 1 of 1 styles in" in result.stdout
+    result = runner.invoke(console.build_tables_app, args)
+    assert result.stdout.startswith(f"{'math-bold':<24} unchanged\n")
+    assert "Compiled 0 of 1 styles in" in result.stdout
+
+
+def test_build_tables_requires_paths(runner: CliRunner, mocker: MockFixture) -> None:
+    """It does not write the package's tables by default."""
+    build_tables = mocker.patch("dressup.build.build_tables")
+    result = runner.invoke(console.build_tables_app, ["styles.txt"])
+    assert result.exit_code == 2
+    build_tables.assert_not_called()
+
+
+def test_build_tables_invalid(runner: CliRunner, tmp_path: Path) -> None:
+    """It exits with code 1 on an invalid source."""
+    source_path = tmp_path / "styles.txt"
+    source_path.write_text("ab\nmath_bold 𝐚\n", encoding="utf-8")
+    args = [
+        str(source_path),
+        "--toml",
+        str(tmp_path / "translator.toml"),
+        "--artifact",
+        str(tmp_path / "translator_tables.py"),
+    ]
+    result = runner.invoke(console.build_tables_app, args)
+    assert result.exit_code == 1
+    assert "expected 2 characters, found 1." in result.stdout
@@ -1,8 +1,14 @@
 """Test cases for the convert module."""
+import codecs
+import concurrent.futures
 import pathlib
+from pathlib import Path
+import sys
+from typing import Dict, List, Optional
 from unittest.mock import Mock
 
 import pytest
+from pytest_mock import MockFixture
 import toml
 
 from dressup import converter, exceptions
@@ -302,3 +308,700 @@ def test_invalid_unicode_type_info(mock_toml_loads: Mock) -> None:
         " Valid types are circled, negative_circled."
     )
     assert exception_message == expected_exception_message
+
+
+def test_registry_reads_once(mock_toml_loads: Mock) -> None:
+    """It parses each section of the config file once."""
+    converter.convert("hello", unicode_type="circled")
+    converter.convert("hello", unicode_type="circled", strict_case=True)
+    assert mock_toml_loads.call_count == 1
+    converter.show_all("hello")
+    converter.show_all("hello", strict_case=True)
+    assert mock_toml_loads.call_count == 2
+
+
+def test_registry_clear(mock_toml_loads: Mock) -> None:
+    """It parses the config file again after being cleared."""
+    converter.convert("hello", unicode_type="circled")
+    converter.registry.clear()
+    converter.convert("hello", unicode_type="circled")
+    assert mock_toml_loads.call_count == 2
+
+
+def test_registry_threads(mock_toml_loads: Mock) -> None:
+    """It parses the config file once when accessed concurrently."""
+    registry = converter.TranslatorRegistry()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        translators = list(executor.map(lambda _: registry.get(), range(32)))
+    assert mock_toml_loads.call_count == 2
+    assert all(
+        translator["circled"] is translators[0]["circled"] for translator in translators
+    )
+
+
+class RacingCache(dict):
+    """A cache filled by another thread between lookup and lock."""
+
+    def __getitem__(self, key: object) -> str:
+        """Miss once, after another thread stores a value."""
+        if not self:
+            self[key] = "compiled elsewhere"
+            raise KeyError(key)
+        return super().__getitem__(key)
+
+
+def test_registry_race(mock_toml_loads: Mock) -> None:
+    """It keeps a value compiled by another thread while waiting."""
+    registry = converter.TranslatorRegistry()
+    registry._cache["table", False] = RacingCache()
+    assert registry.table("circled") == "compiled elsewhere"
+    assert mock_toml_loads.call_count == 0
+
+
+def test_compile_table() -> None:
+    """It keys the table by code point."""
+    assert converter.compile_table({"a": "ⓐ", "B": "Ⓑ"}) == {97: "ⓐ", 66: "Ⓑ"}
+
+
+def test_compile_array_table() -> None:
+    """It indexes Latin-1 code points and leaves the rest unchanged."""
+    table = converter.compile_array_table({"a": "ⓐ", "é": "ⓔ"})
+    assert isinstance(table, converter.CodepointArray)
+    assert len(table) == converter.ARRAY_SIZE
+    assert table[ord("a")] == "ⓐ"
+    assert table[ord("b")] == "b"
+    assert "aébA💦".translate(table) == "ⓐⓔbA💦"
+
+
+def test_compile_array_table_interns_values() -> None:
+    """It stores an output shared by several tables once."""
+    first_table = converter.compile_array_table({"a": "".join(["ⓐ", "ⓑ"])})
+    second_table = converter.compile_array_table({"b": "".join(["ⓐ", "ⓑ"])})
+    assert first_table[ord("a")] is second_table[ord("b")]
+
+
+def test_compile_array_table_beyond_range() -> None:
+    """It keeps a dictionary for characters past the array."""
+    assert converter.compile_array_table({"a": "ⓐ", "ı": "!"}) == {97: "ⓐ", 305: "!"}
+
+
+def test_registry_strict_tables_are_arrays() -> None:
+    """It compiles strict case tables to arrays, except for suffix rules."""
+    for unicode_type, table in converter.registry.tables(strict_case=True).items():
+        if converter.SUFFIX_KEY in converter.registry.mapping(unicode_type):
+            assert isinstance(table, converter.SuffixTable)
+        else:
+            assert isinstance(table, converter.CodepointArray)
+
+
+@pytest.mark.parametrize(
+    "characters, expected_output",
+    [("aA", "<3<3"), ("bB", "&&"), ("ıſ", "!ſ"), ("💦", "💦")],
+)
+def test_case_fallback_table(characters: str, expected_output: str) -> None:
+    """It falls back to the upper or lower case counterpart."""
+    table = converter.CaseFallbackTable({"A": "<3", "b": "&", "I": "!"})
+    assert characters.translate(table) == expected_output
+
+
+@pytest.fixture(scope="module")
+def case_variants() -> Dict[str, List[str]]:
+    """Fixture for scanning every code point once."""
+    return converter.case_variants()
+
+
+def test_compile_case_fallbacks(case_variants: Dict[str, List[str]]) -> None:
+    """It resolves every character whose other case is mapped."""
+    case_fallbacks = converter.compile_case_fallbacks(
+        {"A": "<3", "b": "&", "I": "!", "k": "#"}, case_variants
+    )
+    assert case_fallbacks == {
+        ord("B"): "&",
+        ord("K"): "#",
+        ord("a"): "<3",
+        ord("i"): "!",
+        ord("ı"): "!",
+        ord("\u212a"): "#",
+    }
+
+
+@pytest.mark.parametrize(
+    "characters, expected_output",
+    [("aA", "<3<3"), ("bB", "&&"), ("ıſ", "!ſ"), ("💦", "💦")],
+)
+def test_case_fallback_table_precomputed(
+    case_variants: Dict[str, List[str]], characters: str, expected_output: str
+) -> None:
+    """It converts like lazy fallback with one lookup per character."""
+    mapping = {"A": "<3", "b": "&", "I": "!"}
+    table = converter.CaseFallbackTable(
+        mapping, converter.compile_case_fallbacks(mapping, case_variants)
+    )
+    mapping.clear()
+    assert characters.translate(table) == expected_output
+
+
+@pytest.mark.parametrize("kind", ["table", "translator"])
+def test_registry_case_fallbacks(kind: str) -> None:
+    """It converts like lazy fallback using the precompiled fallbacks."""
+    characters = "".join(map(chr, range(0x250))) + "ẞKÅ💦"
+    registry = converter.TranslatorRegistry()
+    for unicode_type in registry.names():
+        if converter.SUFFIX_KEY in registry.mapping(unicode_type):
+            continue
+        lazy_table = converter.CaseFallbackTable(registry.mapping(unicode_type))
+        if kind == "table":
+            converted_characters = characters.translate(registry.table(unicode_type))
+        else:
+            translator = registry.translator(unicode_type)
+            assert translator.case_folded
+            converted_characters = "".join(
+                translator[character] for character in characters
+            )
+        assert converted_characters == characters.translate(lazy_table)
+
+
+def test_registry_other_unicode_version(mocker: MockFixture) -> None:
+    """It uses the precompiled fallbacks whatever the Unicode version."""
+    mocker.patch.object(converter.unicodedata, "unidata_version", "0.0.0")
+    registry = converter.TranslatorRegistry()
+    table = registry.table("small_caps")
+    assert isinstance(table, converter.CaseFallbackTable)
+    assert table.case_fallbacks is not None
+    assert registry.translator("small_caps").case_folded
+    assert "Hello".translate(table) == "ʜᴇʟʟᴏ"
+
+
+def test_case_fallback_table_stores_result() -> None:
+    """It stores resolved code points in the table."""
+    table = converter.CaseFallbackTable({"A": "<3"})
+    "a".translate(table)
+    assert dict(table) == {ord("A"): "<3", ord("a"): "<3"}
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        converter.CaseFallbackTable({"A": "<3"}),
+        converter.CaseFallbackTable({"A": "<3"}, {ord("a"): "<3"}),
+        converter.SuffixTable({"suffix": "̶"}),
+        converter.PipelineTable(
+            [
+                converter.compile_table({"a": "b"}),
+                converter.SuffixTable({"suffix": "̶"}),
+            ]
+        ),
+    ],
+)
+def test_tables_stay_bounded(
+    mocker: MockFixture, table: converter.TranslationTable
+) -> None:
+    """It stops storing code points once it is full, whatever the text."""
+    mocker.patch.object(converter, "MAX_TABLE_SIZE", 8)
+    characters = "a é" + "".join(map(chr, range(0x10000, 0x10400)))
+    converted_characters = characters.translate(table)
+    assert converted_characters == "".join(
+        character.translate(table) for character in characters
+    )
+    assert len(table) <= 8
+
+
+def test_case_fallback_table_stores_fallbacks_when_full(
+    mocker: MockFixture,
+) -> None:
+    """It still stores the characters it changes once it is full."""
+    mocker.patch.object(converter, "MAX_TABLE_SIZE", 1)
+    table = converter.CaseFallbackTable({"A": "<3"})
+    assert " a".translate(table) == " <3"
+    assert dict(table) == {ord("A"): "<3", ord("a"): "<3"}
+
+
+def test_utf8_table_stays_bounded(mocker: MockFixture) -> None:
+    """It stops storing bytes once it is full."""
+    mocker.patch.object(converter, "MAX_TABLE_SIZE", 256)
+    table = converter.Utf8Table(converter.compile_table({"a": "ⓐ"}))
+    characters = "".join(map(chr, range(0x10000, 0x10400)))
+    assert codecs.charmap_encode("a" + characters, "strict", table) == (
+        ("ⓐ" + characters).encode(),
+        len(characters) + 1,
+    )
+    assert len(table) == 256
+
+
+@pytest.mark.parametrize("strict_case", [False, True])
+def test_convert_matches_translator(strict_case: bool) -> None:
+    """It converts the same way as the Translator for every type."""
+    characters = "Hello, World! 0123456789 ıſK ß 💦"
+    translators = converter.registry.get(strict_case=strict_case)
+    for unicode_type, translator in translators.items():
+        expected_output = "".join(translator[character] for character in characters)
+        assert (
+            converter.convert(characters, unicode_type, strict_case=strict_case)
+            == expected_output
+        )
+
+
+def test_load_artifact() -> None:
+    """It loads the precompiled tables when they are up to date."""
+    artifact = converter._load_artifact()
+    assert artifact is not None
+    assert artifact.MAPPINGS == toml.loads(Path(converter.TOML_PATH).read_text())
+
+
+def test_load_stale_artifact(mocker: MockFixture) -> None:
+    """It ignores precompiled tables built from a different file."""
+    mocker.patch("dressup.converter.source_checksum", return_value=-1)
+    assert converter._load_artifact() is None
+
+
+def test_load_artifact_without_toml(mocker: MockFixture, tmp_path: Path) -> None:
+    """It trusts the precompiled tables when the TOML file is missing."""
+    mocker.patch("dressup.converter.TOML_PATH", tmp_path / "translator.toml")
+    assert converter._load_artifact() is not None
+
+
+def test_load_missing_artifact(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It returns None when the precompiled tables are missing."""
+    monkeypatch.delattr("dressup.translator_tables", raising=False)
+    monkeypatch.setitem(sys.modules, "dressup.translator_tables", None)
+    assert converter._load_artifact() is None
+
+
+def test_registry_uses_artifact(mocker: MockFixture) -> None:
+    """It does not parse the TOML file when the artifact is current."""
+    mock = mocker.patch("toml.loads")
+    registry = converter.TranslatorRegistry()
+    registry.tables(strict_case=True)
+    registry.tables()
+    mock.assert_not_called()
+
+
+def test_registry_loads_requested_section(mock_toml_loads: Mock) -> None:
+    """It only parses the section of the requested Unicode type."""
+    converter.convert("hello", unicode_type="negative circled")
+    (toml_text,), _ = mock_toml_loads.call_args
+    assert toml_text.startswith("[negative_circled]")
+    assert "[circled]" not in toml_text
+
+
+def test_invalid_unicode_type_without_parsing(mock_toml_loads: Mock) -> None:
+    """It lists the valid Unicode types without parsing any section."""
+    with pytest.raises(exceptions.InvalidUnicodeTypeError):
+        converter.convert("hello", unicode_type="non-existant type")
+    mock_toml_loads.assert_not_called()
+
+
+def test_toml_index() -> None:
+    """It records the offsets of every section."""
+    source = b'[circled]\na = "\xe2\x93\x90"\n\n[ square ]\n"[" = "x"\n'
+    index = converter.TomlIndex(source)
+    assert index.names() == ["circled", "square"]
+    assert index.offsets == {"circled": (0, 21), "square": (21, len(source))}
+    assert index.load("square") == {"[": "x"}
+
+
+def test_toml_index_missing_section() -> None:
+    """It raises a KeyError for a missing section."""
+    with pytest.raises(KeyError):
+        converter.TomlIndex(b"[circled]\n").load("square")
+
+
+@pytest.mark.parametrize(
+    "types, expected_output",
+    [
+        (["negative circled"], {"Negative circled": "🅗🅔🅛🅛🅞"}),
+        (
+            ["Negative-circled", "circled"],
+            {"Negative circled": "🅗🅔🅛🅛🅞", "Circled": "ⓗⓔⓛⓛⓞ"},
+        ),
+        ([], {}),
+    ],
+)
+def test_show_all_types(
+    mock_toml_loads: Mock, types: List[str], expected_output: Dict[str, str]
+) -> None:
+    """It only converts to the requested Unicode types."""
+    assert converter.show_all("hello", types=types) == expected_output
+
+
+def test_show_all_types_parses_requested(mock_toml_loads: Mock) -> None:
+    """It only parses the requested Unicode types."""
+    converter.show_all("hello", types=["circled"])
+    assert mock_toml_loads.call_count == 1
+
+
+def test_show_all_invalid_type(mock_toml_loads: Mock) -> None:
+    """It raises an InvalidUnicodeTypeError for an invalid type."""
+    with pytest.raises(exceptions.InvalidUnicodeTypeError):
+        converter.show_all("hello", types=["circled", "non-existant type"])
+
+
+@pytest.mark.parametrize("strict_case", [False, True])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize(
+    "strings",
+    [
+        ["hello", "he(lo", "hello", "", "💦a"],
+        ["hel\x00lo", "hello"],
+        [""],
+        [],
+    ],
+)
+def test_convert_many(
+    mock_toml_loads: Mock, strings: List[str], strict_case: bool, reverse: bool
+) -> None:
+    """It converts each string the same way as convert."""
+    converted_strings = converter.convert_many(
+        iter(strings), "negative circled", strict_case=strict_case, reverse=reverse
+    )
+    assert converted_strings == [
+        converter.convert(
+            string, "negative circled", strict_case=strict_case, reverse=reverse
+        )
+        for string in strings
+    ]
+
+
+def test_convert_many_invalid_type(mock_toml_loads: Mock) -> None:
+    """It raises an InvalidUnicodeTypeError for an invalid type."""
+    with pytest.raises(exceptions.InvalidUnicodeTypeError):
+        converter.convert_many(["hello"], "non-existant type")
+
+
+def test_convert_many_collapses_duplicates(mocker: MockFixture) -> None:
+    """It converts each distinct string once."""
+    spy = mocker.spy(converter, "_translate_batch")
+    converter.convert_many(["hello", "world", "hello"], "circle")
+    (unique_strings, _), _ = spy.call_args
+    assert unique_strings == ["hello", "world"]
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_show_all_many(mock_toml_loads: Mock, reverse: bool) -> None:
+    """It converts each string to all Unicode types in input order."""
+    strings = ["hello", "he(lo", "hello"]
+    converted_strings = converter.show_all_many(strings, reverse=reverse)
+    expected_strings: Dict[str, List[str]] = {"Circled": [], "Negative circled": []}
+    for string in strings:
+        for name, converted in converter.show_all(string, reverse=reverse).items():
+            expected_strings[name].append(converted)
+    assert converted_strings == expected_strings
+
+
+def test_show_all_many_types(mock_toml_loads: Mock) -> None:
+    """It converts each string to the requested Unicode types."""
+    converted_strings = converter.show_all_many(
+        ["hello", "a"], types=["negative-circled"]
+    )
+    assert converted_strings == {"Negative circled": ["🅗🅔🅛🅛🅞", "🅐"]}
+
+
+@pytest.mark.parametrize(
+    "characters, from_type, expected_output",
+    [
+        ("ⓗⓔⓛⓛⓞ 🅦🅞🅡🅛🅓", None, "hello WORLD"),
+        ("ⓗ🅔ⓛⓛⓞ", "circled", "h🅔llo"),
+        ("ⓗ🅔ⓛⓛⓞ", "Negative circled", "ⓗEⓛⓛⓞ"),
+        ("plain", None, "plain"),
+    ],
+)
+def test_undress(
+    mock_toml_loads: Mock,
+    characters: str,
+    from_type: Optional[str],
+    expected_output: str,
+) -> None:
+    """It converts characters back to the characters they came from."""
+    assert converter.undress(characters, from_type=from_type) == expected_output
+
+
+@pytest.mark.parametrize("unicode_type", ["inverted", "circle", "math bold"])
+def test_undress_round_trip(unicode_type: str) -> None:
+    """It undoes a conversion when given the Unicode type."""
+    characters = "hello world"
+    converted_characters = converter.convert(characters, unicode_type, reverse=True)
+    assert (
+        converter.undress(converted_characters, from_type=unicode_type, reverse=True)
+        == characters
+    )
+
+
+def test_undress_keeps_ascii() -> None:
+    """It leaves plain text that some types convert to unchanged."""
+    assert converter.undress("bdpq un") == "bdpq un"
+
+
+def test_undress_invalid_type(mock_toml_loads: Mock) -> None:
+    """It raises an InvalidUnicodeTypeError for an unknown type."""
+    with pytest.raises(exceptions.InvalidUnicodeTypeError):
+        converter.undress("hello", from_type="non-existant type")
+
+
+def test_undress_compiles_once(mock_toml_loads: Mock) -> None:
+    """It reuses the inverse table."""
+    assert converter.registry.inverse() is converter.registry.inverse()
+
+
+def test_inverse_race(mock_toml_loads: Mock) -> None:
+    """It keeps an inverse table compiled by another thread while waiting."""
+    registry = converter.TranslatorRegistry()
+    registry._inverse = RacingCache()
+    assert registry.inverse("circled") == "compiled elsewhere"
+
+
+def test_compile_inverse_table() -> None:
+    """It leaves ambiguous characters out of the table."""
+    mappings = [{"a": "ⓐ", "b": "x", "c": "c"}, {"d": "ⓐ", "e": "ⓔ"}]
+    assert converter.compile_inverse_table(mappings) == {ord("x"): "b", ord("ⓔ"): "e"}
+    assert converter.compile_inverse_table(mappings, keep_ascii=True) == {ord("ⓔ"): "e"}
+
+
+@pytest.mark.parametrize("strict_case", [False, True])
+def test_registry_preview(strict_case: bool) -> None:
+    """It reads previews that match converting the preview text."""
+    registry = converter.TranslatorRegistry()
+    for unicode_type in registry.names():
+        assert registry.preview(unicode_type, strict_case=strict_case) == (
+            converter.convert(
+                converter.PREVIEW_TEXT, unicode_type, strict_case=strict_case
+            )
+        )
+
+
+def test_registry_preview_from_toml(mock_toml_loads: Mock) -> None:
+    """It converts the preview text when reading translator.toml."""
+    assert converter.registry.preview("circled") == "Ⓓⓡⓔⓢⓢ Ⓤⓟ!"
+
+
+@pytest.mark.parametrize(
+    "prefix, expected_names",
+    [
+        ("", ["circled", "negative_circled"]),
+        ("ci", ["circled"]),
+        ("negative_circled", ["negative_circled"]),
+        ("x", []),
+    ],
+)
+def test_names_with_prefix(
+    mock_toml_loads: Mock, prefix: str, expected_names: List[str]
+) -> None:
+    """It returns the names that start with the prefix."""
+    assert converter.registry.names_with_prefix(prefix) == expected_names
+    assert converter.registry.names_with_prefix(prefix) == expected_names
+
+
+@pytest.mark.parametrize("strict_case", [False, True])
+@pytest.mark.parametrize(
+    "unicode_type, mark",
+    [("strikethrough", "̶"), ("underlined", "̲"), ("slashed", "̸")],
+)
+def test_convert_suffix(unicode_type: str, mark: str, strict_case: bool) -> None:
+    """It appends the suffix to every character but whitespace and marks."""
+    converted_characters = converter.convert(
+        "Hé 1!\ni̇", unicode_type, strict_case=strict_case
+    )
+    assert converted_characters == "H{0}é{0} 1{0}!{0}\ni{0}̇".format(mark)
+
+
+def test_suffix_table() -> None:
+    """It converts mapped characters without the suffix."""
+    table = converter.SuffixTable({"suffix": "̶", "b": "ß"})
+    assert "ab c".translate(table) == "a̶ß c̶"
+    assert table[ord("a")] == "a̶"
+
+
+def test_suffix_translator() -> None:
+    """It appends the suffix to missing keys."""
+    translator = converter.registry.translator("strikethrough")
+    assert [translator[character] for character in "a ̶"] == ["a̶", " ", "̶"]
+
+
+def test_convert_many_suffix() -> None:
+    """It keeps the batch sentinel free of the suffix."""
+    assert converter.convert_many(["ab", "c", ""], "underlined", reverse=True) == [
+        "b̲a̲",
+        "c̲",
+        "",
+    ]
+
+
+@pytest.mark.parametrize("from_type", [None, "strikethrough"])
+def test_undress_suffix(from_type: Optional[str]) -> None:
+    """It removes the suffix."""
+    converted_characters = converter.convert("Hello World", "strikethrough")
+    assert converter.undress(converted_characters, from_type) == "Hello World"
+
+
+def test_compile_inverse_table_suffix() -> None:
+    """It removes single code point suffixes only."""
+    mappings = [{"suffix": "̶", "a": "ⓐ"}, {"suffix": "̲̲"}]
+    assert converter.compile_inverse_table(mappings) == {0x336: "", ord("ⓐ"): "a"}
+
+
+PIPELINE_TEXT = "".join(map(chr, range(0x250))) + "ẞKÅ💦 Hello, World!"
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("strict_case", [False, True])
+@pytest.mark.parametrize(
+    "unicode_types",
+    [
+        ["inverted", "reversed"],
+        ["small caps", "superscript"],
+        ["circle", "math bold"],
+        ["rock dots", "strikethrough", "underlined"],
+    ],
+)
+def test_convert_pipeline(
+    unicode_types: List[str], strict_case: bool, reverse: bool
+) -> None:
+    """It converts like each Unicode type in turn."""
+    expected_output = PIPELINE_TEXT[::-1] if reverse else PIPELINE_TEXT
+    for unicode_type in unicode_types:
+        expected_output = converter.convert(
+            expected_output, unicode_type, strict_case=strict_case
+        )
+    assert (
+        converter.convert(
+            PIPELINE_TEXT, unicode_types, strict_case=strict_case, reverse=reverse
+        )
+        == expected_output
+    )
+    assert converter.convert_many(
+        [PIPELINE_TEXT, "ab"], unicode_types, strict_case=strict_case, reverse=reverse
+    )[0] == (expected_output)
+
+
+def test_compile_pipeline_table() -> None:
+    """It fuses arrays into an array and other tables into a dictionary."""
+    arrays = [
+        converter.compile_array_table({"a": "b"}),
+        converter.compile_array_table({"b": "c", "c": "ı"}),
+    ]
+    fused_array = converter.compile_pipeline_table(arrays)
+    assert isinstance(fused_array, converter.CodepointArray)
+    assert "abcı".translate(fused_array) == "ccıı"
+    fused_table = converter.compile_pipeline_table(
+        [*arrays, converter.compile_table({"ı": "i"})]
+    )
+    assert isinstance(fused_table, converter.PipelineTable)
+    assert dict(fused_table) == {
+        **{codepoint: chr(codepoint) for codepoint in range(converter.ARRAY_SIZE)},
+        ord("a"): "c",
+        ord("b"): "c",
+        ord("c"): "i",
+        ord("ı"): "i",
+    }
+    assert "abcıẞ".translate(fused_table) == "cciiẞ"
+    assert fused_table[ord("ẞ")] == "ẞ"
+
+
+def test_registry_pipeline_table() -> None:
+    """It compiles each pipeline once."""
+    registry = converter.TranslatorRegistry()
+    table = registry.pipeline_table(("circle", "strikethrough"))
+    assert registry.pipeline_table(("circle", "strikethrough")) is table
+    assert registry.pipeline_table(("circle", "strikethrough"), True) is not table
+    registry.clear()
+    assert registry.pipeline_table(("circle", "strikethrough")) is not table
+
+
+def test_registry_pipeline_race(mock_toml_loads: Mock) -> None:
+    """It keeps a pipeline compiled by another thread while waiting."""
+    registry = converter.TranslatorRegistry()
+    registry._pipelines = RacingCache()  # type: ignore[assignment]
+    assert registry.pipeline_table(("circled",)) == "compiled elsewhere"
+
+
+@pytest.mark.parametrize(
+    "unicode_types, expected_message",
+    [
+        (["circle", "unknown"], "'unknown' is not a valid Unicode type."),
+        ([], "A pipeline needs at least one Unicode type."),
+    ],
+)
+def test_convert_invalid_pipeline(
+    unicode_types: List[str], expected_message: str
+) -> None:
+    """It names the invalid Unicode type of a pipeline."""
+    with pytest.raises(exceptions.InvalidUnicodeTypeError, match=expected_message):
+        converter.convert("Hello", unicode_types)
+
+
+def test_convert_single_pipeline() -> None:
+    """It converts a pipeline of one Unicode type like the type."""
+    assert converter.convert("Hello", ["Math Bold"]) == converter.convert(
+        "Hello", "math bold"
+    )
+
+
+def test_pipeline() -> None:
+    """It converts through its Unicode types."""
+    upside_down = converter.pipeline("Inverted", "strikethrough", reverse=True)
+    assert upside_down.unicode_types == ("inverted", "strikethrough")
+    assert repr(upside_down) == (
+        "Pipeline(['inverted', 'strikethrough'], strict_case=False, reverse=True)"
+    )
+    assert upside_down.convert("Hi!") == "¡̶ı̶ɥ̶"
+    assert upside_down.convert_many(["Hi!", "Hi!"]) == ["¡̶ı̶ɥ̶", "¡̶ı̶ɥ̶"]
+    assert converter.registry.is_compiled("inverted")
+
+
+def test_pipeline_invalid_type() -> None:
+    """It raises an InvalidUnicodeTypeError when created."""
+    with pytest.raises(exceptions.InvalidUnicodeTypeError):
+        converter.pipeline("inverted", "unknown")
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("strict_case", [False, True])
+def test_convert_bytes(strict_case: bool, reverse: bool) -> None:
+    """It converts like encoding the result of convert."""
+    buffer = PIPELINE_TEXT.encode()
+    for unicode_type in [*converter.registry.names(), ["small caps", "inverted"]]:
+        assert converter.convert_bytes(
+            buffer, unicode_type, strict_case=strict_case, reverse=reverse
+        ) == (
+            converter.convert(
+                PIPELINE_TEXT, unicode_type, strict_case=strict_case, reverse=reverse
+            ).encode()
+        )
+
+
+def test_convert_bytes_memoryview() -> None:
+    """It converts a view of a mutable buffer."""
+    buffer = memoryview(bytearray("hé 💦".encode()))
+    assert converter.convert_bytes(buffer, "circle").decode() == "ⓗé 💦"
+
+
+def test_convert_bytes_invalid_utf8() -> None:
+    """It raises a UnicodeDecodeError for invalid UTF-8."""
+    with pytest.raises(UnicodeDecodeError):
+        converter.convert_bytes(b"\xff", "circle")
+
+
+def test_convert_bytes_invalid_type(mock_toml_loads: Mock) -> None:
+    """It raises an InvalidUnicodeTypeError for an unknown type."""
+    with pytest.raises(
+        exceptions.InvalidUnicodeTypeError, match="'unknown' is not a valid"
+    ):
+        converter.convert_bytes(b"hello", ["circled", "unknown"])
+
+
+def test_registry_utf8_table() -> None:
+    """It builds each encoding map once."""
+    registry = converter.TranslatorRegistry()
+    utf8_table = registry.utf8_table("circle")
+    assert utf8_table[ord("a")] == "ⓐ".encode()
+    assert utf8_table[ord("é")] == "é".encode()
+    assert registry.utf8_table("circle") is utf8_table
+    assert isinstance(registry.utf8_table(("circle", "square"), True), dict)
+    registry.clear()
+    assert registry.utf8_table("circle") is not utf8_table
+
+
+def test_registry_utf8_table_race(mock_toml_loads: Mock) -> None:
+    """It keeps an encoding map built by another thread while waiting."""
+    registry = converter.TranslatorRegistry()
+    registry._utf8_tables = RacingCache()  # type: ignore[assignment]
+    assert registry.utf8_table("circled") == "compiled elsewhere"
@@ -0,0 +1,110 @@
+"""Test cases for the daemon module."""
+import errno
+import os
+import shutil
+import socket
+import stat
+import tempfile
+from typing import List, Optional, Tuple, Type
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockFixture
+
+from dressup import client, daemon
+
+
+@pytest.mark.parametrize(
+    "args, expected_args",
+    [
+        (["-t", "circle", "-r", "Hello"], ("Hello", "circle", False, True)),
+        (["-t", "circle", "-s", "-i", "-"], (None, "circle", True, False)),
+        (["--input=-", "--type=circle"], (None, "circle", False, False)),
+        (["-t", "circle", "-i", "input.txt"], None),
+        (["-t", "circle", "-i", "-", "Hello"], None),
+        (["-i", "-"], None),
+        (["Hello"], None),
+    ],
+)
+def test_parse_args(
+    args: List[str], expected_args: Optional[Tuple[Optional[str], str, bool, bool]]
+) -> None:
+    """It parses the arguments the daemon can run."""
+    assert daemon.parse_args(args) == expected_args
+
+
+@pytest.mark.parametrize(
+    "request_line", [b"not json\n", b'{"args": "-t"}\n', b'{"args": [1]}\n', b"[]\n"]
+)
+def test_invalid_request(daemon_path: str, request_line: bytes) -> None:
+    """It asks the client to fall back on invalid requests."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(daemon_path)
+        connection.sendall(request_line)
+        frame = client.read_frame(connection.makefile("rb"))
+    assert frame == (client.FALLBACK, b"")
+
+
+def test_client_disconnects() -> None:
+    """It drops clients that disconnect."""
+    handler = Mock(spec=daemon._Handler)
+    handler._handle.side_effect = ConnectionResetError
+    daemon._Handler.handle(handler)
+
+
+def test_make_server_running(daemon_path: str) -> None:
+    """It refuses to replace a running daemon."""
+    with pytest.raises(OSError) as error_info:
+        daemon.make_server(daemon_path)
+    assert error_info.value.errno == errno.EADDRINUSE
+
+
+def test_make_server_stale() -> None:
+    """It replaces a socket left behind by a stopped daemon."""
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "dressup.sock")
+    daemon.make_server(path).server_close()
+    server = daemon.make_server(path)
+    server.server_close()
+    os.unlink(path)
+    os.rmdir(directory)
+
+
+def test_make_server_private() -> None:
+    """It creates the socket and its directory private to the user."""
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "dressup-1000", "dressup.sock")
+    server = daemon.make_server(path)
+    server.server_close()
+    assert stat.S_IMODE(os.stat(os.path.dirname(path)).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    shutil.rmtree(directory)
+
+
+def test_make_server_other_user(mocker: MockFixture) -> None:
+    """It refuses a directory that belongs to another user."""
+    mocker.patch("os.getuid", return_value=os.getuid() + 1)
+    directory = tempfile.mkdtemp()
+    with pytest.raises(OSError) as error_info:
+        daemon.make_server(os.path.join(directory, "dressup.sock"))
+    assert error_info.value.errno == errno.EPERM
+    os.rmdir(directory)
+
+
+@pytest.mark.parametrize("side_effect", [None, KeyboardInterrupt])
+def test_run(
+    mocker: MockFixture,
+    capsys: pytest.CaptureFixture,
+    side_effect: Optional[Type[BaseException]],
+) -> None:
+    """It removes its socket when it stops."""
+    mocker.patch.object(daemon.DaemonServer, "serve_forever", side_effect=side_effect)
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "dressup.sock")
+    try:
+        daemon.run(path)
+    except KeyboardInterrupt:
+        pass
+    assert capsys.readouterr().out == f"Listening on {path}\n"
+    assert not os.path.exists(path)
+    os.rmdir(directory)
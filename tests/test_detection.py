@@ -0,0 +1,83 @@
+"""Test cases for the detection module."""
+from typing import Dict
+from unittest.mock import Mock
+
+import pytest
+
+from dressup import converter, detection
+
+
+@pytest.mark.parametrize(
+    "characters, expected_output",
+    [
+        ("ⓗⓔⓛⓛⓞ", {"Circled": 1.0}),
+        ("🅗ⓔⓛⓛⓞ!", {"Circled": 4 / 6, "Negative circled": 1 / 6}),
+        ("ⓗ🅔🅛🅛🅞", {"Negative circled": 0.8, "Circled": 0.2}),
+        ("hello", {}),
+        ("", {}),
+    ],
+)
+def test_detect(
+    mock_toml_loads: Mock, characters: str, expected_output: Dict[str, float]
+) -> None:
+    """It returns the share of the characters each type produces."""
+    detected_styles = detection.detect(characters)
+    assert detected_styles == pytest.approx(expected_output)
+    assert list(detected_styles) == list(expected_output)
+
+
+def test_detect_overlapping_types() -> None:
+    """It attributes a character to every type that produces it."""
+    index = converter.compile_style_index([{"a": "ⓐ"}, {"b": "ⓑ", "a": "ⓐ"}])
+    assert index == {ord("ⓐ"): 0b11, ord("ⓑ"): 0b10}
+    assert detection._coverage("ⓐⓑ", ["first", "second"], index) == {
+        "Second": 1.0,
+        "First": 0.5,
+    }
+
+
+def test_detect_ignores_ascii() -> None:
+    """It does not attribute plain text to types that produce ASCII."""
+    assert detection.detect("bdpq un") == {}
+
+
+def test_detect_round_trip() -> None:
+    """It detects every Unicode type from its own conversion."""
+    for name in converter.registry.names():
+        characters = converter.convert("abcdefghijklmnopqrstuvwxyz", name)
+        assert converter._format_names(name) in detection.detect(characters)
+
+
+def test_detect_many(mock_toml_loads: Mock) -> None:
+    """It detects each string, in order."""
+    assert detection.detect_many(["ⓗⓘ", "hi", "ⓗⓘ"]) == [
+        {"Circled": 1.0},
+        {},
+        {"Circled": 1.0},
+    ]
+
+
+def test_style_index_compiles_once(mock_toml_loads: Mock) -> None:
+    """It reuses the index."""
+    registry = converter.registry
+    assert registry.style_index() is registry.style_index()
+
+
+def test_style_index_race(mock_toml_loads: Mock) -> None:
+    """It keeps an index compiled by another thread while waiting."""
+    registry = converter.TranslatorRegistry()
+    index = {ord("ⓐ"): 1}
+
+    class RacingLock:
+        """A lock acquired after another thread compiled the index."""
+
+        def __enter__(self) -> None:
+            """Store the index compiled elsewhere."""
+            registry._style_index = index
+
+        def __exit__(self, *args: object) -> None:
+            """Release the lock."""
+
+    registry._lock = RacingLock()  # type: ignore[assignment]
+    assert registry.style_index() is index
+    assert mock_toml_loads.call_count == 0
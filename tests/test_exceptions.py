@@ -10,3 +10,8 @@ def test_dressupexception_repr() -> None:
 def test_invalidunicodetypeerror_repr() -> None:
     """It returns a string representation."""
     assert repr(exceptions.InvalidUnicodeTypeError()) == "InvalidUnicodeTypeError()"
+
+
+def test_invalidsourceerror_repr() -> None:
+    """It returns a string representation."""
+    assert repr(exceptions.InvalidSourceError()) == "InvalidSourceError()"
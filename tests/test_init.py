@@ -0,0 +1,55 @@
+"""Test cases for the package."""
+from pathlib import Path
+import sys
+from typing import Optional
+
+import pytest
+from pytest_mock import MockFixture
+
+import dressup
+
+
+def test_lazy_exports() -> None:
+    """It imports every exported function on first access."""
+    for name in dressup.__all__:
+        assert callable(getattr(dressup, name))
+    assert set(dressup.__all__) <= set(dir(dressup))
+
+
+def test_missing_attribute() -> None:
+    """It raises an AttributeError for unknown attributes."""
+    with pytest.raises(AttributeError):
+        dressup.non_existant_attribute  # noqa: B018
+
+
+def test_version_from_dist_info(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It reads the version from the name of the dist-info directory."""
+    (tmp_path / "dressup-1.2.3.dist-info").mkdir()
+    monkeypatch.setattr(sys, "path", [str(tmp_path / "missing"), str(tmp_path)])
+    assert dressup._read_version() == "1.2.3"
+
+
+@pytest.mark.parametrize(
+    "installed_version, expected_version", [("1.2.3", "1.2.3"), (None, "unknown")]
+)
+def test_version_from_metadata(
+    mocker: MockFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    installed_version: Optional[str],
+    expected_version: str,
+) -> None:
+    """It falls back to the package metadata."""
+    import importlib.metadata
+
+    monkeypatch.setattr(sys, "path", [str(tmp_path)])
+    if installed_version is None:
+        mocker.patch(
+            "importlib.metadata.version",
+            side_effect=importlib.metadata.PackageNotFoundError,
+        )
+    else:
+        mocker.patch("importlib.metadata.version", return_value=installed_version)
+    assert dressup._read_version() == expected_version
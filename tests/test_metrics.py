@@ -0,0 +1,212 @@
+"""Test cases for the metrics module."""
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List
+from unittest.mock import Mock
+
+import pytest
+
+from dressup import converter, metrics
+
+
+@pytest.fixture
+def enabled_metrics() -> Iterator[None]:
+    """Fixture for recording metrics from a clean state."""
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+def _values(name: str) -> Dict[str, object]:
+    """Return the samples of a metric keyed by their first label value."""
+    return {
+        next(iter(sample["labels"].values()), ""): sample.get(  # type: ignore
+            "value", sample.get("count")
+        )
+        for sample in metrics.snapshot().get(name, [])
+    }
+
+
+def test_disabled_records_nothing(mock_toml_loads: Mock) -> None:
+    """It records nothing while disabled."""
+    metrics.reset()
+    converter.convert("Hello!", "circled")
+    converter.Translator({"a": "ⓐ"})["A"]
+    assert metrics.snapshot() == {}
+
+
+def test_convert(mock_toml_loads: Mock, enabled_metrics: None) -> None:
+    """It counts loads, cache lookups, characters and fallbacks."""
+    converter.convert("Hello!", "circled")
+    converter.convert("Hello!", "circled", strict_case=True)
+    converter.convert("Hello!", "circled")
+    assert _values("source_loads_total") == {"toml": 1}
+    assert _values("source_load_seconds") == {"toml": 1}
+    assert _values("cache_misses_total") == {"table": 2}
+    assert _values("cache_hits_total") == {"table": 1}
+    assert _values("table_loads_total") == {"table": 2}
+    assert _values("table_load_seconds") == {"table": 2}
+    assert _values("characters_converted_total") == {"circled": 18}
+    assert _values("case_fallbacks_total") == {"circled": 2}
+    assert _values("unmapped_characters_total") == {"circled": 4}
+    assert _values("conversion_seconds") == {"convert": 3}
+
+
+@pytest.mark.parametrize(
+    "function, expected_characters",
+    [
+        (lambda: converter.show_all("ab"), {"circled": 2, "negative_circled": 2}),
+        (
+            lambda: converter.convert_many(["ab", "ab", "c"], "circled"),
+            {"circled": 5},
+        ),
+        (
+            lambda: converter.show_all_many(["ab", "c"], types=["negative circled"]),
+            {"negative_circled": 3},
+        ),
+    ],
+)
+def test_batch_conversions(
+    mock_toml_loads: Mock,
+    enabled_metrics: None,
+    function: Callable[[], object],
+    expected_characters: Dict[str, int],
+) -> None:
+    """It counts the characters of every string for every type."""
+    function()
+    counters = {
+        sample["labels"]["unicode_type"]: sample["value"]  # type: ignore
+        for sample in metrics.snapshot()["characters_converted_total"]
+    }
+    assert counters == expected_characters
+
+
+def test_suffix_conversion(enabled_metrics: None) -> None:
+    """It counts characters left without the suffix as unmapped."""
+    converter.convert("Hi there", "strikethrough")
+    assert _values("case_fallbacks_total") == {}
+    assert _values("unmapped_characters_total") == {"strikethrough": 1}
+
+
+def test_artifact_source(enabled_metrics: None) -> None:
+    """It labels loads from the precompiled tables."""
+    converter.registry.clear()
+    converter.convert("Hello", "math bold")
+    assert _values("source_loads_total") == {"artifact": 1}
+    converter.registry.clear()
+
+
+@pytest.mark.parametrize(
+    "strict_case, key, expected_metric",
+    [
+        (False, "A", "case_fallbacks_total"),
+        (False, "!", "unmapped_characters_total"),
+        (True, "A", "unmapped_characters_total"),
+    ],
+)
+def test_translator_fallbacks(
+    enabled_metrics: None, strict_case: bool, key: str, expected_metric: str
+) -> None:
+    """It counts the fallbacks of Translator lookups."""
+    translator = converter.Translator(
+        {"a": "ⓐ"}, strict_case=strict_case, unicode_type="circled"
+    )
+    translator[key]
+    converter.Translator({"a": "ⓐ"}, strict_case=strict_case)[key]
+    assert _values(expected_metric) == {"": 1, "circled": 1}
+
+
+def test_registry_translator_label(mock_toml_loads: Mock) -> None:
+    """It labels compiled Translator objects with their type."""
+    assert converter.registry.translator("circled").unicode_type == "circled"
+
+
+def test_registry_mapping(mock_toml_loads: Mock) -> None:
+    """It loads a raw mapping once."""
+    mapping = converter.registry.mapping("negative_circled")
+    assert mapping["A"] == "🅐"
+    assert converter.registry.mapping("negative_circled") is mapping
+    with pytest.raises(KeyError):
+        converter.registry.mapping("unknown")
+
+
+def test_to_prometheus(enabled_metrics: None) -> None:
+    """It renders counters and timers in the text format."""
+    metrics.increment("cache_hits_total", kind="table")
+    metrics.increment("cache_hits_total", 2, kind="preview")
+    metrics.increment("custom_total", unicode_type='a"b\\c\nd')
+    metrics.increment("unlabeled_total")
+    metrics.observe("conversion_seconds", 0.5, function="convert")
+    metrics.observe("conversion_seconds", 0.25, function="convert")
+    expected_lines: List[str] = [
+        "# HELP dressup_cache_hits_total"
+        " Lookups answered by an already compiled object.",
+        "# TYPE dressup_cache_hits_total counter",
+        'dressup_cache_hits_total{kind="preview"} 2',
+        'dressup_cache_hits_total{kind="table"} 1',
+        "# HELP dressup_conversion_seconds Time spent in conversion functions.",
+        "# TYPE dressup_conversion_seconds summary",
+        'dressup_conversion_seconds_count{function="convert"} 2',
+        'dressup_conversion_seconds_sum{function="convert"} 0.75',
+        "# HELP dressup_custom_total custom_total",
+        "# TYPE dressup_custom_total counter",
+        'dressup_custom_total{unicode_type="a\\"b\\\\c\\nd"} 1',
+        "# HELP dressup_unlabeled_total unlabeled_total",
+        "# TYPE dressup_unlabeled_total counter",
+        "dressup_unlabeled_total 1",
+    ]
+    assert metrics.to_prometheus() == "".join(f"{line}\n" for line in expected_lines)
+
+
+def test_snapshot(enabled_metrics: None) -> None:
+    """It returns the samples of every metric."""
+    metrics.increment("cache_misses_total", kind="table")
+    metrics.observe("table_load_seconds", 0.5, kind="table")
+    assert metrics.snapshot() == {
+        "cache_misses_total": [{"labels": {"kind": "table"}, "value": 1}],
+        "table_load_seconds": [{"labels": {"kind": "table"}, "count": 1, "sum": 0.5}],
+    }
+
+
+def test_write_prometheus(enabled_metrics: None, tmp_path: Path) -> None:
+    """It replaces the file with the text format."""
+    metrics_path = tmp_path / "dressup.prom"
+    metrics_path.write_text("stale")
+    metrics.increment("cache_hits_total", kind="table")
+    metrics.write_prometheus(metrics_path)
+    assert metrics_path.read_text() == metrics.to_prometheus()
+    assert list(tmp_path.iterdir()) == [metrics_path]
+
+
+def test_reset(enabled_metrics: None) -> None:
+    """It discards recorded values."""
+    metrics.increment("cache_hits_total", kind="table")
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_pipeline_conversion(mock_toml_loads: Mock, enabled_metrics: None) -> None:
+    """It counts the characters converted by each Unicode type."""
+    converter.convert("ab", ["circled", "negative circled"])
+    assert _values("characters_converted_total") == {
+        "circled": 2,
+        "negative_circled": 2,
+    }
+    assert _values("unmapped_characters_total") == {"negative_circled": 2}
+
+
+def test_pipeline_conversion_stages(
+    mock_toml_loads: Mock, enabled_metrics: None
+) -> None:
+    """It classifies each Unicode type against the output of the one before."""
+    converter.convert("ab", ["negative circled", "circled"])
+    assert _values("unmapped_characters_total") == {"circled": 2}
+    assert _values("case_fallbacks_total") == {"negative_circled": 2}
+
+
+def test_bytes_conversion(mock_toml_loads: Mock, enabled_metrics: None) -> None:
+    """It records conversions of UTF-8 bytes."""
+    converter.convert_bytes(b"ab", "circled")
+    assert _values("characters_converted_total") == {"circled": 2}
+    assert _values("conversion_seconds") == {"convert_bytes": 1}
@@ -0,0 +1,71 @@
+"""Test cases for the parallel module."""
+from typing import List
+
+import pytest
+
+from dressup import converter, exceptions, parallel
+
+CHARACTERS = "Hello World\nhe(lo 💦\n\nlast line without newline"
+
+
+@pytest.mark.parametrize(
+    "chunks, chunk_size, expected_output",
+    [
+        (["ab\ncd", "\nef"], 1, ["ab\n", "cd\n", "ef"]),
+        (["ab\ncd", "\nef"], 6, ["ab\ncd\n", "ef"]),
+        (["abc", "def\n"], 2, ["abcdef\n"]),
+        (["a\nb", "cdef", "g"], 5, ["a\n", "bcdefg"]),
+        (["a", "b\nc\nd", "e", "f\n", "g"], 3, ["ab\nc\n", "def\n", "g"]),
+        (["a"] * 5 + ["\n"], 2, ["aaaaa\n"]),
+        (["ab\n"], 1, ["ab\n"]),
+        ([], 1, []),
+    ],
+)
+def test_split_lines(
+    chunks: List[str], chunk_size: int, expected_output: List[str]
+) -> None:
+    """It regroups chunks on line boundaries."""
+    assert list(parallel.split_lines(chunks, chunk_size)) == expected_output
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+@pytest.mark.parametrize("strict_case", [False, True])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_convert_parallel(strict_case: bool, reverse: bool, jobs: int) -> None:
+    """It converts the same way as a single-process conversion."""
+    chunks = [CHARACTERS[:7], CHARACTERS[7:20], CHARACTERS[20:]]
+    converted_chunks = parallel.convert_parallel(
+        chunks,
+        "Negative circle",
+        strict_case=strict_case,
+        reverse=reverse,
+        jobs=jobs,
+        chunk_size=4,
+    )
+    assert "".join(converted_chunks) == converter.convert(
+        CHARACTERS, "negative circle", strict_case=strict_case, reverse=reverse
+    )
+
+
+def test_convert_parallel_pipeline() -> None:
+    """It converts with several Unicode types on the workers."""
+    unicode_types = ["small caps", "superscript"]
+    converted_chunks = parallel.convert_parallel(
+        [CHARACTERS[:7], CHARACTERS[7:]], unicode_types, jobs=1, chunk_size=4
+    )
+    assert "".join(converted_chunks) == converter.convert(CHARACTERS, unicode_types)
+
+
+def test_convert_parallel_invalid_type() -> None:
+    """It raises an InvalidUnicodeTypeError before starting workers."""
+    with pytest.raises(exceptions.InvalidUnicodeTypeError):
+        parallel.convert_parallel([CHARACTERS], "non-existant type")
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_convert_chunk(reverse: bool) -> None:
+    """It converts a chunk with the table loaded by the initializer."""
+    parallel._init_worker("negative_circle", strict_case=False)
+    assert parallel._convert_chunk("hello", reverse) == converter.convert(
+        "hello", "negative circle", reverse=reverse
+    )
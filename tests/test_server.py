@@ -0,0 +1,362 @@
+"""Test cases for the server module."""
+import asyncio
+import json
+from typing import Dict, List, Tuple
+
+import pytest
+from pytest_mock import MockFixture
+
+from dressup import aio, server
+
+Response = Tuple[int, Dict[str, str], bytes]
+
+
+def make_request(
+    path: str,
+    body: object = None,
+    method: str = "POST",
+    headers: str = "",
+    version: str = "HTTP/1.1",
+) -> bytes:
+    """Format an HTTP request with a JSON body.
+
+    Args:
+        path (str): The path to request.
+        body (object): The value to send as JSON, or raw bytes. No body
+            is sent if None.
+        method (str): The method. By default "POST".
+        headers (str): Extra header lines, each ending with CRLF.
+        version (str): The HTTP version. By default "HTTP/1.1".
+
+    Returns:
+        bytes: The request.
+    """
+    if body is None:
+        encoded_body = b""
+    elif isinstance(body, bytes):
+        encoded_body = body
+    else:
+        encoded_body = json.dumps(body).encode()
+    if body is not None:
+        headers += f"Content-Length: {len(encoded_body)}\r\n"
+    return f"{method} {path} {version}\r\n{headers}\r\n".encode() + encoded_body
+
+
+async def read_response(reader: asyncio.StreamReader) -> Response:
+    """Read one HTTP response.
+
+    Args:
+        reader (asyncio.StreamReader): The connection.
+
+    Returns:
+        Response: The status code, the headers and the body.
+    """
+    status_line, *header_lines = (
+        (await reader.readuntil(b"\r\n\r\n")).decode().split("\r\n")
+    )
+    headers = {}
+    for line in filter(None, header_lines):
+        name, _, value = line.partition(": ")
+        headers[name.lower()] = value
+    body = await reader.readexactly(int(headers["content-length"]))
+    return int(status_line.split(" ")[1]), headers, body
+
+
+def exchange(
+    *requests: bytes, max_body_size: int = 1024
+) -> Tuple[List[Response], bool]:
+    """Send requests over one connection to a fresh server.
+
+    Args:
+        requests (bytes): The requests to send, one after the other.
+        max_body_size (int): The largest accepted body. By default 1024.
+
+    Returns:
+        Tuple[List[Response], bool]: The responses, and whether the
+        server closed the connection after the last one.
+    """
+
+    async def main() -> Tuple[List[Response], bool]:
+        http_server = await server.start_server(port=0, max_body_size=max_body_size)
+        async with http_server:
+            reader, writer = await asyncio.open_connection(
+                *http_server.sockets[0].getsockname()[:2]
+            )
+            responses = []
+            for request in requests:
+                writer.write(request)
+                responses.append(await read_response(reader))
+            closed = responses[-1][1]["connection"] == "close"
+            if closed:
+                assert await reader.read() == b""
+            writer.close()
+            return responses, closed
+
+    return asyncio.run(main())
+
+
+def request_json(*requests: bytes) -> List[Tuple[int, object]]:
+    """Send requests and decode the JSON responses.
+
+    Args:
+        requests (bytes): The requests to send.
+
+    Returns:
+        List[Tuple[int, object]]: The status code and decoded body of
+        every response.
+    """
+    responses, _ = exchange(*requests)
+    return [(status, json.loads(body)) for status, _, body in responses]
+
+
+@pytest.mark.parametrize(
+    "body, expected_text",
+    [
+        ({"text": "Hello", "type": "math bold"}, "𝐇𝐞𝐥𝐥𝐨"),
+        ({"text": "hi", "type": "Negative-Circle", "reverse": True}, "🅘🅗"),
+        ({"text": "hi", "type": "negative circle", "strict_case": True}, "hi"),
+    ],
+)
+def test_convert(body: Dict[str, object], expected_text: str) -> None:
+    """It converts the characters of a request."""
+    assert request_json(make_request("/convert", body)) == [
+        (200, {"text": expected_text})
+    ]
+
+
+def test_convert_lone_surrogate() -> None:
+    """It escapes lone surrogates, which UTF-8 cannot encode."""
+    body = b'{"text": "a\\ud800", "type": "circle"}'
+    responses, _ = exchange(make_request("/convert", body))
+    [(status, _, response)] = responses
+    assert status == 200
+    assert response == b'{"text":"\xe2\x93\x90\\ud800"}'
+    assert json.loads(response) == {"text": "ⓐ\ud800"}
+
+
+def test_convert_unexpected_error(mocker: MockFixture) -> None:
+    """It answers an unexpected error with a 500 and closes the connection."""
+    mocker.patch("dressup.aio.aconvert", side_effect=RuntimeError)
+    [(status, _, response)], closed = exchange(
+        make_request("/convert", {"text": "a", "type": "circle"})
+    )
+    assert status == 500
+    assert json.loads(response) == {"error": "Internal server error."}
+    assert closed
+
+
+@pytest.mark.parametrize(
+    "body, expected_message",
+    [
+        (b"{", "Invalid JSON"),
+        (["Hello"], "Expected a JSON object."),
+        ({"type": "circle"}, '"text" must be a string.'),
+        ({"text": "Hello"}, '"type" must be a string.'),
+        ({"text": "a", "type": "circle", "reverse": 1}, '"strict_case" and'),
+        ({"text": "a", "type": "invalid_type"}, "'invalid-type' is not a valid"),
+    ],
+)
+def test_convert_invalid(body: object, expected_message: str) -> None:
+    """It answers invalid requests with an error."""
+    [(status, response)] = request_json(make_request("/convert", body))
+    assert status == 400
+    assert response["error"].startswith(expected_message)  # type: ignore[index]
+
+
+def test_show_all() -> None:
+    """It converts the characters of a request to several types."""
+    body = {"text": "Hi", "types": ["square", "circle"], "reverse": True}
+    assert request_json(make_request("/show_all", body)) == [
+        (200, {"Square": "🄸🄷", "Circle": "ⓘⒽ"})
+    ]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"text": "Hi", "types": "square"},
+        {"text": "Hi", "types": [1]},
+        {"text": "Hi", "types": ["invalid"]},
+    ],
+)
+def test_show_all_invalid(body: Dict[str, object]) -> None:
+    """It answers requests with invalid types with an error."""
+    [(status, _)] = request_json(make_request("/show_all", body))
+    assert status == 400
+
+
+@pytest.mark.parametrize("threshold", [aio.OFFLOAD_THRESHOLD, 0])
+def test_batch(mocker: MockFixture, threshold: int) -> None:
+    """It converts every item of a batch, on an executor if it is large."""
+    mocker.patch("dressup.aio.OFFLOAD_THRESHOLD", threshold)
+    body = [
+        {"text": "a", "type": "circle"},
+        {"text": "a", "type": "invalid"},
+        {"text": 1, "type": "circle"},
+    ]
+    [(status, response)] = request_json(make_request("/batch", body))
+    assert status == 200
+    assert response[0] == {"text": "ⓐ"}  # type: ignore[index]
+    assert response[1]["error"].startswith("'invalid'")  # type: ignore[index]
+    assert response[2] == {"error": '"text" must be a string.'}  # type: ignore[index]
+
+
+def test_batch_ndjson() -> None:
+    """It converts one request per line."""
+    body = b'{"text": "a", "type": "circle"}\n\n{"text": "b", "type": "square"}\n'
+    responses, _ = exchange(
+        make_request("/batch", body, headers=f"Content-Type: {server.NDJSON_TYPE}\r\n")
+    )
+    [(status, headers, response)] = responses
+    assert status == 200
+    assert headers["content-type"].startswith(server.NDJSON_TYPE)
+    assert response.decode().splitlines() == ['{"text":"ⓐ"}', '{"text":"🄱"}']
+
+
+def test_batch_ndjson_invalid_line() -> None:
+    """It answers a line that is not valid JSON with an error in its slot."""
+    body = b'{"text": "a", "type": "circle"}\n{"text": \n[]\n'
+    responses, _ = exchange(
+        make_request("/batch", body, headers=f"Content-Type: {server.NDJSON_TYPE}\r\n")
+    )
+    [(status, _, response)] = responses
+    assert status == 200
+    results = [json.loads(line) for line in response.decode().splitlines()]
+    assert results[0] == {"text": "ⓐ"}
+    assert results[1]["error"].startswith("Invalid JSON:")
+    assert results[2] == {"error": "Expected a JSON object."}
+
+
+def test_batch_not_array() -> None:
+    """It answers a batch that is not an array with an error."""
+    [(status, _)] = request_json(make_request("/batch", {"text": "a"}))
+    assert status == 400
+
+
+def test_health_and_metrics() -> None:
+    """It answers health checks and serves metrics."""
+    responses, _ = exchange(
+        make_request("/health?verbose", method="GET"),
+        make_request("/metrics", method="GET"),
+    )
+    (health_status, _, health_body), (metrics_status, metrics_headers, _) = responses
+    assert (health_status, json.loads(health_body)) == (200, {"status": "ok"})
+    assert metrics_status == 200
+    assert metrics_headers["content-type"].startswith("text/plain")
+
+
+@pytest.mark.parametrize(
+    "request_bytes, expected_status",
+    [
+        (make_request("/missing", {}), 404),
+        (make_request("/convert", method="GET"), 405),
+    ],
+)
+def test_routing_errors(request_bytes: bytes, expected_status: int) -> None:
+    """It answers unknown endpoints and methods with an error."""
+    responses, closed = exchange(request_bytes)
+    assert responses[0][0] == expected_status
+    assert not closed
+
+
+@pytest.mark.parametrize(
+    "request_bytes, expected_status",
+    [
+        (b"NONSENSE\r\n\r\n", 400),
+        (make_request("/health", method="GET", version="HTTP/2.0"), 505),
+        (make_request("/health", method="GET", headers="Bad header\r\n"), 400),
+        (make_request("/convert", {}, headers="Transfer-Encoding: chunked\r\n"), 501),
+        (make_request("/convert"), 411),
+        (make_request("/convert", headers="Content-Length: -1\r\n"), 400),
+        (b"POST /convert HTTP/1.1\r\nContent-Length: \xb2\r\n\r\n", 400),
+        (make_request("/convert", b"x" * 1025), 413),
+    ],
+)
+def test_malformed(request_bytes: bytes, expected_status: int) -> None:
+    """It answers malformed requests with an error and closes."""
+    responses, closed = exchange(request_bytes)
+    assert responses[0][0] == expected_status
+    assert closed
+
+
+def test_headers_too_large(mocker: MockFixture) -> None:
+    """It rejects requests with headers longer than MAX_HEADER_SIZE."""
+    mocker.patch("dressup.server.MAX_HEADER_SIZE", 64)
+    responses, closed = exchange(
+        make_request("/health", method="GET", headers=f"X-Long: {'x' * 100}\r\n")
+    )
+    assert responses[0][0] == 431
+    assert closed
+
+
+@pytest.mark.parametrize(
+    "version, headers, expected_closed",
+    [
+        ("HTTP/1.1", "", False),
+        ("HTTP/1.1", "Connection: close\r\n", True),
+        ("HTTP/1.0", "", True),
+        ("HTTP/1.0", "Connection: keep-alive\r\n", False),
+    ],
+)
+def test_keep_alive(version: str, headers: str, expected_closed: bool) -> None:
+    """It keeps connections open unless the client asks otherwise."""
+    request = make_request("/health", method="GET", headers=headers, version=version)
+    _, closed = exchange(request)
+    assert closed == expected_closed
+
+
+def test_pipelined_requests() -> None:
+    """It answers several requests on one connection."""
+    body = {"text": "a", "type": "circle"}
+    assert (
+        request_json(*[make_request("/convert", body)] * 3)
+        == [(200, {"text": "ⓐ"})] * 3
+    )
+
+
+@pytest.mark.parametrize(
+    "partial_request", [b"GET /health", make_request("/convert", b"{}")[:-1]]
+)
+def test_client_disconnects(partial_request: bytes) -> None:
+    """It closes connections that end in the middle of a request."""
+
+    async def main() -> bytes:
+        http_server = await server.start_server(port=0)
+        async with http_server:
+            reader, writer = await asyncio.open_connection(
+                *http_server.sockets[0].getsockname()[:2]
+            )
+            writer.write(partial_request)
+            writer.write_eof()
+            response = await reader.read()
+            writer.close()
+            return response
+
+    assert asyncio.run(main()) == b""
+
+
+def test_idle_timeout(mocker: MockFixture) -> None:
+    """It closes connections that stay idle."""
+    mocker.patch("dressup.server.KEEP_ALIVE_TIMEOUT", 0.01)
+
+    async def main() -> bytes:
+        http_server = await server.start_server(port=0)
+        async with http_server:
+            reader, writer = await asyncio.open_connection(
+                *http_server.sockets[0].getsockname()[:2]
+            )
+            response = await reader.read()
+            writer.close()
+            return response
+
+    assert asyncio.run(main()) == b""
+
+
+def test_serve(mocker: MockFixture, capsys: pytest.CaptureFixture) -> None:
+    """It prints its address and serves until stopped."""
+    serve_forever = mocker.patch(
+        "asyncio.Server.serve_forever", new_callable=mocker.AsyncMock
+    )
+    server.serve(port=0)
+    assert capsys.readouterr().out.startswith("Serving on http://127.0.0.1:")
+    serve_forever.assert_awaited_once()
@@ -0,0 +1,196 @@
+"""Test cases for the streaming module."""
+import gzip
+import io
+import zlib
+from pathlib import Path
+from typing import Iterator, List
+from unittest.mock import Mock
+
+import pytest
+
+from dressup import converter, exceptions, streaming
+
+
+def generate_chunks() -> Iterator[str]:
+    """Generate chunks of characters."""
+    yield "he"
+    yield "(lo"
+
+
+@pytest.mark.parametrize(
+    "strict_case, reverse, expected_output",
+    [
+        (False, False, ["ⓗⓔ", "(ⓛⓞ"]),
+        (True, False, ["ⓗⓔ", "(ⓛⓞ"]),
+        (False, True, ["ⓞⓛ(", "ⓔⓗ"]),
+    ],
+)
+def test_convert_stream(
+    mock_toml_loads: Mock, strict_case: bool, reverse: bool, expected_output: List[str]
+) -> None:
+    """It converts each chunk of a generator."""
+    converted_chunks = streaming.convert_stream(
+        generate_chunks(), "circled", strict_case=strict_case, reverse=reverse
+    )
+    assert list(converted_chunks) == expected_output
+
+
+@pytest.mark.parametrize("strict_case", [False, True])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_convert_stream_file(
+    mock_toml_loads: Mock, strict_case: bool, reverse: bool
+) -> None:
+    """It converts a file object the same way as convert."""
+    characters = "Hello 💦 World" * 10
+    converted_chunks = streaming.convert_stream(
+        io.StringIO(characters),
+        "negative circled",
+        strict_case=strict_case,
+        reverse=reverse,
+        chunk_size=7,
+    )
+    assert "".join(converted_chunks) == converter.convert(
+        characters, "negative circled", strict_case=strict_case, reverse=reverse
+    )
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_convert_stream_pipeline(reverse: bool) -> None:
+    """It converts with several Unicode types the same way as convert."""
+    converted_chunks = streaming.convert_stream(
+        ["Quix", "otic"], ["small caps", "superscript"], reverse=reverse
+    )
+    assert "".join(converted_chunks) == converter.convert(
+        "Quixotic", ["small caps", "superscript"], reverse=reverse
+    )
+
+
+def test_convert_stream_invalid_type(mock_toml_loads: Mock) -> None:
+    """It raises an InvalidUnicodeTypeError before reading the source."""
+    source = Mock()
+    with pytest.raises(exceptions.InvalidUnicodeTypeError):
+        streaming.convert_stream(source, "non-existant type")
+    source.read.assert_not_called()
+
+
+def test_convert_stream_is_lazy(mock_toml_loads: Mock) -> None:
+    """It reads the source only as chunks are consumed."""
+    source = io.StringIO("hello" * 4)
+    converted_chunks = streaming.convert_stream(source, "circled", chunk_size=5)
+    assert next(converted_chunks) == "ⓗⓔⓛⓛⓞ"
+    assert source.tell() == 5
+
+
+@pytest.mark.parametrize(
+    "reverse, expected_output",
+    [
+        (
+            False,
+            [
+                {"Circled": "ⓗⓔ", "Negative circled": "🅗🅔"},
+                {"Circled": "(ⓛⓞ", "Negative circled": "(🅛🅞"},
+            ],
+        ),
+        (
+            True,
+            [
+                {"Circled": "ⓞⓛ(", "Negative circled": "🅞🅛("},
+                {"Circled": "ⓔⓗ", "Negative circled": "🅔🅗"},
+            ],
+        ),
+    ],
+)
+def test_show_all_stream(
+    mock_toml_loads: Mock, reverse: bool, expected_output: List[dict]
+) -> None:
+    """It converts each chunk to all Unicode types."""
+    converted_chunks = streaming.show_all_stream(generate_chunks(), reverse=reverse)
+    assert list(converted_chunks) == expected_output
+
+
+def test_show_all_stream_types(mock_toml_loads: Mock) -> None:
+    """It converts each chunk to the requested Unicode types."""
+    converted_chunks = streaming.show_all_stream(
+        io.StringIO("hello"), types=["negative-circled"], chunk_size=3
+    )
+    assert list(converted_chunks) == [
+        {"Negative circled": "🅗🅔🅛"},
+        {"Negative circled": "🅛🅞"},
+    ]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_read_text(tmp_path: Path, compress: bool) -> None:
+    """It decodes a file in chunks, splitting multibyte characters."""
+    characters = "ⓗⓔⓛⓛⓞ 💦 hello" * 100
+    data = characters.encode("utf-8")
+    if compress:
+        data = gzip.compress(data[:500]) + gzip.compress(data[500:])
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes(data)
+    chunks = list(streaming.read_text(str(input_path), chunk_size=7))
+    assert "".join(chunks) == characters
+    assert max(len(chunk.encode("utf-8")) for chunk in chunks) <= 10
+
+
+@pytest.mark.parametrize("end", [12, -8])
+def test_read_text_truncated_gzip(tmp_path: Path, end: int) -> None:
+    """It raises an error when a gzip member is cut short."""
+    data = gzip.compress(b"hello") + gzip.compress("ⓗⓔⓛⓛⓞ".encode())
+    input_path = tmp_path / "input.txt.gz"
+    input_path.write_bytes(data[:end])
+    with pytest.raises(zlib.error, match="end-of-stream marker"):
+        list(streaming.read_text(str(input_path), chunk_size=7))
+
+
+def test_read_text_without_madvise(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It reads a mapped file where madvise is unavailable."""
+    mmap_class = streaming.mmap.mmap
+
+    class PlainMap:
+        """A memory map without madvise."""
+
+        def __init__(self, fileno: int, length: int, access: int) -> None:
+            """Map the file."""
+            self.mapped = mmap_class(fileno, length, access=access)
+
+        def __enter__(self) -> "PlainMap":
+            """Enter the context."""
+            return self
+
+        def __exit__(self, *args: object) -> None:
+            """Close the map."""
+            self.mapped.close()
+
+        def __getitem__(self, key: slice) -> bytes:
+            """Return a slice of the map."""
+            return self.mapped[key]
+
+    monkeypatch.setattr(streaming.mmap, "mmap", PlainMap)
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("hello", encoding="utf-8")
+    assert "".join(streaming.read_text(str(input_path))) == "hello"
+
+
+def test_read_text_empty(tmp_path: Path) -> None:
+    """It reads nothing from an empty file."""
+    input_path = tmp_path / "input.txt"
+    input_path.touch()
+    assert list(streaming.read_text(str(input_path))) == []
+
+
+def test_read_text_stdin(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It reads standard input when the path is "-"."""
+    stdin = io.TextIOWrapper(io.BytesIO(gzip.compress("hello 💦".encode())))
+    monkeypatch.setattr("sys.stdin", stdin)
+    assert "".join(streaming.read_text("-", chunk_size=3)) == "hello 💦"
+
+
+def test_read_text_invalid_utf8(tmp_path: Path) -> None:
+    """It raises a UnicodeDecodeError on a truncated character."""
+    input_path = tmp_path / "input.txt"
+    input_path.write_bytes("💦".encode("utf-8")[:2])
+    with pytest.raises(UnicodeDecodeError):
+        list(streaming.read_text(str(input_path)))